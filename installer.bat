@@ -70,10 +70,12 @@ set _e=(
     openpyxl
     numpy
     pandas
+    pyarrow
     matplotlib
     seaborn
     sqlalchemy
     beautifulsoup4
+    lxml
     nltk
     pycryptodome
     python-dotenv
@@ -40,10 +40,12 @@ install_python_packages() {
         "openpyxl"
         "numpy"
         "pandas"
+        "pyarrow"
         "matplotlib"
         "seaborn"
         "sqlalchemy"
         "beautifulsoup4"
+        "lxml"
         "nltk"
         "pycryptodome"
         "python-dotenv"
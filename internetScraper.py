@@ -1,48 +1,119 @@
 import os
+import re
 import json
 import logging
 import time
 import csv
-from datetime import datetime, timedelta
+import html
+from datetime import datetime, timedelta, timezone
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import (create_engine, event, func, inspect, text, delete, select, or_, Column, Integer, Float, String,
+                        DateTime, Boolean, ForeignKey, Index)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
 from bs4 import BeautifulSoup
-import nltk
-from nltk.sentiment import SentimentIntensityAnalyzer
 from dotenv import load_dotenv
 from PIL import Image
 from Crypto.Random import get_random_bytes
 import argparse
 import itertools
 import string
-from collections import defaultdict
+from collections import defaultdict, Counter, OrderedDict
 import subprocess
 import sqlite3
+import threading
+import queue
+import multiprocessing
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
 import importlib.metadata
+import importlib.util
+from urllib.parse import urljoin, urlparse, quote
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import telebot
-from googletrans import Translator
 from cryptography.fernet import Fernet
-import tensorflow as tf
-from tensorflow.keras import layers, models
-import cv2
-import face_recognition
-import speech_recognition as sr
-from pydub import AudioSegment
-import exifread
 import hashlib
-import scholarly
+import codecs
+import hmac
+import functools
+import tempfile
+import pathlib
+import sys
+import statistics
+
+_LAZY_IMPORT_LOCK = threading.RLock()
+
+
+class LazyModule:
+    """A stand-in for a module that is only imported when one of its attributes is first used.
+
+    Heavy ML and media libraries are wrapped in LazyModule so that scraping runs which never
+    touch OCR, audio, plotting or sentiment analysis do not pay their import time and memory.
+
+    Args:
+        name (str): The dotted name of the module to import.
+        on_import (callable): A function called with the module right after it is imported (default is None).
+    """
+
+    def __init__(self, name, on_import=None):
+        self._name = name
+        self._on_import = on_import
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            with _LAZY_IMPORT_LOCK:
+                if self._module is None:
+                    module = importlib.import_module(self._name)
+                    if self._on_import:
+                        self._on_import(module)
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+# Heavy dependencies, imported on first use
+plt = LazyModule('matplotlib.pyplot', on_import=lambda module: module.style.use('ggplot'))
+sns = LazyModule('seaborn')
+nltk = LazyModule('nltk')
+nltk_sentiment = LazyModule('nltk.sentiment')
+googletrans = LazyModule('googletrans')
+tf = LazyModule('tensorflow')
+cv2 = LazyModule('cv2')
+face_recognition = LazyModule('face_recognition')
+sr = LazyModule('speech_recognition')
+pydub = LazyModule('pydub')
+exifread = LazyModule('exifread')
+scholarly = LazyModule('scholarly')
+openpyxl = LazyModule('openpyxl')
+pa = LazyModule('pyarrow')
+pq = LazyModule('pyarrow.parquet')
+LAZY_MODULES = [plt, sns, nltk, nltk_sentiment, googletrans, tf, cv2, face_recognition, sr, pydub, exifread, scholarly,
+                openpyxl, pa, pq]
+
+
+def load_lazy_modules():
+    """Import every module in LAZY_MODULES now, as the eager top-level imports used to."""
+    for module in LAZY_MODULES:
+        module._load()
+
 
 # Check if .env file exists, if not, create it with a new encryption key
 if not os.path.exists('.env'):
@@ -84,14 +155,40 @@ GOOGLE_SEARCH_URL = 'https://www.google.com/search?q='
 GOOGLE_SCHOLAR_URL = 'https://scholar.google.com/scholar?q='
 OUTPUT_FOLDER = os.getenv('OUTPUT_FOLDER', 'output')
 
+# HTTP fast path configuration
+HTTP_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', '15'))
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '10'))
+HTTP_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# Optional accelerated JSON parsers
+ORJSON_AVAILABLE = importlib.util.find_spec('orjson') is not None
+IJSON_AVAILABLE = importlib.util.find_spec('ijson') is not None
+orjson = LazyModule('orjson')
+ijson = LazyModule('ijson')
+
+# WebDriver pool configuration
+DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '2'))
+DRIVER_MAX_USES = int(os.getenv('DRIVER_MAX_USES', '25'))
+
+# Concurrency configuration
+MAX_WORKERS = int(os.getenv('MAX_WORKERS', '4'))
+PLATFORM_WORKER_LIMITS = {
+    'Telegram': 1
+}
+RESULT_QUEUE_SIZE = int(os.getenv('RESULT_QUEUE_SIZE', '16'))
+SEARCH_MAX_PENDING = int(os.getenv('SEARCH_MAX_PENDING', '256'))
+
 # Security keys and base URL
 SEC_KEY = None
 PUB_KEY = None
 BASE_URL = TELEGRAM_API_URL
 
-# Set random seed and plot style
+# Set random seed (the plot style is applied when matplotlib is first loaded)
 np.random.seed(0)
-plt.style.use('ggplot')
 
 # Required packages
 REQUIRED_PACKAGES = [
@@ -103,6 +200,7 @@ REQUIRED_PACKAGES = [
     'seaborn',
     'sqlalchemy',
     'beautifulsoup4',
+    'lxml',
     'nltk',
     'pycryptodome',
     'python-dotenv',
@@ -117,13 +215,75 @@ REQUIRED_PACKAGES = [
     'SpeechRecognition',
     'pydub',
     'exifread',
-    'scholarly'
+    'scholarly',
+    'pyarrow'
 ]
 
+# OCR configuration
+OCR_MODEL_WEIGHTS = os.getenv('OCR_MODEL_WEIGHTS')
+OCR_BATCH_SIZE = int(os.getenv('OCR_BATCH_SIZE', '32'))
+OCR_CHARACTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+OCR_CHARACTER_ARRAY = np.array(list(OCR_CHARACTERS))
+OCR_MODELS = {}
+OCR_MODELS_LOCK = threading.Lock()
+
+# Translation configuration
+TRANSLATION_BACKEND = os.getenv('TRANSLATION_BACKEND', 'google')
+TRANSLATION_BATCH_SIZE = int(os.getenv('TRANSLATION_BATCH_SIZE', '50'))
+TRANSLATION_CACHE_FILE = os.getenv('TRANSLATION_CACHE_FILE', 'translation_cache.db')
+TRANSLATION_CACHE_MAX_ENTRIES = int(os.getenv('TRANSLATION_CACHE_MAX_ENTRIES', '100000'))
+TRANSLATION_LOCK = threading.Lock()
+translation_backend = None
+translation_cache = None
+
+# Unicode letter ranges used to skip texts that are already in the destination language
+SCRIPT_RANGES = {
+    'latin': [(0x0041, 0x024F), (0x1E00, 0x1EFF)],
+    'greek': [(0x0370, 0x03FF)],
+    'cyrillic': [(0x0400, 0x052F)],
+    'hebrew': [(0x0590, 0x05FF)],
+    'arabic': [(0x0600, 0x06FF), (0x0750, 0x077F), (0xFB50, 0xFDFF), (0xFE70, 0xFEFF)],
+    'han': [(0x3400, 0x4DBF), (0x4E00, 0x9FFF)],
+    'hangul': [(0x1100, 0x11FF), (0xAC00, 0xD7AF)]
+}
+LANGUAGE_SCRIPTS = {
+    'en': 'latin', 'fr': 'latin', 'de': 'latin', 'es': 'latin', 'it': 'latin', 'pt': 'latin', 'tr': 'latin',
+    'el': 'greek',
+    'ru': 'cyrillic', 'uk': 'cyrillic',
+    'he': 'hebrew', 'iw': 'hebrew',
+    'ar': 'arabic', 'fa': 'arabic', 'ur': 'arabic',
+    'zh-cn': 'han', 'zh-tw': 'han',
+    'ko': 'hangul'
+}
+
+# Script validation configuration
+VALIDATION_BATCH_SIZE = int(os.getenv('VALIDATION_BATCH_SIZE', '100'))
+VALIDATION_CACHE_TTL = float(os.getenv('VALIDATION_CACHE_TTL', '86400'))
+VALIDATION_CACHE_FILE = os.getenv('VALIDATION_CACHE_FILE', '.validation_cache.json')
+VALIDATION_WORKERS = int(os.getenv('VALIDATION_WORKERS', '4'))
+VALIDATION_LOCK = threading.Lock()
+validation_client = None
+
+# Authentication cache configuration
+AUTH_CACHE_TTL = float(os.getenv('AUTH_CACHE_TTL', '300'))
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv('AUTH_CACHE_MAX_ENTRIES', '1024'))
+
+# Expiry sweeper configuration
+EXPIRY_SWEEP_INTERVAL = float(os.getenv('EXPIRY_SWEEP_INTERVAL', '3600'))
+
+# Dependency check state
+DEPENDENCY_STATE_FILE = os.getenv('DEPENDENCY_STATE_FILE', '.dependency_state.json')
+
 # Database configuration
 DATABASE_FILE = 'internet_scraper.db'
 TELEGRAM_LINKS_DATABASE = 'telegram_links.db'
 
+# Input file readers
+SQL_READ_CHUNK_SIZE = int(os.getenv('SQL_READ_CHUNK_SIZE', '10000'))
+SQL_DATE_COLUMNS = ('date', 'created_at', 'timestamp')
+FILE_READ_CHUNK_SIZE = int(os.getenv('FILE_READ_CHUNK_SIZE', '50000'))
+JSON_READ_BUFFER_SIZE = int(os.getenv('JSON_READ_BUFFER_SIZE', '1048576'))
+
 # Encryption keys
 ENCRYPTION_KEY = os.getenv('ENCRYPTION_KEY')
 if not ENCRYPTION_KEY:
@@ -131,16 +291,103 @@ if not ENCRYPTION_KEY:
     exit()
 cipher_suite = Fernet(ENCRYPTION_KEY.encode())
 
+# Fields of a scraped record, in output column order
+RECORD_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+RECORD_FIELDS = ['platform', 'username', 'content', 'content_type', 'date', 'url', 'interaction_user', 'sentiment']
+
+# Sentiment analysis configuration
+SENTIMENT_WORKERS = int(os.getenv('SENTIMENT_WORKERS', str(os.cpu_count() or 1)))
+SENTIMENT_BATCH_SIZE = int(os.getenv('SENTIMENT_BATCH_SIZE', '500'))
+SENTIMENT_CACHE_MAX_ENTRIES = int(os.getenv('SENTIMENT_CACHE_MAX_ENTRIES', '100000'))
+
+# HTML report configuration
+HTML_PAGE_SIZE = int(os.getenv('HTML_PAGE_SIZE', '1000'))
+HTML_SEARCH_SNIPPET_LENGTH = 200
+
+# Excel export configuration
+EXCEL_MAX_ROWS = 1048576
+
+# Parquet export configuration
+PARQUET_COMPRESSION = os.getenv('PARQUET_COMPRESSION', 'zstd')
+PARQUET_ROW_GROUP_SIZE = int(os.getenv('PARQUET_ROW_GROUP_SIZE', '50000'))
+PARQUET_PARTITION_KEYS = ('platform', 'day')
+PARQUET_PARTITION_BY = [key.strip() for key in os.getenv('PARQUET_PARTITION_BY', 'platform,day').split(',') if key.strip()]
+PARQUET_MAX_BUFFERED_ROWS = int(os.getenv('PARQUET_MAX_BUFFERED_ROWS', '100000'))
+PARQUET_UNKNOWN_DAY = 'unknown'
+PARQUET_MAX_OPEN_WRITERS = int(os.getenv('PARQUET_MAX_OPEN_WRITERS', '64'))
+
+# SQLite tuning
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+DB_WRITE_QUEUE_SIZE = int(os.getenv('DB_WRITE_QUEUE_SIZE', '64'))
+DB_BATCH_SIZE = int(os.getenv('DB_BATCH_SIZE', '5000'))
+SQLITE_BUSY_TIMEOUT = float(os.getenv('SQLITE_BUSY_TIMEOUT', '30'))
+SQLITE_PRAGMAS = {
+    'busy_timeout': int(SQLITE_BUSY_TIMEOUT * 1000),
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'cache_size': -64000,
+    'mmap_size': 268435456
+}
+
+
+def apply_sqlite_pragmas(sqlite_engine):
+    """Apply SQLITE_PRAGMAS to every connection the engine opens.
+
+    WAL lets readers proceed while a batch is being written, and synchronous=NORMAL
+    is safe in WAL mode while avoiding an fsync per transaction. busy_timeout makes a
+    connection wait for a lock held by another connection instead of failing at once.
+
+    Args:
+        sqlite_engine (sqlalchemy.engine.Engine): The SQLite engine to configure.
+    """
+    @event.listens_for(sqlite_engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {pragma}={value}")
+        cursor.close()
+
+
 # SQLAlchemy setup
 Base = declarative_base()
-engine = create_engine(f'sqlite:///{DATABASE_FILE}')
+engine = create_engine(f'sqlite:///{DATABASE_FILE}', connect_args={'timeout': SQLITE_BUSY_TIMEOUT},
+                       pool_size=DB_POOL_SIZE, max_overflow=DB_POOL_SIZE)
+apply_sqlite_pragmas(engine)
 Session = sessionmaker(bind=engine)
-session = Session()
+
+
+@contextmanager
+def session_scope():
+    """Provide a session for one unit of work.
+
+    Every call gets its own session, so concurrent threads never share one. The session
+    is committed when the block succeeds, rolled back when it raises, and always closed.
+
+    Yields:
+        sqlalchemy.orm.Session: The session of this unit of work.
+    """
+    session = Session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
 
 
 class ScrapedData(Base):
     __tablename__ = 'scraped_data'
+    __table_args__ = (
+        Index('ix_scraped_data_username_platform_date', 'username', 'platform', 'date'),
+        Index('ix_scraped_data_platform_date', 'platform', 'date'),
+        Index('ix_scraped_data_date', 'date'),
+        Index('ux_scraped_data_fingerprint', 'fingerprint', unique=True),
+    )
     id = Column(Integer, primary_key=True)
+    fingerprint = Column(String(64))
     platform = Column(String)
     username = Column(String)
     content = Column(String)
@@ -148,6 +395,7 @@ class ScrapedData(Base):
     date = Column(DateTime)
     url = Column(String)
     interaction_user = Column(String)
+    sentiment = Column(Float)
 
 
 class User(Base):
@@ -156,7 +404,7 @@ class User(Base):
     username = Column(String, unique=True)
     password_hash = Column(String)
     is_admin = Column(Boolean, default=False)
-    expiry_date = Column(DateTime)
+    expiry_date = Column(DateTime, index=True)
 
 
 class AdminKey(Base):
@@ -164,12 +412,37 @@ class AdminKey(Base):
     id = Column(Integer, primary_key=True)
     pub_key = Column(String, unique=True)
     sec_key = Column(String, unique=True)
-    expiry_date = Column(DateTime)
+    expiry_date = Column(DateTime, index=True)
     user_id = Column(Integer, ForeignKey('users.id'))
     user = relationship("User")
 
 
-Base.metadata.create_all(engine)
+def migrate_schema(sqlite_engine):
+    """Create missing tables and bring existing ones up to date.
+
+    create_all only creates whole tables, so columns and indexes added to a model after its
+    table was created are added here with ALTER TABLE and CREATE INDEX.
+
+    Args:
+        sqlite_engine (sqlalchemy.engine.Engine): The engine of the database to migrate.
+    """
+    Base.metadata.create_all(sqlite_engine)
+    inspector = inspect(sqlite_engine)
+    for table in Base.metadata.sorted_tables:
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        with sqlite_engine.begin() as connection:
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=sqlite_engine.dialect)
+                    connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                    logging.info(f"Added column {table.name}.{column.name} to the database.")
+        for index in table.indexes:
+            index.create(sqlite_engine, checkfirst=True)
+
+
+# Spawned worker processes re-import this module; only the parent migrates the schema.
+if multiprocessing.parent_process() is None:
+    migrate_schema(engine)
 
 
 def encrypt_data(data):
@@ -248,56 +521,187 @@ def add_user_with_keys(pub_key, sec_key):
         username, password = generate_username_password()
         expiry_date = datetime.now() + timedelta(days=30)
         password_hash = encrypt_data(password)
-        user = User(
-            username=username,
-            password_hash=password_hash,
-            is_admin=False,
-            expiry_date=expiry_date
-        )
-        session.add(user)
-        session.commit()
-
-        # Save the keys in the admin_keys table
-        admin_key = AdminKey(
-            pub_key=pub_key,
-            sec_key=sec_key,
-            expiry_date=expiry_date,
-            user_id=user.id
-        )
-        session.add(admin_key)
-        session.commit()
+        with session_scope() as session:
+            user = User(
+                username=username,
+                password_hash=password_hash,
+                is_admin=False,
+                expiry_date=expiry_date
+            )
+            session.add(user)
+            session.flush()
+
+            # Save the keys in the admin_keys table
+            admin_key = AdminKey(
+                pub_key=pub_key,
+                sec_key=sec_key,
+                expiry_date=expiry_date,
+                user_id=user.id
+            )
+            session.add(admin_key)
 
+        # A password was (re)set for this username, so any cached credential is stale.
+        auth_cache.invalidate(username)
         logging.info(f"User {username} added successfully with password: {password}")
         return username, password
     except Exception as e:
         logging.error(f"Error adding user: {e}")
-        session.rollback()
         return None, None
 
 
-def delete_expired_users():
-    """Delete users whose expiry date has passed.
+def delete_expired_users(now=None):
+    """Delete expired users and expired admin keys.
+
+    Both tables are cleaned with set-based DELETE statements that use the expiry_date
+    indexes. Admin keys are deleted first, including keys still linked to an expired user,
+    so no orphaned keys are left behind. If anything was deleted, auth_cache is cleared so
+    no removed user or key is still answered from the cache.
+
+    Args:
+        now (datetime): The reference time (default is the current time).
 
-    This function queries the database for users whose expiry date is before the current date
-    and deletes them from the database.
+    Returns:
+        tuple: The number of deleted users and deleted admin keys.
 
     Raises:
         Exception: If deleting users fails.
     """
+    now = now or datetime.now()
     try:
-        expired_users = session.query(User).filter(User.expiry_date < datetime.now()).all()
-        for user in expired_users:
-            session.delete(user)
-        session.commit()
-        logging.info(f"Deleted {len(expired_users)} expired users.")
+        with engine.begin() as connection:
+            expired_user_ids = select(User.id).where(User.expiry_date < now)
+            deleted_keys = connection.execute(
+                delete(AdminKey).where(or_(AdminKey.expiry_date < now, AdminKey.user_id.in_(expired_user_ids)))
+            ).rowcount
+            deleted_users = connection.execute(delete(User).where(User.expiry_date < now)).rowcount
+        if deleted_users or deleted_keys:
+            auth_cache.invalidate()
+        logging.info(f"Deleted {deleted_users} expired users and {deleted_keys} expired admin keys.")
+        return deleted_users, deleted_keys
     except Exception as e:
         logging.error(f"Error deleting expired users: {e}")
-        session.rollback()
+        return 0, 0
+
+
+class ExpirySweeper:
+    """Runs delete_expired_users() periodically on a background daemon thread.
+
+    Args:
+        interval (float): The number of seconds between sweeps (default is EXPIRY_SWEEP_INTERVAL).
+    """
+
+    def __init__(self, interval=EXPIRY_SWEEP_INTERVAL):
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start sweeping; the first sweep runs immediately.
+
+        Returns:
+            ExpirySweeper: The sweeper itself.
+        """
+        if self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='expiry-sweeper', daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            delete_expired_users()
+            if self._stop_event.wait(self.interval):
+                return
+
+    def stop(self):
+        """Stop sweeping and wait for a running sweep to finish."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+
+class AuthCache:
+    """A bounded, thread-safe TTL cache of recently verified credentials.
+
+    Only a keyed digest of each password is kept, never the password itself, and digests
+    are compared in constant time. An entry never outlives the expiry date of its user.
+
+    Args:
+        ttl (float): The number of seconds a verified credential stays cached (default is AUTH_CACHE_TTL).
+        max_entries (int): The maximum number of cached users (default is AUTH_CACHE_MAX_ENTRIES).
+    """
+
+    def __init__(self, ttl=AUTH_CACHE_TTL, max_entries=AUTH_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._key = get_random_bytes(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _digest(self, password):
+        return hmac.new(self._key, password.encode('utf-8'), hashlib.sha256).digest()
+
+    def verify(self, username, password):
+        """Check a credential against the cache.
+
+        Args:
+            username (str): The username to check.
+            password (str): The password to check.
+
+        Returns:
+            bool: True if the credential was verified recently and is still valid, False otherwise.
+        """
+        digest = self._digest(password)
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None:
+                return False
+            if entry[1] <= datetime.now():
+                del self._entries[username]
+                return False
+            self._entries.move_to_end(username)
+            return hmac.compare_digest(entry[0], digest)
+
+    def add(self, username, password, expiry_date):
+        """Cache a verified credential.
+
+        Args:
+            username (str): The verified username.
+            password (str): The verified password.
+            expiry_date (datetime): The expiry date of the user.
+        """
+        expires_at = min(datetime.now() + timedelta(seconds=self.ttl), expiry_date)
+        with self._lock:
+            self._entries[username] = (self._digest(password), expires_at)
+            self._entries.move_to_end(username)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, username=None):
+        """Drop the cached credential of a user, or of every user.
+
+        Args:
+            username (str): The user to drop; None clears the cache (default is None).
+        """
+        with self._lock:
+            if username is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(username, None)
+
+
+auth_cache = AuthCache()
 
 
 def check_user_credentials(username, password):
     """Check if the provided username and password are valid.
 
+    Recently verified credentials are answered from auth_cache. Otherwise the user is looked
+    up by its unique (indexed) username with the expiry check done in SQL, and only the
+    stored password is loaded and decrypted. Expired users are not deleted here; that is
+    left to the expiry cleanup.
+
     Args:
         username (str): The username to check.
         password (str): The password to check.
@@ -309,17 +713,19 @@ def check_user_credentials(username, password):
         Exception: If checking credentials fails.
     """
     try:
-        user = session.query(User).filter(User.username == username).first()
-        if user and decrypt_data(user.password_hash) == password:
-            if user.expiry_date > datetime.now():
-                logging.info(f"User {username} authenticated successfully.")
-                return True
-            else:
-                logging.warning(f"User {username} has expired.")
-                delete_expired_users()
-                return False
+        if auth_cache.verify(username, password):
+            return True
+        with session_scope() as session:
+            user = session.query(User.password_hash, User.expiry_date).filter(
+                User.username == username,
+                User.expiry_date > datetime.now()
+            ).first()
+        if user and hmac.compare_digest(decrypt_data(user.password_hash).encode('utf-8'), password.encode('utf-8')):
+            auth_cache.add(username, password, user.expiry_date)
+            logging.info(f"User {username} authenticated successfully.")
+            return True
         else:
-            logging.warning(f"Invalid credentials for user {username}.")
+            logging.warning(f"Invalid credentials or expired account for user {username}.")
             return False
     except Exception as e:
         logging.error(f"Error checking credentials for user {username}: {e}")
@@ -332,19 +738,142 @@ def install_packages():
     This function checks if each package in REQUIRED_PACKAGES is already installed.
     If not, it installs the package using pip.
 
-    Raises:
-        Exception: If installation of any package fails.
+    Returns:
+        bool: True if every package is installed, False if any installation failed.
     """
+    all_installed = True
     for package in REQUIRED_PACKAGES:
+        # Look the distribution up by name only, e.g. 'googletrans' for 'googletrans==4.0.0-rc1'.
+        name = re.split(r'[=<>!~\[;\s]', package, maxsplit=1)[0]
         try:
-            importlib.metadata.distribution(package)
+            importlib.metadata.distribution(name)
             logging.info(f"{package} is already installed.")
         except importlib.metadata.PackageNotFoundError:
-            logging.info(f"{package} is not installed. Installing...")
-            subprocess.check_call(['pip', 'install', package])
-            logging.info(f"{package} has been installed.")
+            try:
+                logging.info(f"{package} is not installed. Installing...")
+                subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
+                logging.info(f"{package} has been installed.")
+            except Exception as e:
+                logging.error(f"Error installing {package}: {e}")
+                all_installed = False
         except Exception as e:
             logging.error(f"Error installing {package}: {e}")
+            all_installed = False
+    return all_installed
+
+
+def environment_fingerprint():
+    """Compute a fingerprint of the installed Python distributions.
+
+    The fingerprint hashes the interpreter, REQUIRED_PACKAGES and the names of the
+    ``.dist-info``/``.egg-info`` entries on sys.path, which encode each distribution's name
+    and version. Only directory listings are read, so it is much cheaper than querying the
+    metadata of every required package.
+
+    Returns:
+        str: A hex SHA-256 digest that changes whenever a distribution is added, removed or upgraded.
+    """
+    digest = hashlib.sha256()
+    for part in [sys.executable, sys.version] + REQUIRED_PACKAGES:
+        digest.update(part.encode() + b'\n')
+    for path in sys.path:
+        try:
+            with os.scandir(path or '.') as entries:
+                names = sorted(entry.name for entry in entries if entry.name.endswith(('.dist-info', '.egg-info')))
+        except OSError:
+            continue
+        digest.update(path.encode() + b'\n')
+        for name in names:
+            digest.update(name.encode() + b'\n')
+    return digest.hexdigest()
+
+
+def check_dependencies(force=False):
+    """Make sure the required packages are installed, skipping the check when nothing changed.
+
+    The environment fingerprint of the last successful check is stored in DEPENDENCY_STATE_FILE.
+    When the current fingerprint matches it, the full scan (and any pip call) is skipped.
+
+    Args:
+        force (bool): Whether to run the full scan even if the environment is unchanged (default is False).
+
+    Returns:
+        bool: True if the dependencies are known to be installed, False otherwise.
+    """
+    fingerprint = environment_fingerprint()
+    if not force:
+        try:
+            with open(DEPENDENCY_STATE_FILE, 'r', encoding='utf-8') as f:
+                if json.load(f).get('fingerprint') == fingerprint:
+                    logging.info("Installed packages unchanged since the last dependency check. Skipping.")
+                    return True
+        except (OSError, ValueError):
+            pass
+
+    if not install_packages():
+        return False
+
+    try:
+        with open(DEPENDENCY_STATE_FILE, 'w', encoding='utf-8') as f:
+            # Installing packages changes the environment, so fingerprint it again.
+            json.dump({'fingerprint': environment_fingerprint(), 'checked_at': datetime.now().isoformat()}, f)
+    except OSError as e:
+        logging.warning(f"Error saving dependency check state: {e}")
+    return True
+
+
+# Run in a fresh interpreter by benchmark_startup; prints the import time and peak RSS.
+STARTUP_BENCHMARK_SCRIPT = """
+import time
+start = time.perf_counter()
+import internetScraper
+if {eager}:
+    internetScraper.load_lazy_modules()
+elapsed = time.perf_counter() - start
+try:
+    import resource
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+except ImportError:
+    max_rss = 0
+print(elapsed, max_rss)
+"""
+
+
+def benchmark_startup(runs=5):
+    """Benchmark module startup with lazy imports against importing every heavy dependency up front.
+
+    Each run imports the module in a fresh interpreter. The eager variant additionally calls
+    load_lazy_modules(), which reproduces the cost of the old top-level imports.
+
+    Args:
+        runs (int): The number of interpreter launches per variant (default is 5).
+
+    Returns:
+        dict: The median ``seconds`` and ``max_rss_kb`` (0 where unavailable) for the ``lazy`` and ``eager`` variants.
+
+    Raises:
+        subprocess.CalledProcessError: If the module fails to import in the child interpreter.
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [script_dir, env.get('PYTHONPATH')]))
+    results = {}
+    for variant, eager in (('lazy', False), ('eager', True)):
+        timings, peaks = [], []
+        for _ in range(runs):
+            completed = subprocess.run(
+                [sys.executable, '-c', STARTUP_BENCHMARK_SCRIPT.format(eager=eager)],
+                env=env, capture_output=True, text=True, check=True
+            )
+            seconds, max_rss = completed.stdout.strip().splitlines()[-1].split()
+            timings.append(float(seconds))
+            peaks.append(int(max_rss))
+        results[variant] = {'seconds': statistics.median(timings), 'max_rss_kb': statistics.median(peaks)}
+        logging.info(f"Startup ({variant}): {results[variant]['seconds']:.2f}s, "
+                     f"max RSS {results[variant]['max_rss_kb'] / 1024:.0f} MB (median of {runs} runs).")
+    if results['lazy']['seconds']:
+        logging.info(f"Lazy imports start {results['eager']['seconds'] / results['lazy']['seconds']:.1f}x faster.")
+    return results
 
 
 def get_keys_from_telegram():
@@ -395,6 +924,8 @@ def build_custom_ocr_model():
     Returns:
         tf.keras.Model: The compiled OCR model.
     """
+    layers = tf.keras.layers
+    models = tf.keras.models
     input_image = layers.Input(shape=(64, 128, 1), name='input_image')
     x = layers.Conv2D(32, (3, 3), activation='relu', padding='same')(input_image)
     x = layers.MaxPooling2D((2, 2))(x)
@@ -409,31 +940,106 @@ def build_custom_ocr_model():
     return model
 
 
-def extract_text_with_custom_ocr(image_path, model):
-    """Extract text from an image using a custom OCR model.
+def get_ocr_model(weights_path=OCR_MODEL_WEIGHTS):
+    """Return the process-wide OCR model, building it only once.
+
+    Models are kept in a registry keyed by their weights file, so every caller in the
+    process shares the same compiled graph instead of rebuilding it per image.
+
+    Args:
+        weights_path (str): Path to saved weights to load into the model (default is OCR_MODEL_WEIGHTS).
+                            Untrained weights are used if it is not set or does not exist.
+
+    Returns:
+        tf.keras.Model: The compiled OCR model.
+    """
+    model = OCR_MODELS.get(weights_path)
+    if model is None:
+        with OCR_MODELS_LOCK:
+            model = OCR_MODELS.get(weights_path)
+            if model is None:
+                model = build_custom_ocr_model()
+                if weights_path and os.path.exists(weights_path):
+                    model.load_weights(weights_path)
+                    logging.info(f"Loaded OCR model weights from {weights_path}.")
+                elif weights_path:
+                    logging.warning(f"OCR weights file {weights_path} not found. Using untrained weights.")
+                OCR_MODELS[weights_path] = model
+    return model
+
+
+def preprocess_ocr_image(image_path):
+    """Load an image as the grayscale 64x128 input expected by the OCR model.
 
     Args:
         image_path (str): The path to the image file.
-        model (tf.keras.Model): The OCR model to use for text extraction.
 
     Returns:
-        str: The extracted text.
+        np.array: A float32 array of shape (64, 128, 1) with values in [0, 1].
+    """
+    with Image.open(image_path) as img:
+        img = img.convert('L').resize((128, 64))
+        return np.asarray(img, dtype=np.float32)[..., np.newaxis] / 255.0
 
-    Raises:
-        Exception: If text extraction fails due to invalid image or model.
+
+def extract_text_batch_with_custom_ocr(image_paths, model=None, batch_size=OCR_BATCH_SIZE):
+    """Extract text from many images with a single model inference call.
+
+    Args:
+        image_paths (list): The paths to the image files.
+        model (tf.keras.Model): The OCR model to use (default is the shared model from get_ocr_model()).
+        batch_size (int): The number of images the model processes per step (default is OCR_BATCH_SIZE).
+
+    Returns:
+        list: The extracted text for each path, in order, or None for images that could not be read.
     """
+    texts = [None] * len(image_paths)
+    images, positions = [], []
+    for position, image_path in enumerate(image_paths):
+        try:
+            images.append(preprocess_ocr_image(image_path))
+            positions.append(position)
+        except Exception as e:
+            logging.error(f"Error loading image {image_path} for OCR: {e}")
+    if not images:
+        return texts
+
     try:
-        img = Image.open(image_path).convert('L')
-        img = img.resize((128, 64))
-        img = np.array(img) / 255.0
-        img = np.expand_dims(img, axis=-1)
-        img = np.expand_dims(img, axis=0)
-        prediction = model.predict(img)
-        text = decode_prediction(prediction)
-        return text
+        model = model or get_ocr_model()
+        prediction = model.predict(np.stack(images), batch_size=batch_size, verbose=0)
+        for position, decoded in zip(positions, decode_predictions(prediction)):
+            texts[position] = decoded
     except Exception as e:
         logging.error(f"Error extracting text with custom OCR: {e}")
-        return None
+    return texts
+
+
+def extract_text_with_custom_ocr(image_path, model):
+    """Extract text from an image using a custom OCR model.
+
+    Args:
+        image_path (str): The path to the image file.
+        model (tf.keras.Model): The OCR model to use for text extraction.
+
+    Returns:
+        str: The extracted text, or None if extraction fails.
+    """
+    return extract_text_batch_with_custom_ocr([image_path], model)[0]
+
+
+def decode_predictions(prediction):
+    """Decode a batch of predictions from the custom OCR model.
+
+    Args:
+        prediction (np.array): The model output of shape (batch, sequence_length, len(OCR_CHARACTERS)).
+
+    Returns:
+        list: The decoded text for every item in the batch.
+    """
+    indices = np.argmax(prediction, axis=-1)
+    characters = np.ascontiguousarray(OCR_CHARACTER_ARRAY[indices])
+    # View each row of single characters as one fixed-width string instead of joining in Python.
+    return characters.view(f'<U{indices.shape[1]}').ravel().tolist()
 
 
 def decode_prediction(prediction):
@@ -445,11 +1051,275 @@ def decode_prediction(prediction):
     Returns:
         str: The decoded text.
     """
-    characters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-    text = ""
-    for i in range(prediction.shape[1]):
-        text += characters[np.argmax(prediction[0, i])]
-    return text
+    return decode_predictions(prediction[:1])[0]
+
+
+class TranslationBackend(ABC):
+    """Interface for translation services used by translate_texts.
+
+    Subclasses translate a whole batch of texts per call so that a backend can send them
+    in as few round trips as its service allows.
+    """
+
+    @abstractmethod
+    def translate_batch(self, texts, src_lang, dest_lang):
+        """Translate a batch of texts.
+
+        Args:
+            texts (list): The texts to translate.
+            src_lang (str): The source language code ('auto' to detect).
+            dest_lang (str): The destination language code.
+
+        Returns:
+            list: The translated texts, in the same order.
+        """
+
+
+class GoogleTranslateBackend(TranslationBackend):
+    """Translation backend using Google Translate through googletrans.
+
+    A single Translator (and its HTTP connection) is reused for every batch.
+    """
+
+    def __init__(self):
+        self._translator = None
+
+    def translate_batch(self, texts, src_lang, dest_lang):
+        if self._translator is None:
+            self._translator = googletrans.Translator()
+        translations = self._translator.translate(list(texts), src=src_lang, dest=dest_lang)
+        return [translation.text for translation in translations]
+
+
+class IdentityTranslationBackend(TranslationBackend):
+    """Local stand-in backend that returns every text unchanged, for offline runs and tests."""
+
+    def translate_batch(self, texts, src_lang, dest_lang):
+        return list(texts)
+
+
+TRANSLATION_BACKENDS = {
+    'google': GoogleTranslateBackend,
+    'identity': IdentityTranslationBackend
+}
+
+
+class TranslationCache:
+    """Persistent content-hash to translation cache backed by SQLite.
+
+    Entries are keyed by a hash of the source language, destination language and text.
+    When the cache grows past max_entries, the least recently used entries are evicted.
+
+    Args:
+        path (str): The path to the cache database file (default is TRANSLATION_CACHE_FILE).
+        max_entries (int): The maximum number of cached translations (default is TRANSLATION_CACHE_MAX_ENTRIES).
+    """
+
+    def __init__(self, path=TRANSLATION_CACHE_FILE, max_entries=TRANSLATION_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, translation TEXT, last_used REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_translations_last_used ON translations (last_used)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(text, src_lang, dest_lang):
+        """Build the cache key for a text and language pair.
+
+        Args:
+            text (str): The source text.
+            src_lang (str): The source language code.
+            dest_lang (str): The destination language code.
+
+        Returns:
+            str: A hex SHA-256 digest.
+        """
+        return hashlib.sha256(f"{src_lang}\x1f{dest_lang}\x1f{text}".encode()).hexdigest()
+
+    def get_many(self, keys):
+        """Look up several keys at once and mark the hits as recently used.
+
+        Args:
+            keys (list): The cache keys to look up.
+
+        Returns:
+            dict: A dictionary mapping each cached key to its translation.
+        """
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, translation FROM translations WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                self._conn.executemany("UPDATE translations SET last_used = ? WHERE key = ?",
+                                       [(now, key) for key in found])
+                self._conn.commit()
+        return found
+
+    def put_many(self, items):
+        """Store several translations and evict the least recently used entries if needed.
+
+        Args:
+            items (dict): A dictionary mapping cache keys to translations.
+        """
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO translations (key, translation, last_used) VALUES (?, ?, ?)",
+                                   [(key, translation, now) for key, translation in items.items()])
+            excess = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self._conn.execute("DELETE FROM translations WHERE key IN "
+                                   "(SELECT key FROM translations ORDER BY last_used LIMIT ?)", (excess,))
+            self._conn.commit()
+
+    def close(self):
+        """Close the cache database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def get_translation_backend():
+    """Return the shared translation backend selected by TRANSLATION_BACKEND.
+
+    Returns:
+        TranslationBackend: The backend instance.
+    """
+    global translation_backend
+    with TRANSLATION_LOCK:
+        if translation_backend is None:
+            translation_backend = TRANSLATION_BACKENDS.get(TRANSLATION_BACKEND, GoogleTranslateBackend)()
+    return translation_backend
+
+
+def get_translation_cache():
+    """Return the shared persistent translation cache.
+
+    Returns:
+        TranslationCache: The cache instance.
+    """
+    global translation_cache
+    with TRANSLATION_LOCK:
+        if translation_cache is None:
+            translation_cache = TranslationCache()
+    return translation_cache
+
+
+def detect_script(text):
+    """Detect which writing script the letters of a text belong to.
+
+    Args:
+        text (str): The text to inspect.
+
+    Returns:
+        str: The name of the script from SCRIPT_RANGES, 'mixed' if the letters span several
+             scripts or an unknown one, or None if the text has no letters.
+    """
+    scripts = set()
+    for char in text:
+        if not char.isalpha():
+            continue
+        code_point = ord(char)
+        script = next((name for name, ranges in SCRIPT_RANGES.items()
+                       if any(low <= code_point <= high for low, high in ranges)), 'mixed')
+        scripts.add(script)
+        if len(scripts) > 1 or script == 'mixed':
+            return 'mixed'
+    return scripts.pop() if scripts else None
+
+
+def needs_translation(text, dest_lang):
+    """Decide cheaply whether a text has to be sent to the translation backend.
+
+    Texts without letters (numbers, URLs, emoji) never need translating. Texts written entirely
+    in the destination language's script are treated as already translated; for English this
+    means plain ASCII text, since other Latin-script languages cannot be told apart this way.
+
+    Args:
+        text (str): The text to check.
+        dest_lang (str): The destination language code.
+
+    Returns:
+        bool: True if the text should be translated.
+    """
+    script = detect_script(text)
+    if script is None:
+        return False
+    dest_script = LANGUAGE_SCRIPTS.get(dest_lang.lower())
+    if dest_script is None or script != dest_script:
+        return True
+    if dest_script == 'latin':
+        return not (dest_lang.lower() == 'en' and text.isascii())
+    return False
+
+
+def translate_texts(texts, src_lang='auto', dest_lang='en', backend=None, cache=None,
+                    batch_size=TRANSLATION_BATCH_SIZE):
+    """Translate many texts, using the cache and batching calls to the backend.
+
+    Duplicate texts are translated once, texts already in the destination language are
+    returned unchanged, and cached translations skip the backend entirely.
+
+    Args:
+        texts (list): The texts to translate.
+        src_lang (str): The source language code (default is 'auto').
+        dest_lang (str): The destination language code (default is 'en').
+        backend (TranslationBackend): The backend to use (default is get_translation_backend()).
+        cache (TranslationCache): The cache to use (default is get_translation_cache()).
+        batch_size (int): The maximum number of texts per backend call (default is TRANSLATION_BATCH_SIZE).
+
+    Returns:
+        list: The translated texts in the input order. Empty inputs are returned as-is and texts
+              whose batch failed to translate are None.
+    """
+    backend = backend or get_translation_backend()
+    cache = cache or get_translation_cache()
+    results = {}
+    keys = {}
+    for source in texts:
+        if source in results or source in keys:
+            continue
+        if not source or not needs_translation(source, dest_lang):
+            results[source] = source
+        else:
+            keys[source] = TranslationCache.make_key(source, src_lang, dest_lang)
+
+    try:
+        cached = cache.get_many(list(keys.values()))
+    except sqlite3.Error as e:
+        logging.warning(f"Error reading translation cache: {e}")
+        cached = {}
+    pending = []
+    for source, key in keys.items():
+        if key in cached:
+            results[source] = cached[key]
+        else:
+            pending.append(source)
+
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        try:
+            translations = backend.translate_batch(batch, src_lang, dest_lang)
+        except Exception as e:
+            logging.error(f"Error translating text: {e}")
+            continue
+        results.update(zip(batch, translations))
+        try:
+            cache.put_many({keys[source]: translation for source, translation in zip(batch, translations)})
+        except sqlite3.Error as e:
+            logging.warning(f"Error writing translation cache: {e}")
+
+    logging.info(f"Translated {len(texts)} text(s): {len(cached)} cached, {len(pending)} sent to the backend.")
+    return [results.get(source) for source in texts]
 
 
 def translate_text(text, src_lang='auto', dest_lang='en'):
@@ -461,15 +1331,10 @@ def translate_text(text, src_lang='auto', dest_lang='en'):
         dest_lang (str): The destination language code (default is 'en').
 
     Returns:
-        str: The translated text.
-
-    Raises:
-        Exception: If translation fails due to invalid input or API issues.
+        str: The translated text, or None if translation fails.
     """
     try:
-        translator = Translator()
-        translation = translator.translate(text, src=src_lang, dest=dest_lang)
-        return translation.text
+        return translate_texts([text], src_lang=src_lang, dest_lang=dest_lang)[0]
     except Exception as e:
         logging.error(f"Error translating text: {e}")
         return None
@@ -490,134 +1355,574 @@ def process_file(file_path, lang='eng', translate=False, dest_lang='en'):
     Raises:
         Exception: If processing the file fails due to unsupported format or other issues.
     """
-    if file_path.endswith('.sql'):
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.sql':
         return read_sql_file(file_path)
-    elif file_path.endswith('.txt'):
+    elif extension == '.txt':
         return read_text_file(file_path)
-    elif file_path.endswith('.csv'):
+    elif extension == '.csv':
         return read_csv_file(file_path)
-    elif file_path.endswith('.xlsx') or file_path.endswith('.xls'):
+    elif extension in ('.xlsx', '.xls'):
         return read_excel_file(file_path)
-    elif file_path.endswith('.json'):
+    elif extension in ('.json', '.jsonl', '.ndjson'):
         return read_json_file(file_path)
-    elif file_path.endswith('.png') or file_path.endswith('.jpg') or file_path.endswith('.jpeg'):
-        model = build_custom_ocr_model()
-        text = extract_text_with_custom_ocr(file_path, model)
-        if translate:
-            text = translate_text(text, dest_lang=dest_lang)
-        return text
+    elif is_image_file(file_path):
+        return process_image_files([file_path], translate=translate, dest_lang=dest_lang)[file_path]
     else:
         logging.error(f"Unsupported file format: {file_path}")
         return None
 
 
-def read_sql_file(file_path):
-    """Read data from an SQL file.
+def is_image_file(file_path):
+    """Check whether a file is an image handled by OCR.
 
     Args:
-        file_path (str): The path to the SQL file.
+        file_path (str): The path to the file.
 
     Returns:
-        dict: A dictionary containing the data from the SQL file, where keys are table names and values are lists of rows.
-
-    Raises:
-        Exception: If reading the SQL file fails.
+        bool: True for .png, .jpg and .jpeg files.
     """
-    try:
-        conn = sqlite3.connect(file_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = cursor.fetchall()
-        data = {}
-        for table in tables:
-            table_name = table[0]
-            cursor.execute(f"SELECT * FROM {table_name};")
-            rows = cursor.fetchall()
-            data[table_name] = rows
-        conn.close()
-        return data
-    except Exception as e:
-        logging.error(f"Error reading SQL file: {e}")
-        return None
+    return file_path.lower().endswith(('.png', '.jpg', '.jpeg'))
 
 
-def read_text_file(file_path):
-    """Read data from a text file.
+def process_files(file_paths, lang='eng', translate=False, dest_lang='en'):
+    """Process many files, running OCR over all images in one batched inference.
 
     Args:
-        file_path (str): The path to the text file.
+        file_paths (list): The paths to the files to process.
+        lang (str): The language for OCR (default is 'eng').
+        translate (bool): Whether to translate the extracted text (default is False).
+        dest_lang (str): The destination language for translation (default is 'en').
 
     Returns:
-        str: The content of the text file.
-
-    Raises:
-        Exception: If reading the text file fails.
+        dict: A dictionary mapping each file path to its processed data (see process_file).
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            text = f.read()
-        return text
-    except Exception as e:
-        logging.error(f"Error reading text file: {e}")
-        return None
+    image_paths = [file_path for file_path in file_paths if is_image_file(file_path)]
+    results = process_image_files(image_paths, translate=translate, dest_lang=dest_lang) if image_paths else {}
+    for file_path in file_paths:
+        if file_path not in results:
+            results[file_path] = process_file(file_path, lang=lang, translate=translate, dest_lang=dest_lang)
+    return {file_path: results[file_path] for file_path in file_paths}
 
 
-def read_csv_file(file_path):
-    """Read data from a CSV file.
+def export_processed_files(file_paths, lang='eng', translate=False, dest_lang='en', output_folder=OUTPUT_FOLDER):
+    """Process input files with process_files() and save what was extracted from each.
 
-    Args:
-        file_path (str): The path to the CSV file.
+    Every file's data is written as JSON to ``<output_folder>/processed/<file name>.json``;
+    files that could not be processed are logged and skipped.
 
-    Returns:
-        list: A list of dictionaries containing the data from the CSV file, where each dictionary represents a row.
+    Args:
+        file_paths (list): The paths to the files to process.
+        lang (str): The language for OCR (default is 'eng').
+        translate (bool): Whether to translate the extracted text (default is False).
+        dest_lang (str): The destination language for translation (default is 'en').
+        output_folder (str): The folder to write the results under (default is OUTPUT_FOLDER).
+
+    Returns:
+        list: The paths of the written JSON files.
+    """
+    folder = os.path.join(output_folder, 'processed')
+    os.makedirs(folder, exist_ok=True)
+    written = []
+    for file_path, data in process_files(file_paths, lang=lang, translate=translate, dest_lang=dest_lang).items():
+        if data is None:
+            logging.warning(f"Nothing extracted from {file_path}.")
+            continue
+        output_path = os.path.join(folder, f"{os.path.basename(file_path)}.json")
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4, default=str)
+        logging.info(f"Saved data extracted from {file_path} to {output_path}.")
+        written.append(output_path)
+    return written
+
+
+def process_image_files(file_paths, translate=False, dest_lang='en'):
+    """Run OCR over many image files with one batched model inference.
+
+    Args:
+        file_paths (list): The paths to the image files.
+        translate (bool): Whether to translate the extracted text (default is False).
+        dest_lang (str): The destination language for translation (default is 'en').
+
+    Returns:
+        dict: A dictionary mapping each file path to its extracted text (None if OCR failed).
+    """
+    texts = extract_text_batch_with_custom_ocr(file_paths)
+    if translate:
+        texts = translate_texts(texts, dest_lang=dest_lang)
+    return dict(zip(file_paths, texts))
+
+
+def quote_sql_identifier(name):
+    """Quote a table or column name for use in an SQLite statement.
+
+    Args:
+        name (str): The identifier.
+
+    Returns:
+        str: The identifier in double quotes, with embedded quotes doubled.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def iter_sql_file(file_path, tables=None, columns=None, filter_spec=None, text_columns=None, date_column=None,
+                  chunk_size=SQL_READ_CHUNK_SIZE, as_dicts=False):
+    """Stream the rows of an SQLite file table by table in fetchmany chunks.
+
+    The file is opened read-only and at most chunk_size rows are held in memory. With a
+    filter_spec, keyword and date filters are pushed down into a WHERE clause so SQLite
+    skips non-matching rows, and the keyword filter is re-checked in Python for the cases
+    LIKE cannot express exactly (whole words, non-ASCII case folding).
+
+    Args:
+        file_path (str): The path to the SQLite file.
+        tables (list): The tables to read (default is None, every table).
+        columns (list): The columns to select; tables missing any of them are skipped (default is None, all columns).
+        filter_spec (FilterSpec): The keyword and date filters to apply (default is None).
+        text_columns (list): The columns searched for keywords, selected or not (default is None, every selected text column).
+        date_column (str): The column holding the row date (default is None, the first of SQL_DATE_COLUMNS present).
+        chunk_size (int): The number of rows fetched at once (default is SQL_READ_CHUNK_SIZE).
+        as_dicts (bool): Yield rows as dictionaries keyed by column name instead of tuples (default is False).
+
+    Yields:
+        tuple: The table name and a list of at most chunk_size rows.
+
+    Raises:
+        sqlite3.Error: If the file cannot be opened or read.
+    """
+    conn = sqlite3.connect(f"{pathlib.Path(file_path).resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        if tables is None:
+            tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table';")]
+        for table_name in tables:
+            table_info = conn.execute(f"PRAGMA table_info({quote_sql_identifier(table_name)})").fetchall()
+            types = {row[1]: (row[2] or '').upper() for row in table_info}
+            if not types:
+                logging.warning(f"Skipping table {table_name}: no such table in {file_path}")
+                continue
+            selected = list(columns) if columns else list(types)
+            if any(column not in types for column in selected):
+                logging.warning(f"Skipping table {table_name}: missing columns {set(selected) - set(types)}")
+                continue
+
+            params = []
+            searched = []
+            if filter_spec is not None:
+                searched = [column for column in (text_columns or selected) if column in types and (
+                    text_columns or not types[column] or any(t in types[column] for t in ('CHAR', 'CLOB', 'TEXT')))]
+            # Searched columns outside the projection are fetched too and stripped before yielding.
+            fetched = selected + [column for column in searched if column not in selected]
+            query = f"SELECT {', '.join(map(quote_sql_identifier, fetched))} FROM {quote_sql_identifier(table_name)}"
+            if filter_spec is not None:
+                text_expression = " || ' ' || ".join(
+                    f"COALESCE({quote_sql_identifier(column)}, '')" for column in searched) or "''"
+                table_date_column = date_column if date_column in types else next(
+                    (column for column in SQL_DATE_COLUMNS if column in types), None)
+                where, params = filter_spec.sql_where(
+                    text_expression, quote_sql_identifier(table_date_column) if table_date_column else None)
+                if where:
+                    query += f" WHERE {where}"
+            positions = [fetched.index(column) for column in searched]
+
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                if positions:
+                    rows = [row for row in rows if filter_spec.matches_text(
+                        ' '.join('' if row[i] is None else str(row[i]) for i in positions))]
+                if len(fetched) > len(selected):
+                    rows = [row[:len(selected)] for row in rows]
+                if as_dicts:
+                    rows = [dict(zip(selected, row)) for row in rows]
+                if rows:
+                    yield table_name, rows
+    finally:
+        conn.close()
+
+
+def read_sql_file(file_path, **options):
+    """Read data from an SQL file.
+
+    Built on iter_sql_file(), which should be used directly for files larger than memory.
+
+    Args:
+        file_path (str): The path to the SQL file.
+        **options: Projection, filter and chunking options passed to iter_sql_file().
+
+    Returns:
+        dict: A dictionary containing the data from the SQL file, where keys are table names and values are lists of rows.
+
+    Raises:
+        Exception: If reading the SQL file fails.
+    """
+    try:
+        data = {}
+        for table_name, rows in iter_sql_file(file_path, **options):
+            data.setdefault(table_name, []).extend(rows)
+        return data
+    except Exception as e:
+        logging.error(f"Error reading SQL file: {e}")
+        return None
+
+
+def iter_sql_identifiers(file_path, column, tables=None, limit=None, chunk_size=SQL_READ_CHUNK_SIZE):
+    """Stream the distinct identifiers stored in one column of an SQLite file.
+
+    Built on iter_sql_file(), so only the identifier column is read and at most chunk_size
+    rows are held in memory. Tables without the column are skipped. The values can be passed
+    straight to the identifier searches (see IDENTIFIER_SEARCHES).
+
+    Args:
+        file_path (str): The path to the SQLite file.
+        column (str): The column holding the identifiers (e.g. email or passport_number).
+        tables (list): The tables to read (default is None, every table).
+        limit (int): The maximum number of identifiers to yield (default is None, all of them).
+        chunk_size (int): The number of rows fetched at once (default is SQL_READ_CHUNK_SIZE).
+
+    Yields:
+        str: Every distinct, non-empty identifier, in file order.
+
+    Raises:
+        sqlite3.Error: If the file cannot be opened or read.
+    """
+    seen = set()
+    for _, rows in iter_sql_file(file_path, tables=tables, columns=[column], chunk_size=chunk_size):
+        for (value,) in rows:
+            identifier = '' if value is None else str(value).strip()
+            if not identifier or identifier in seen:
+                continue
+            seen.add(identifier)
+            yield identifier
+            if limit is not None and len(seen) >= limit:
+                return
+
+
+def read_text_file(file_path):
+    """Read data from a text file.
+
+    Args:
+        file_path (str): The path to the text file.
+
+    Returns:
+        str: The content of the text file.
+
+    Raises:
+        Exception: If reading the text file fails.
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        return text
+    except Exception as e:
+        logging.error(f"Error reading text file: {e}")
+        return None
+
+
+def iter_csv_file(file_path, columns=None, dtypes=None, chunk_size=FILE_READ_CHUNK_SIZE, as_frames=False):
+    """Stream a CSV file in chunks of at most chunk_size rows.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        columns (list): The columns to read (default is None, all columns).
+        dtypes (dict): Explicit pandas dtypes per column, e.g. {'id': 'string'} (default is None, inferred).
+        chunk_size (int): The number of rows per chunk (default is FILE_READ_CHUNK_SIZE).
+        as_frames (bool): Yield DataFrames instead of lists of dictionaries (default is False).
+
+    Yields:
+        list or DataFrame: The rows of one chunk.
+
+    Raises:
+        Exception: If reading the CSV file fails.
+    """
+    with pd.read_csv(file_path, usecols=columns, dtype=dtypes, chunksize=chunk_size) as reader:
+        for frame in reader:
+            yield frame if as_frames else frame.to_dict(orient='records')
+
+
+def deduplicate_header(names):
+    """Rename repeated column names the way pandas does ('a', 'a.1', 'a.2', ...).
+
+    Args:
+        names (list): The column names as read from the file.
+
+    Returns:
+        list: The names, each one unique.
+    """
+    header, seen = [], set(names)
+    counts = defaultdict(int)
+    for name in names:
+        if counts[name]:
+            renamed = f"{name}.{counts[name]}"
+            while renamed in seen:
+                counts[name] += 1
+                renamed = f"{name}.{counts[name]}"
+            seen.add(renamed)
+            counts[name] += 1
+            header.append(renamed)
+        else:
+            counts[name] += 1
+            header.append(name)
+    return header
+
+
+def iter_excel_file(file_path, sheet_name=None, columns=None, dtypes=None, chunk_size=FILE_READ_CHUNK_SIZE,
+                    as_frames=False):
+    """Stream an Excel sheet in chunks of at most chunk_size rows.
+
+    .xlsx files are read row by row with openpyxl's read-only mode. Legacy .xls files cannot
+    be streamed and are loaded through pandas, then yielded in chunks.
+
+    Args:
+        file_path (str): The path to the Excel file.
+        sheet_name (str): The sheet to read (default is None, the first sheet).
+        columns (list): The columns to read (default is None, all columns).
+        dtypes (dict): Explicit pandas dtypes per column (default is None, inferred).
+        chunk_size (int): The number of rows per chunk (default is FILE_READ_CHUNK_SIZE).
+        as_frames (bool): Yield DataFrames instead of lists of dictionaries (default is False).
+
+    Yields:
+        list or DataFrame: The rows of one chunk.
+
+    Raises:
+        Exception: If reading the Excel file fails.
+    """
+    def emit(rows, header):
+        if as_frames or dtypes:
+            frame = pd.DataFrame.from_records(rows, columns=header)
+            if dtypes:
+                frame = frame.astype(dtypes)
+            return frame if as_frames else frame.to_dict(orient='records')
+        return [dict(zip(header, row)) for row in rows]
+
+    if file_path.lower().endswith('.xls'):
+        logging.info(f"{file_path} is a legacy .xls file and is loaded in full before chunking.")
+        frame = pd.read_excel(file_path, sheet_name=sheet_name or 0, usecols=columns, dtype=dtypes)
+        for start in range(0, len(frame), chunk_size):
+            chunk = frame.iloc[start:start + chunk_size]
+            yield chunk if as_frames else chunk.to_dict(orient='records')
+        return
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = sheet.iter_rows(values_only=True)
+        header = deduplicate_header(
+            [str(name) if name is not None else f"Unnamed: {i}" for i, name in enumerate(next(rows, ()))])
+        if columns:
+            missing = set(columns) - set(header)
+            if missing:
+                raise ValueError(f"Columns not found in {file_path}: {sorted(missing)}")
+            positions = [header.index(column) for column in columns]
+            header = list(columns)
+        else:
+            positions = None
+        chunk = []
+        for row in rows:
+            chunk.append(tuple(row[i] if i < len(row) else None for i in positions) if positions else row)
+            if len(chunk) >= chunk_size:
+                yield emit(chunk, header)
+                chunk = []
+        if chunk:
+            yield emit(chunk, header)
+    finally:
+        workbook.close()
+
+
+def read_csv_file(file_path, **options):
+    """Read data from a CSV file.
+
+    Built on iter_csv_file(), which should be used directly for large files.
+
+    Args:
+        file_path (str): The path to the CSV file.
+        **options: Column, dtype and chunking options passed to iter_csv_file().
+
+    Returns:
+        list: A list of dictionaries containing the data from the CSV file, where each dictionary represents a row.
 
     Raises:
+        ValueError: If as_frames is requested; use iter_csv_file() to get DataFrames.
         Exception: If reading the CSV file fails.
     """
+    if options.get('as_frames'):
+        raise ValueError("read_csv_file() returns records; use iter_csv_file() to get DataFrames.")
     try:
-        df = pd.read_csv(file_path)
-        return df.to_dict(orient='records')
+        return [row for chunk in iter_csv_file(file_path, **options) for row in chunk]
     except Exception as e:
         logging.error(f"Error reading CSV file: {e}")
         return None
 
 
-def read_excel_file(file_path):
+def read_excel_file(file_path, **options):
     """Read data from an Excel file.
 
+    Built on iter_excel_file(), which should be used directly for large files.
+
     Args:
         file_path (str): The path to the Excel file.
+        **options: Sheet, column, dtype and chunking options passed to iter_excel_file().
 
     Returns:
         list: A list of dictionaries containing the data from the Excel file, where each dictionary represents a row.
 
     Raises:
+        ValueError: If as_frames is requested; use iter_excel_file() to get DataFrames.
         Exception: If reading the Excel file fails.
     """
+    if options.get('as_frames'):
+        raise ValueError("read_excel_file() returns records; use iter_excel_file() to get DataFrames.")
     try:
-        df = pd.read_excel(file_path)
-        return df.to_dict(orient='records')
+        return [row for chunk in iter_excel_file(file_path, **options) for row in chunk]
     except Exception as e:
         logging.error(f"Error reading Excel file: {e}")
         return None
 
 
+def json_loads(data):
+    """Parse one JSON document with the fastest available parser (orjson when installed).
+
+    Args:
+        data (str or bytes): The JSON document.
+
+    Returns:
+        object: The parsed value.
+    """
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def iter_json_values(file, array=False, buffer_size=JSON_READ_BUFFER_SIZE):
+    """Incrementally parse JSON values from a text file object.
+
+    Only the current buffer and the value being parsed are held in memory. With array=True
+    the elements of the top-level array are yielded; otherwise a stream of concatenated or
+    newline-separated top-level values is expected.
+
+    Args:
+        file (file): The file object, positioned after the opening '[' when array is True.
+        array (bool): Whether the values are elements of a top-level array (default is False).
+        buffer_size (int): The number of characters read at a time (default is JSON_READ_BUFFER_SIZE).
+
+    Yields:
+        object: Each parsed value.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = '', 0, False
+    expect_separator = after_separator = False
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        if pos == len(buffer):
+            if eof:
+                if array:
+                    raise json.JSONDecodeError("Unterminated array", buffer, pos)
+                return
+            buffer, pos = buffer[pos:] + file.read(buffer_size), 0
+            eof = pos == len(buffer)
+            continue
+        if array and buffer[pos] == ']' and not after_separator:
+            return
+        if array and expect_separator:
+            if buffer[pos] != ',':
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            pos += 1
+            expect_separator, after_separator = False, True
+            continue
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+            # A number ending at the end of the buffer, or followed by what may continue it
+            # (e.g. "12." of "12.5"), may have been cut short.
+            complete = eof or (end < len(buffer) and buffer[end] not in '.eE+-0123456789')
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            complete = False
+        if not complete:
+            # Grow the read size with the pending value so a large value is not re-parsed once per chunk.
+            chunk = file.read(max(buffer_size, len(buffer) - pos))
+            buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+            continue
+        yield value
+        pos = end
+        expect_separator, after_separator = array, False
+        if pos > buffer_size:
+            buffer, pos = buffer[pos:], 0
+
+
+def iter_json_file(file_path, buffer_size=JSON_READ_BUFFER_SIZE):
+    """Stream the records of a JSON or JSON Lines file one at a time.
+
+    .jsonl/.ndjson files are parsed line by line. For .json files the elements of a
+    top-level array are parsed incrementally, with ijson when it is installed; any other
+    document yields its top-level value(s).
+
+    Args:
+        file_path (str): The path to the JSON or JSON Lines file.
+        buffer_size (int): The number of characters read at a time (default is JSON_READ_BUFFER_SIZE).
+
+    Yields:
+        object: Each record.
+
+    Raises:
+        Exception: If reading or parsing the file fails.
+    """
+    if file_path.lower().endswith(('.jsonl', '.ndjson')):
+        with open(file_path, 'rb') as f:
+            for number, line in enumerate(f):
+                if number == 0 and line.startswith(codecs.BOM_UTF8):
+                    line = line[len(codecs.BOM_UTF8):]
+                line = line.strip()
+                if line:
+                    yield json_loads(line)
+        return
+
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        if first != '[':
+            f.seek(0)
+            yield from iter_json_values(f, buffer_size=buffer_size)
+            return
+        if IJSON_AVAILABLE:
+            # ijson parses bytes; a text handle would be re-encoded (and warned about) on every read.
+            with open(file_path, 'rb') as binary_file:
+                if binary_file.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+                    binary_file.seek(0)
+                yield from ijson.items(binary_file, 'item', use_float=True)
+            return
+        yield from iter_json_values(f, array=True, buffer_size=buffer_size)
+
+
 def read_json_file(file_path):
-    """Read data from a JSON file.
+    """Read data from a JSON or JSON Lines file.
+
+    Built on iter_json_file(), which should be used directly to process large files one
+    record at a time.
 
     Args:
         file_path (str): The path to the JSON file.
 
     Returns:
-        dict: A dictionary containing the data from the JSON file.
+        dict or list: The data from the JSON file; a list of records for JSON Lines files.
 
     Raises:
         Exception: If reading the JSON file fails.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
+        records = list(iter_json_file(file_path))
+        if file_path.lower().endswith(('.jsonl', '.ndjson')) or len(records) != 1:
+            return records
+        # A single record is either the whole document or the only element of an array.
+        with open(file_path, 'r', encoding='utf-8-sig') as f:
+            first = f.read(1)
+            while first.isspace():
+                first = f.read(1)
+        return records if first == '[' else records[0]
     except Exception as e:
         logging.error(f"Error reading JSON file: {e}")
         return None
@@ -644,6 +1949,32 @@ def read_proxy_list(file_path):
         return []
 
 
+def create_http_session(proxy=None):
+    """Create a pooled requests session for the browserless fast path.
+
+    Args:
+        proxy (str): The proxy to route requests through (default is None).
+
+    Returns:
+        requests.Session: A session with keep-alive connection pooling and retries.
+    """
+    http = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    )
+    http.mount('https://', adapter)
+    http.mount('http://', adapter)
+    http.headers.update({'User-Agent': HTTP_USER_AGENT, 'Accept-Language': 'en-US,en;q=0.9'})
+    if proxy:
+        http.proxies.update({'http': proxy, 'https': proxy})
+    return http
+
+
+http_session = create_http_session()
+
+
 def setup_driver(proxy=None):
     """Set up and configure the Selenium WebDriver.
 
@@ -651,7 +1982,8 @@ def setup_driver(proxy=None):
         proxy (str): The proxy to use for the WebDriver (default is None).
 
     Returns:
-        webdriver.Chrome: The configured WebDriver instance.
+        webdriver.Chrome: The configured WebDriver instance. Its proxy is recorded in its
+            scraper_proxy attribute so plain HTTP requests made on its behalf use it too.
 
     Raises:
         Exception: If setting up the WebDriver fails.
@@ -677,12 +2009,148 @@ def setup_driver(proxy=None):
         driver = webdriver.Chrome(service=service, options=options)
 
         driver.set_window_size(375, 812)
+        driver.scraper_proxy = proxy
         return driver
     except Exception as e:
         logging.error(f"Error setting up WebDriver: {e}")
         raise
 
 
+class DriverPool:
+    """A pool of warmed, reusable Selenium WebDriver instances.
+
+    Drivers are launched once when the pool is created and leased to the search functions
+    instead of cold-starting Chrome for every platform. A driver is health-checked before
+    each lease and recycled after ``max_uses`` leases or when it crashes.
+
+    Args:
+        size (int): The number of drivers to keep in the pool (default is DRIVER_POOL_SIZE).
+        proxy (str): The proxy to use for every driver in the pool (default is None).
+        max_uses (int): The number of leases after which a driver is replaced (default is DRIVER_MAX_USES).
+
+    Example:
+        >>> pool = DriverPool(size=2)
+        >>> with pool.lease() as driver:
+        ...     search_twitter(driver, 'john_doe', FilterSpec(), 10)
+        >>> pool.close()
+    """
+
+    def __init__(self, size=DRIVER_POOL_SIZE, proxy=None, max_uses=DRIVER_MAX_USES):
+        self.size = max(1, size)
+        self.proxy = proxy
+        self.max_uses = max_uses
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(self.size):
+            # An empty slot (None) is filled lazily on the next lease if the launch fails now.
+            try:
+                self._idle.put(self._launch())
+            except Exception:
+                self._idle.put(None)
+        logging.info(f"WebDriver pool started with {self.size} slot(s).")
+
+    def _launch(self):
+        driver = setup_driver(self.proxy)
+        driver.get('about:blank')
+        with self._lock:
+            self._uses[id(driver)] = 0
+        return driver
+
+    def _retire(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"Error quitting WebDriver: {e}")
+
+    @staticmethod
+    def _is_healthy(driver):
+        try:
+            return driver.execute_script('return 1;') == 1
+        except Exception:
+            return False
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Lease a driver from the pool for the duration of a ``with`` block.
+
+        Args:
+            timeout (float): Seconds to wait for a free driver (default is None, wait forever).
+
+        Yields:
+            webdriver.Chrome: A healthy WebDriver instance.
+
+        Raises:
+            queue.Empty: If no driver becomes available within the timeout.
+            RuntimeError: If the pool has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("WebDriver pool is closed.")
+        driver = self._idle.get(timeout=timeout)
+        try:
+            if driver is None or not self._is_healthy(driver):
+                if driver is not None:
+                    logging.warning("Recycling unhealthy WebDriver before lease.")
+                    self._retire(driver)
+                driver = self._launch()
+        except Exception:
+            self._idle.put(None)
+            raise
+
+        crashed = False
+        try:
+            yield driver
+        except WebDriverException:
+            crashed = True
+            raise
+        finally:
+            self._release(driver, crashed)
+
+    def _release(self, driver, crashed):
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+
+        if self._closed:
+            self._retire(driver)
+            return
+
+        if not crashed and uses < self.max_uses:
+            try:
+                # Drop the previous page so the next lease starts from a clean tab.
+                driver.get('about:blank')
+                self._idle.put(driver)
+                return
+            except Exception:
+                crashed = True
+
+        logging.info(f"Recycling WebDriver after {uses} use(s){' (crashed)' if crashed else ''}.")
+        self._retire(driver)
+        try:
+            self._idle.put(self._launch())
+        except Exception as e:
+            logging.error(f"Error relaunching pooled WebDriver: {e}")
+            self._idle.put(None)
+
+    def close(self):
+        """Quit every idle driver and stop handing out new leases.
+
+        Drivers that are currently leased are quit when they are released.
+        """
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if driver is not None:
+                self._retire(driver)
+        logging.info("WebDriver pool closed.")
+
+
 def login_to_telegram(driver, phone_number):
     """Log in to Telegram using the provided phone number.
 
@@ -711,163 +2179,552 @@ def login_to_telegram(driver, phone_number):
         raise
 
 
-def search_telegram(driver, username, keywords, start_date, end_date, max_results):
-    """Search Telegram for messages from a specific user.
+class FilterSpec:
+    """Keyword and date filters compiled once per job and shared by every search function.
+
+    All positive keywords are folded into one compiled regular expression, so a text is
+    case-folded and scanned once no matter how many keywords there are. A keyword prefixed
+    with ``-`` excludes matching texts, and a keyword wrapped in double quotes only matches
+    whole words.
 
     Args:
-        driver (webdriver.Chrome): The WebDriver instance.
-        username (str): The username of the Telegram user to search.
-        keywords (list): List of keywords to filter messages.
-        start_date (str): Start date for filtering messages (format: YYYY-MM-DD).
-        end_date (str): End date for filtering messages (format: YYYY-MM-DD).
-        max_results (int): Maximum number of messages to retrieve.
+        keywords (list): List of keywords to filter texts (default is None, match everything).
+        start_date (str): Start date for filtering (format: YYYY-MM-DD).
+        end_date (str): End date for filtering (format: YYYY-MM-DD).
+        whole_word (bool): Whether every keyword should only match whole words (default is False).
+
+    Example:
+        >>> spec = FilterSpec(['python', '-snake', '"go"'])
+        >>> spec.matches_text('Python and Go')
+        True
+        >>> spec.matches_text('A python is a snake')
+        False
+    """
+
+    def __init__(self, keywords=None, start_date=None, end_date=None, whole_word=False):
+        self.keywords = []
+        include, exclude = [], []
+        self._include_terms, self._exclude_terms = [], []
+        for keyword in keywords or []:
+            keyword = keyword.strip()
+            patterns = include
+            if keyword.startswith('-') and len(keyword) > 1:
+                patterns = exclude
+                keyword = keyword[1:]
+            else:
+                self.keywords.append(keyword)
+            exact = whole_word
+            if len(keyword) > 2 and keyword.startswith('"') and keyword.endswith('"'):
+                exact = True
+                keyword = keyword[1:-1]
+            if not keyword:
+                continue
+            (self._include_terms if patterns is include else self._exclude_terms).append((keyword, exact))
+            pattern = re.escape(keyword.casefold())
+            patterns.append(rf'(?<!\w){pattern}(?!\w)' if exact else pattern)
+        self._include = re.compile('|'.join(include)) if include else None
+        self._exclude = re.compile('|'.join(exclude)) if exclude else None
+
+        # Date bounds only apply when both ends are given.
+        self.start = self.end = None
+        if start_date and end_date:
+            self.start = datetime.strptime(start_date, '%Y-%m-%d')
+            self.end = datetime.strptime(end_date, '%Y-%m-%d')
+
+    def matches_text(self, text):
+        """Check a text against the keyword filters.
+
+        Args:
+            text (str): The text to check.
+
+        Returns:
+            bool: True if the text contains a keyword (or there are none) and no excluded term.
+        """
+        if not self._include and not self._exclude:
+            return True
+        folded = (text or '').casefold()
+        if self._exclude and self._exclude.search(folded):
+            return False
+        return not self._include or self._include.search(folded) is not None
+
+    def matches_date(self, date):
+        """Check a date against the date bounds.
+
+        Args:
+            date (datetime): The date to check.
+
+        Returns:
+            bool: True if the date is within the bounds or no bounds are set.
+        """
+        return self.start is None or self.start <= date <= self.end
+
+    def matches(self, text, date):
+        """Check a text and its date against all filters.
+
+        Args:
+            text (str): The text to check.
+            date (datetime): The date of the text.
+
+        Returns:
+            bool: True if both the date and the keyword filters match.
+        """
+        return self.matches_date(date) and self.matches_text(text)
+
+    def is_before_start(self, date):
+        """Check whether a date falls before the start bound.
+
+        Args:
+            date (datetime): The date to check.
+
+        Returns:
+            bool: True if a start bound is set and the date is earlier.
+        """
+        return self.start is not None and date < self.start
+
+    def sql_where(self, text_expression, date_expression=None):
+        """Translate the filters into an SQLite WHERE clause for push-down.
+
+        LIKE cannot express whole-word matches, and it only folds ASCII case, so positive
+        keywords are pushed down only when they are ASCII, and excluded terms only when they
+        are ASCII substring matches. Whole-word excludes are left to matches_text(), which rows
+        should still be checked with afterwards. The clause is a superset of the matching rows
+        except for non-ASCII text that only matches after case folding expands it (e.g. the
+        keyword 'strasse' matches 'Straße' in matches_text() but not in LIKE); such rows are
+        not returned.
+
+        Numeric dates are read as Unix timestamps and text dates as ISO 8601. When date bounds
+        are set, rows whose date is NULL or cannot be parsed are left out, as matches_date()
+        cannot place them either.
+
+        Args:
+            text_expression (str): The SQL expression of the text to search.
+            date_expression (str): The SQL expression of the row date, or None to skip the date bounds.
+
+        Returns:
+            tuple: The clause (empty if nothing can be pushed down) and its parameters.
+        """
+        clauses, params = [], []
+        if self._include_terms and all(term.isascii() for term, _ in self._include_terms):
+            clauses.append('(' + ' OR '.join([f"{text_expression} LIKE ? ESCAPE '\\'"] * len(self._include_terms)) + ')')
+            params.extend(like_pattern(term) for term, _ in self._include_terms)
+        for term, exact in self._exclude_terms:
+            if exact or not term.isascii():
+                continue
+            clauses.append(f"{text_expression} NOT LIKE ? ESCAPE '\\'")
+            params.append(like_pattern(term))
+        if date_expression and self.start is not None:
+            # datetime() reads bare numbers as Julian day numbers, so numeric dates need 'unixepoch'.
+            clauses.append(f"(CASE WHEN typeof({date_expression}) IN ('integer', 'real') "
+                           f"THEN datetime({date_expression}, 'unixepoch') ELSE datetime({date_expression}) END) "
+                           f"BETWEEN datetime(?) AND datetime(?)")
+            params.extend([self.start.isoformat(' '), self.end.isoformat(' ')])
+        return ' AND '.join(clauses), params
+
+
+def like_pattern(term):
+    """Build a LIKE pattern matching a literal substring (escape character is a backslash).
+
+    Args:
+        term (str): The substring to match.
 
     Returns:
-        list: A list of dictionaries containing message details.
+        str: The pattern.
+    """
+    return '%' + re.sub(r'([%_\\])', r'\\\1', term) + '%'
+
+
+# Platforms whose result pages are readable without JavaScript use the HTTP fast path
+PLATFORM_CAPABILITIES = {
+    'Telegram': {'requires_js': True},
+    'Twitter': {'requires_js': True},
+    'Instagram': {'requires_js': True},
+    'Facebook': {'requires_js': True},
+    'LinkedIn': {'requires_js': True},
+    'Reddit': {'requires_js': True},
+    'Google': {'requires_js': False},
+    'Google Scholar': {'requires_js': False}
+}
+
+# Declarative field selectors for bulk_extract. Each platform lists the CSS selector of its
+# result containers and, per field, a (selector, attribute) pair relative to the container.
+# A selector of None targets the container itself and an attribute of None reads its text.
+# Records missing any of the required fields are skipped.
+PLATFORM_SELECTORS = {
+    'Telegram': {
+        'container': 'div[class*="message"]:has(> div[class="message-date"])',
+        'fields': {
+            'mid': (None, 'data-mid'),
+            'author': ('div[class="message-author"]', None),
+            'text': ('div[class="message-text"]', None),
+            'date': ('div[class="message-date"]', None)
+        },
+        'required': ('author', 'text', 'date')
+    },
+    'Twitter': {
+        'container': 'article[data-testid="tweet"]',
+        'fields': {
+            'text': ('div[lang]', None),
+            'date': ('time', 'datetime'),
+            'url': ('a[href*="/status/"]', 'href')
+        },
+        'required': ('text', 'date', 'url')
+    },
+    'Instagram': {
+        'container': 'article img',
+        'fields': {
+            'image_url': (None, 'src'),
+            'caption': (None, 'alt')
+        },
+        'required': ('caption',)
+    },
+    'Facebook': {
+        'container': 'div[role="article"]',
+        'fields': {
+            'text': ('div[data-ad-preview="message"]', None)
+        },
+        'required': ('text',)
+    },
+    'LinkedIn': {
+        'container': 'div[class*="feed-shared-update-v2"]',
+        'fields': {
+            'text': ('div[class*="feed-shared-update-v2__description"]', None)
+        },
+        'required': ('text',)
+    },
+    'Reddit': {
+        'container': 'div[class*="Post"]',
+        'fields': {
+            'text': ('h3[class*="PostTitle"]', None)
+        },
+        'required': ('text',)
+    },
+    'Google': {
+        'container': 'div[class="g"]',
+        'fields': {
+            'title': ('h3', None),
+            'link': ('a', 'href')
+        },
+        'required': ('title', 'link')
+    },
+    'Google Scholar': {
+        'container': 'div[class="gs_r"]',
+        'fields': {
+            'title': ('h3[class="gs_rt"]', None),
+            'link': ('h3[class="gs_rt"] > a', 'href')
+        },
+        'required': ('title', 'link')
+    }
+}
+
+# Evaluates a PLATFORM_SELECTORS entry in the page and returns every container as one record.
+# When markSeen is set, containers are tagged so that later calls only return new nodes.
+BULK_EXTRACT_SCRIPT = """
+const [containerSelector, fields, markSeen] = arguments;
+const selector = markSeen ? `:is(${containerSelector}):not([data-scraper-seen])` : containerSelector;
+const records = [];
+document.querySelectorAll(selector).forEach(container => {
+    if (markSeen) {
+        container.setAttribute('data-scraper-seen', '1');
+    }
+    const record = {};
+    for (const [name, [fieldSelector, attribute]] of Object.entries(fields)) {
+        const element = fieldSelector ? container.querySelector(fieldSelector) : container;
+        if (!element) {
+            record[name] = null;
+        } else if (!attribute) {
+            record[name] = element.innerText;
+        } else {
+            record[name] = attribute in element ? element[attribute] : element.getAttribute(attribute);
+        }
+    }
+    records.push(record);
+});
+return records;
+"""
+
+
+def bulk_extract(driver, platform, mark_seen=False):
+    """Extract every result on the current page in a single WebDriver round trip.
 
-    Raises:
-        TimeoutException: If searching Telegram fails due to timeout.
+    Args:
+        driver (webdriver.Chrome): The WebDriver instance.
+        platform (str): The key of the platform in PLATFORM_SELECTORS.
+        mark_seen (bool): Whether to skip and tag containers returned by a previous call (default is False).
+
+    Returns:
+        list: A list of dictionaries mapping the platform's field names to their values.
     """
-    try:
-        search_box = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, '//input[@placeholder="Search"]'))
-        )
-        search_box.send_keys(username)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, f'//div[contains(text(), "{username}")]'))
-        ).click()
-        messages = []
-        last_height = driver.execute_script("return document.querySelector('.messages-container').scrollHeight")
-        while True:
-            driver.execute_script(
-                "document.querySelector('.messages-container').scrollTo(0, document.querySelector('.messages-container').scrollHeight);")
-            WebDriverWait(driver, 2).until(
-                EC.presence_of_element_located((By.XPATH, '//div[contains(@class, "message")]'))
-            )
-            message_elements = driver.find_elements(By.XPATH, '//div[contains(@class, "message")]')
-            for element in message_elements:
-                try:
-                    user = element.find_element(By.XPATH, './/div[@class="message-author"]').text
-                    text = element.find_element(By.XPATH, './/div[@class="message-text"]').text
-                    message_type = 'text' if text else 'media'
-                    date = element.find_element(By.XPATH, './/div[@class="message-date"]').text
-                    message_date = datetime.strptime(date, '%Y-%m-%d %H:%M:%S')
-
-                    if start_date and end_date:
-                        start = datetime.strptime(start_date, '%Y-%m-%d')
-                        end = datetime.strptime(end_date, '%Y-%m-%d')
-                        if not (start <= message_date <= end):
-                            continue
-
-                    if keywords:
-                        if not any(keyword.lower() in text.lower() for keyword in keywords):
-                            continue
-
-                    messages.append({
-                        'platform': 'Telegram',
-                        'username': username,
-                        'content': text,
-                        'content_type': message_type,
-                        'date': date,
-                        'url': TELEGRAM_WEB_URL,
-                        'interaction_user': user
-                    })
-
-                    if max_results and len(messages) >= max_results:
-                        break
+    spec = PLATFORM_SELECTORS[platform]
+    fields = {name: list(selector) for name, selector in spec['fields'].items()}
+    records = driver.execute_script(BULK_EXTRACT_SCRIPT, spec['container'], fields, mark_seen) or []
+    complete = [record for record in records if all(record.get(field) is not None for field in spec['required'])]
+    if len(complete) < len(records):
+        logging.warning(f"Skipped {len(records) - len(complete)} {platform} result(s) with missing fields.")
+    return complete
 
-                except NoSuchElementException as e:
-                    logging.warning(f"Error extracting message: {e}")
 
-            if max_results and len(messages) >= max_results:
-                break
+def fetch_static_records(url, platform, proxy=None):
+    """Fetch a page over plain HTTP and extract its results without a browser.
 
-            new_height = driver.execute_script("return document.querySelector('.messages-container').scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
+    The platform's PLATFORM_SELECTORS entry is evaluated with BeautifulSoup, mirroring what
+    bulk_extract does in the browser. The proxy is passed per request, so threads using
+    different proxies can share the pooled http_session.
 
-        logging.info(f"Extracted {len(messages)} messages from Telegram for user {username}.")
-        return messages
-    except TimeoutException as e:
-        logging.error(f"Error searching Telegram for user {username}: {e}")
-        raise
+    Args:
+        url (str): The URL of the page to fetch.
+        platform (str): The key of the platform in PLATFORM_SELECTORS.
+        proxy (str): The proxy to route the request through (default is None).
 
+    Returns:
+        list: A list of dictionaries mapping the platform's field names to their values.
 
-def search_twitter(username, keywords, start_date, end_date, max_results):
-    """Search Twitter for tweets from a specific user.
+    Raises:
+        requests.exceptions.RequestException: If the request fails or returns an error status.
+    """
+    proxies = {'http': proxy, 'https': proxy} if proxy else None
+    response = http_session.get(url, timeout=HTTP_TIMEOUT, proxies=proxies)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.text, HTML_PARSER)
+    spec = PLATFORM_SELECTORS[platform]
+    records = []
+    for container in soup.select(spec['container']):
+        record = {}
+        for name, (field_selector, attribute) in spec['fields'].items():
+            element = container.select_one(field_selector) if field_selector else container
+            if element is None:
+                record[name] = None
+            elif attribute is None:
+                record[name] = element.get_text(' ', strip=True)
+            elif attribute in ('href', 'src') and element.get(attribute) is not None:
+                record[name] = urljoin(response.url, element[attribute])
+            else:
+                record[name] = element.get(attribute)
+        if all(record.get(field) is not None for field in spec['required']):
+            records.append(record)
+    return records
+
+
+def fetch_records(driver, platform, url):
+    """Load a results page and extract its records, preferring the HTTP fast path.
+
+    Platforms whose PLATFORM_CAPABILITIES entry does not require JavaScript are fetched with
+    the pooled HTTP session first, through the same proxy as the browser. Selenium is used
+    when JavaScript is required, when the proxy of the driver is unknown (it was not created
+    by setup_driver), or when the plain fetch fails or finds no results (e.g. a consent or
+    bot-check page).
 
     Args:
-        username (str): The username of the Twitter user to search.
-        keywords (list): List of keywords to filter tweets.
-        start_date (str): Start date for filtering tweets (format: YYYY-MM-DD).
-        end_date (str): End date for filtering tweets (format: YYYY-MM-DD).
-        max_results (int): Maximum number of tweets to retrieve.
+        driver (webdriver.Chrome or DriverPool): The WebDriver instance, or a pool to lease one from
+            only when Selenium is needed.
+        platform (str): The key of the platform in PLATFORM_SELECTORS.
+        url (str): The URL of the results page.
 
     Returns:
-        list: A list of dictionaries containing tweet details.
+        list: A list of dictionaries mapping the platform's field names to their values.
 
     Raises:
-        Exception: If searching Twitter fails.
+        TimeoutException: If the page loaded in Selenium shows no results in time.
     """
-    try:
-        driver = setup_driver()
-        driver.get(f"{TWITTER_URL}{username}")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, '//article[@data-testid="tweet"]'))
+    # Never send a plain request that could bypass the proxy the browser is configured with.
+    proxy_known = isinstance(driver, DriverPool) or hasattr(driver, 'scraper_proxy')
+    if not platform_requires_js(platform) and proxy_known:
+        try:
+            proxy = driver.proxy if isinstance(driver, DriverPool) else driver.scraper_proxy
+            records = fetch_static_records(url, platform, proxy)
+            if records:
+                return records
+            logging.info(f"No {platform} results over HTTP, falling back to Selenium.")
+        except requests.exceptions.RequestException as e:
+            logging.warning(f"HTTP fetch for {platform} failed, falling back to Selenium: {e}")
+
+    if isinstance(driver, DriverPool):
+        with driver.lease() as leased_driver:
+            return fetch_records_with_browser(leased_driver, platform, url)
+    return fetch_records_with_browser(driver, platform, url)
+
+
+def fetch_records_with_browser(driver, platform, url):
+    """Load a results page in Selenium and extract its records with bulk_extract.
+
+    Args:
+        driver (webdriver.Chrome): The WebDriver instance.
+        platform (str): The key of the platform in PLATFORM_SELECTORS.
+        url (str): The URL of the results page.
+
+    Returns:
+        list: A list of dictionaries mapping the platform's field names to their values.
+
+    Raises:
+        TimeoutException: If no results appear within 10 seconds.
+    """
+    driver.get(url)
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, PLATFORM_SELECTORS[platform]['container']))
+    )
+    return bulk_extract(driver, platform)
+
+
+def platform_requires_js(platform):
+    """Check whether a platform can only be scraped with a JavaScript-capable browser.
+
+    Args:
+        platform (str): The platform name.
+
+    Returns:
+        bool: True unless PLATFORM_CAPABILITIES marks the platform as readable over plain HTTP.
+    """
+    return PLATFORM_CAPABILITIES.get(platform, {}).get('requires_js', True)
+
+
+def harvest_new_telegram_messages(driver):
+    """Return the Telegram messages loaded since the previous call.
+
+    Already harvested messages are tagged in the DOM, so each call costs one WebDriver
+    round trip and only returns nodes that appeared after the last scroll.
+
+    Args:
+        driver (webdriver.Chrome): The WebDriver instance with a Telegram chat open.
+
+    Returns:
+        list: A list of dictionaries with the author, text, date and id of each new message.
+    """
+    return bulk_extract(driver, 'Telegram', mark_seen=True)
+
+
+def search_telegram(driver, username, filter_spec, max_results):
+    """Search Telegram for messages from a specific user.
+
+    Args:
+        driver (webdriver.Chrome): The WebDriver instance.
+        username (str): The username of the Telegram user to search.
+        filter_spec (FilterSpec): The compiled keyword and date filters for the messages.
+        max_results (int): Maximum number of messages to retrieve.
+
+    Returns:
+        list: A list of dictionaries containing message details.
+
+    Raises:
+        TimeoutException: If searching Telegram fails due to timeout.
+    """
+    try:
+        search_box = WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.XPATH, '//input[@placeholder="Search"]'))
         )
-        tweets = []
-        tweet_elements = driver.find_elements(By.XPATH, '//article[@data-testid="tweet"]')
-        for element in tweet_elements:
-            try:
-                text = element.find_element(By.XPATH, './/div[@lang]').text
-                date = element.find_element(By.XPATH, './/time').get_attribute('datetime')
-                tweet_url = element.find_element(By.XPATH, './/a[contains(@href, "/status/")]').get_attribute('href')
-                tweet_date = datetime.strptime(date, '%Y-%m-%dT%H:%M:%S.%fZ')
-
-                if start_date and end_date:
-                    start = datetime.strptime(start_date, '%Y-%m-%d')
-                    end = datetime.strptime(end_date, '%Y-%m-%d')
-                    if not (start <= tweet_date <= end):
-                        continue
-
-                if keywords:
-                    if not any(keyword.lower() in text.lower() for keyword in keywords):
-                        continue
-
-                tweets.append({
-                    'platform': 'Twitter',
+        search_box.send_keys(username)
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.XPATH, f'//div[contains(text(), "{username}")]'))
+        ).click()
+        messages = []
+        seen_keys = set()
+        last_height = driver.execute_script("return document.querySelector('.messages-container').scrollHeight")
+        while True:
+            driver.execute_script(
+                "document.querySelector('.messages-container').scrollTo(0, document.querySelector('.messages-container').scrollHeight);")
+            WebDriverWait(driver, 2).until(
+                EC.presence_of_element_located((By.XPATH, '//div[contains(@class, "message")]'))
+            )
+            reached_start = False
+            for record in harvest_new_telegram_messages(driver):
+                user = record['author']
+                text = record['text']
+                message_type = 'text' if text else 'media'
+                date = record['date']
+                message_key = record['mid'] or (user, date, text)
+                if message_key in seen_keys:
+                    continue
+                seen_keys.add(message_key)
+                message_date = datetime.strptime(date, '%Y-%m-%d %H:%M:%S')
+
+                if filter_spec.is_before_start(message_date):
+                    reached_start = True
+                    continue
+                if not filter_spec.matches(text, message_date):
+                    continue
+
+                messages.append({
+                    'platform': 'Telegram',
                     'username': username,
                     'content': text,
-                    'content_type': 'tweet',
+                    'content_type': message_type,
                     'date': date,
-                    'url': tweet_url,
-                    'interaction_user': username
+                    'url': TELEGRAM_WEB_URL,
+                    'interaction_user': user
                 })
 
-                if max_results and len(tweets) >= max_results:
+                if max_results and len(messages) >= max_results:
                     break
 
-            except NoSuchElementException as e:
-                logging.warning(f"Error extracting tweet: {e}")
+            if max_results and len(messages) >= max_results:
+                break
+
+            # Older messages only get older from here on, so there is nothing left in range.
+            if reached_start:
+                break
+
+            new_height = driver.execute_script("return document.querySelector('.messages-container').scrollHeight")
+            if new_height == last_height:
+                break
+            last_height = new_height
+
+        logging.info(f"Extracted {len(messages)} messages from Telegram for user {username}.")
+        return messages
+    except TimeoutException as e:
+        logging.error(f"Error searching Telegram for user {username}: {e}")
+        raise
+
+
+def search_twitter(driver, username, filter_spec, max_results):
+    """Search Twitter for tweets from a specific user.
+
+    Args:
+        driver (webdriver.Chrome): The WebDriver instance.
+        username (str): The username of the Twitter user to search.
+        filter_spec (FilterSpec): The compiled keyword and date filters for the tweets.
+        max_results (int): Maximum number of tweets to retrieve.
+
+    Returns:
+        list: A list of dictionaries containing tweet details.
+
+    Raises:
+        Exception: If searching Twitter fails.
+    """
+    try:
+        tweets = []
+        for record in fetch_records(driver, 'Twitter', f"{TWITTER_URL}{username}"):
+            text = record['text']
+            date = record['date']
+            tweet_date = datetime.strptime(date, '%Y-%m-%dT%H:%M:%S.%fZ')
+
+            if not filter_spec.matches(text, tweet_date):
+                continue
+
+            tweets.append({
+                'platform': 'Twitter',
+                'username': username,
+                'content': text,
+                'content_type': 'tweet',
+                'date': date,
+                'url': record['url'],
+                'interaction_user': username
+            })
+
+            if max_results and len(tweets) >= max_results:
+                break
 
         logging.info(f"Extracted {len(tweets)} tweets from Twitter for user {username}.")
         return tweets
     except Exception as e:
         logging.error(f"Error searching Twitter for user {username}: {e}")
         return []
-    finally:
-        driver.quit()
 
 
-def search_instagram(username, keywords, start_date, end_date, max_results):
+def search_instagram(driver, username, filter_spec, max_results):
     """Search Instagram for posts from a specific user.
 
     Args:
+        driver (webdriver.Chrome): The WebDriver instance.
         username (str): The username of the Instagram user to search.
-        keywords (list): List of keywords to filter posts.
-        start_date (str): Start date for filtering posts (format: YYYY-MM-DD).
-        end_date (str): End date for filtering posts (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the posts.
         max_results (int): Maximum number of posts to retrieve.
 
     Returns:
@@ -877,62 +2734,41 @@ def search_instagram(username, keywords, start_date, end_date, max_results):
         Exception: If searching Instagram fails.
     """
     try:
-        driver = setup_driver()
-        driver.get(f"{INSTAGRAM_URL}{username}")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, '//article//img'))
-        )
         posts = []
-        post_elements = driver.find_elements(By.XPATH, '//article//img')
-        for element in post_elements:
-            try:
-                image_url = element.get_attribute('src')
-                caption = element.find_element(By.XPATH, './/img').get_attribute('alt')
-                post_date = datetime.now()
-
-                if start_date and end_date:
-                    start = datetime.strptime(start_date, '%Y-%m-%d')
-                    end = datetime.strptime(end_date, '%Y-%m-%d')
-                    if not (start <= post_date <= end):
-                        continue
-
-                if keywords:
-                    if not any(keyword.lower() in caption.lower() for keyword in keywords):
-                        continue
-
-                posts.append({
-                    'platform': 'Instagram',
-                    'username': username,
-                    'content': caption,
-                    'content_type': 'image',
-                    'date': post_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': f"{INSTAGRAM_URL}{username}",
-                    'interaction_user': username
-                })
+        for record in fetch_records(driver, 'Instagram', f"{INSTAGRAM_URL}{username}"):
+            caption = record['caption']
+            post_date = datetime.now()
 
-                if max_results and len(posts) >= max_results:
-                    break
+            if not filter_spec.matches(caption, post_date):
+                continue
 
-            except NoSuchElementException as e:
-                logging.warning(f"Error extracting post: {e}")
+            posts.append({
+                'platform': 'Instagram',
+                'username': username,
+                'content': caption,
+                'content_type': 'image',
+                'date': post_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'url': f"{INSTAGRAM_URL}{username}",
+                'interaction_user': username
+            })
+
+            if max_results and len(posts) >= max_results:
+                break
 
         logging.info(f"Extracted {len(posts)} posts from Instagram for user {username}.")
         return posts
     except Exception as e:
         logging.error(f"Error searching Instagram for user {username}: {e}")
         return []
-    finally:
-        driver.quit()
 
 
-def search_facebook(username, keywords, start_date, end_date, max_results):
+def search_facebook(driver, username, filter_spec, max_results):
     """Search Facebook for posts from a specific user.
 
     Args:
+        driver (webdriver.Chrome): The WebDriver instance.
         username (str): The username of the Facebook user to search.
-        keywords (list): List of keywords to filter posts.
-        start_date (str): Start date for filtering posts (format: YYYY-MM-DD).
-        end_date (str): End date for filtering posts (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the posts.
         max_results (int): Maximum number of posts to retrieve.
 
     Returns:
@@ -942,61 +2778,41 @@ def search_facebook(username, keywords, start_date, end_date, max_results):
         Exception: If searching Facebook fails.
     """
     try:
-        driver = setup_driver()
-        driver.get(f"{FACEBOOK_URL}{username}")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, '//div[@role="article"]'))
-        )
         posts = []
-        post_elements = driver.find_elements(By.XPATH, '//div[@role="article"]')
-        for element in post_elements:
-            try:
-                text = element.find_element(By.XPATH, './/div[@data-ad-preview="message"]').text
-                post_date = datetime.now()
-
-                if start_date and end_date:
-                    start = datetime.strptime(start_date, '%Y-%m-%d')
-                    end = datetime.strptime(end_date, '%Y-%m-%d')
-                    if not (start <= post_date <= end):
-                        continue
+        for record in fetch_records(driver, 'Facebook', f"{FACEBOOK_URL}{username}"):
+            text = record['text']
+            post_date = datetime.now()
 
-                if keywords:
-                    if not any(keyword.lower() in text.lower() for keyword in keywords):
-                        continue
+            if not filter_spec.matches(text, post_date):
+                continue
 
-                posts.append({
-                    'platform': 'Facebook',
-                    'username': username,
-                    'content': text,
-                    'content_type': 'post',
-                    'date': post_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': f"{FACEBOOK_URL}{username}",
-                    'interaction_user': username
-                })
-
-                if max_results and len(posts) >= max_results:
-                    break
+            posts.append({
+                'platform': 'Facebook',
+                'username': username,
+                'content': text,
+                'content_type': 'post',
+                'date': post_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'url': f"{FACEBOOK_URL}{username}",
+                'interaction_user': username
+            })
 
-            except NoSuchElementException as e:
-                logging.warning(f"Error extracting post: {e}")
+            if max_results and len(posts) >= max_results:
+                break
 
         logging.info(f"Extracted {len(posts)} posts from Facebook for user {username}.")
         return posts
     except Exception as e:
         logging.error(f"Error searching Facebook for user {username}: {e}")
         return []
-    finally:
-        driver.quit()
 
 
-def search_linkedin(username, keywords, start_date, end_date, max_results):
+def search_linkedin(driver, username, filter_spec, max_results):
     """Search LinkedIn for posts from a specific user.
 
     Args:
+        driver (webdriver.Chrome): The WebDriver instance.
         username (str): The username of the LinkedIn user to search.
-        keywords (list): List of keywords to filter posts.
-        start_date (str): Start date for filtering posts (format: YYYY-MM-DD).
-        end_date (str): End date for filtering posts (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the posts.
         max_results (int): Maximum number of posts to retrieve.
 
     Returns:
@@ -1006,62 +2822,41 @@ def search_linkedin(username, keywords, start_date, end_date, max_results):
         Exception: If searching LinkedIn fails.
     """
     try:
-        driver = setup_driver()
-        driver.get(f"{LINKEDIN_URL}in/{username}")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, '//div[contains(@class, "feed-shared-update-v2")]'))
-        )
         posts = []
-        post_elements = driver.find_elements(By.XPATH, '//div[contains(@class, "feed-shared-update-v2")]')
-        for element in post_elements:
-            try:
-                text = element.find_element(By.XPATH,
-                                            './/div[contains(@class, "feed-shared-update-v2__description")]').text
-                post_date = datetime.now()
-
-                if start_date and end_date:
-                    start = datetime.strptime(start_date, '%Y-%m-%d')
-                    end = datetime.strptime(end_date, '%Y-%m-%d')
-                    if not (start <= post_date <= end):
-                        continue
-
-                if keywords:
-                    if not any(keyword.lower() in text.lower() for keyword in keywords):
-                        continue
-
-                posts.append({
-                    'platform': 'LinkedIn',
-                    'username': username,
-                    'content': text,
-                    'content_type': 'post',
-                    'date': post_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': f"{LINKEDIN_URL}in/{username}",
-                    'interaction_user': username
-                })
+        for record in fetch_records(driver, 'LinkedIn', f"{LINKEDIN_URL}in/{username}"):
+            text = record['text']
+            post_date = datetime.now()
 
-                if max_results and len(posts) >= max_results:
-                    break
+            if not filter_spec.matches(text, post_date):
+                continue
+
+            posts.append({
+                'platform': 'LinkedIn',
+                'username': username,
+                'content': text,
+                'content_type': 'post',
+                'date': post_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'url': f"{LINKEDIN_URL}in/{username}",
+                'interaction_user': username
+            })
 
-            except NoSuchElementException as e:
-                logging.warning(f"Error extracting post: {e}")
+            if max_results and len(posts) >= max_results:
+                break
 
         logging.info(f"Extracted {len(posts)} posts from LinkedIn for user {username}.")
         return posts
     except Exception as e:
         logging.error(f"Error searching LinkedIn for user {username}: {e}")
         return []
-    finally:
-        driver.quit()
 
 
-def search_reddit(username, keywords, start_date, end_date, max_results):
+def search_reddit(driver, username, filter_spec, max_results):
     """Search Reddit for posts from a specific user.
 
     Args:
+        driver (webdriver.Chrome): The WebDriver instance.
         username (str): The username of the Reddit user to search.
-        keywords (list): List of keywords to filter posts.
-        start_date (str): Start date for filtering posts (format: YYYY-MM-DD).
-        end_date (str): End date for filtering posts (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the posts.
         max_results (int): Maximum number of posts to retrieve.
 
     Returns:
@@ -1071,61 +2866,42 @@ def search_reddit(username, keywords, start_date, end_date, max_results):
         Exception: If searching Reddit fails.
     """
     try:
-        driver = setup_driver()
-        driver.get(f"{REDDIT_URL}user/{username}")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, '//div[contains(@class, "Post")]'))
-        )
         posts = []
-        post_elements = driver.find_elements(By.XPATH, '//div[contains(@class, "Post")]')
-        for element in post_elements:
-            try:
-                text = element.find_element(By.XPATH, './/h3[contains(@class, "PostTitle")]').text
-                post_date = datetime.now()
+        for record in fetch_records(driver, 'Reddit', f"{REDDIT_URL}user/{username}"):
+            text = record['text']
+            post_date = datetime.now()
 
-                if start_date and end_date:
-                    start = datetime.strptime(start_date, '%Y-%m-%d')
-                    end = datetime.strptime(end_date, '%Y-%m-%d')
-                    if not (start <= post_date <= end):
-                        continue
+            if not filter_spec.matches(text, post_date):
+                continue
 
-                if keywords:
-                    if not any(keyword.lower() in text.lower() for keyword in keywords):
-                        continue
-
-                posts.append({
-                    'platform': 'Reddit',
-                    'username': username,
-                    'content': text,
-                    'content_type': 'post',
-                    'date': post_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': f"{REDDIT_URL}user/{username}",
-                    'interaction_user': username
-                })
-
-                if max_results and len(posts) >= max_results:
-                    break
+            posts.append({
+                'platform': 'Reddit',
+                'username': username,
+                'content': text,
+                'content_type': 'post',
+                'date': post_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'url': f"{REDDIT_URL}user/{username}",
+                'interaction_user': username
+            })
 
-            except NoSuchElementException as e:
-                logging.warning(f"Error extracting post: {e}")
+            if max_results and len(posts) >= max_results:
+                break
 
         logging.info(f"Extracted {len(posts)} posts from Reddit for user {username}.")
         return posts
     except Exception as e:
         logging.error(f"Error searching Reddit for user {username}: {e}")
         return []
-    finally:
-        driver.quit()
 
 
-def search_google(username, keywords, start_date, end_date, max_results):
+def search_google(driver, username, filter_spec, max_results):
     """Search Google for results related to a specific user.
 
     Args:
+        driver (webdriver.Chrome or DriverPool): The WebDriver instance, or a pool to lease one from
+            only if the HTTP fast path returns nothing.
         username (str): The username to search for on Google.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
         max_results (int): Maximum number of results to retrieve.
 
     Returns:
@@ -1135,62 +2911,42 @@ def search_google(username, keywords, start_date, end_date, max_results):
         Exception: If searching Google fails.
     """
     try:
-        driver = setup_driver()
-        driver.get(f"{GOOGLE_SEARCH_URL}{username}")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, '//div[@class="g"]'))
-        )
         results = []
-        search_results = driver.find_elements(By.XPATH, '//div[@class="g"]')
-        for result in search_results:
-            try:
-                title = result.find_element(By.XPATH, './/h3').text
-                link = result.find_element(By.XPATH, './/a').get_attribute('href')
-                result_date = datetime.now()
-
-                if start_date and end_date:
-                    start = datetime.strptime(start_date, '%Y-%m-%d')
-                    end = datetime.strptime(end_date, '%Y-%m-%d')
-                    if not (start <= result_date <= end):
-                        continue
-
-                if keywords:
-                    if not any(keyword.lower() in title.lower() for keyword in keywords):
-                        continue
-
-                results.append({
-                    'platform': 'Google',
-                    'username': username,
-                    'content': title,
-                    'content_type': 'search_result',
-                    'date': result_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': link,
-                    'interaction_user': username
-                })
+        for record in fetch_records(driver, 'Google', f"{GOOGLE_SEARCH_URL}{username}"):
+            title = record['title']
+            result_date = datetime.now()
 
-                if max_results and len(results) >= max_results:
-                    break
+            if not filter_spec.matches(title, result_date):
+                continue
 
-            except NoSuchElementException as e:
-                logging.warning(f"Error extracting search result: {e}")
+            results.append({
+                'platform': 'Google',
+                'username': username,
+                'content': title,
+                'content_type': 'search_result',
+                'date': result_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'url': record['link'],
+                'interaction_user': username
+            })
+
+            if max_results and len(results) >= max_results:
+                break
 
         logging.info(f"Extracted {len(results)} search results from Google for user {username}.")
         return results
     except Exception as e:
         logging.error(f"Error searching Google for user {username}: {e}")
         return []
-    finally:
-        driver.quit()
 
 
-def search_google_scholar(username, keywords, start_date, end_date, max_results):
+def search_google_scholar(driver, username, filter_spec, max_results):
     """Search Google Scholar for results related to a specific user.
 
     Args:
+        driver (webdriver.Chrome or DriverPool): The WebDriver instance, or a pool to lease one from
+            only if the HTTP fast path returns nothing.
         username (str): The username to search for on Google Scholar.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
         max_results (int): Maximum number of results to retrieve.
 
     Returns:
@@ -1200,62 +2956,40 @@ def search_google_scholar(username, keywords, start_date, end_date, max_results)
         Exception: If searching Google Scholar fails.
     """
     try:
-        driver = setup_driver()
-        driver.get(f"{GOOGLE_SCHOLAR_URL}{username}")
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.XPATH, '//div[@class="gs_r"]'))
-        )
         results = []
-        search_results = driver.find_elements(By.XPATH, '//div[@class="gs_r"]')
-        for result in search_results:
-            try:
-                title = result.find_element(By.XPATH, './/h3[@class="gs_rt"]').text
-                link = result.find_element(By.XPATH, './/h3[@class="gs_rt"]/a').get_attribute('href')
-                result_date = datetime.now()
-
-                if start_date and end_date:
-                    start = datetime.strptime(start_date, '%Y-%m-%d')
-                    end = datetime.strptime(end_date, '%Y-%m-%d')
-                    if not (start <= result_date <= end):
-                        continue
-
-                if keywords:
-                    if not any(keyword.lower() in title.lower() for keyword in keywords):
-                        continue
-
-                results.append({
-                    'platform': 'Google Scholar',
-                    'username': username,
-                    'content': title,
-                    'content_type': 'search_result',
-                    'date': result_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': link,
-                    'interaction_user': username
-                })
+        for record in fetch_records(driver, 'Google Scholar', f"{GOOGLE_SCHOLAR_URL}{username}"):
+            title = record['title']
+            result_date = datetime.now()
 
-                if max_results and len(results) >= max_results:
-                    break
+            if not filter_spec.matches(title, result_date):
+                continue
+
+            results.append({
+                'platform': 'Google Scholar',
+                'username': username,
+                'content': title,
+                'content_type': 'search_result',
+                'date': result_date.strftime('%Y-%m-%d %H:%M:%S'),
+                'url': record['link'],
+                'interaction_user': username
+            })
 
-            except NoSuchElementException as e:
-                logging.warning(f"Error extracting search result: {e}")
+            if max_results and len(results) >= max_results:
+                break
 
         logging.info(f"Extracted {len(results)} search results from Google Scholar for user {username}.")
         return results
     except Exception as e:
         logging.error(f"Error searching Google Scholar for user {username}: {e}")
         return []
-    finally:
-        driver.quit()
 
 
-def search_public_databases(username, keywords, start_date, end_date, max_results):
+def search_public_databases(username, filter_spec, max_results):
     """Search public databases for information related to a specific user.
 
     Args:
         username (str): The username to search for in public databases.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
         max_results (int): Maximum number of results to retrieve.
 
     Returns:
@@ -1268,11 +3002,11 @@ def search_public_databases(username, keywords, start_date, end_date, max_result
         results = []
         # Example: Search in a public database (e.g., a government database)
         # This is a placeholder and should be replaced with actual database queries
-        if keywords:
+        if filter_spec.keywords:
             results.append({
                 'platform': 'Public Database',
                 'username': username,
-                'content': f"Information related to {username} and keywords {keywords}",
+                'content': f"Information related to {username} and keywords {filter_spec.keywords}",
                 'content_type': 'database_entry',
                 'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'url': 'https://example.com',
@@ -1286,14 +3020,12 @@ def search_public_databases(username, keywords, start_date, end_date, max_result
         return []
 
 
-def search_private_databases(username, keywords, start_date, end_date, max_results):
+def search_private_databases(username, filter_spec, max_results):
     """Search private databases for information related to a specific user.
 
     Args:
         username (str): The username to search for in private databases.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
         max_results (int): Maximum number of results to retrieve.
 
     Returns:
@@ -1306,11 +3038,11 @@ def search_private_databases(username, keywords, start_date, end_date, max_resul
         results = []
         # Example: Search in a private database (e.g., a corporate database)
         # This is a placeholder and should be replaced with actual database queries
-        if keywords:
+        if filter_spec.keywords:
             results.append({
                 'platform': 'Private Database',
                 'username': username,
-                'content': f"Information related to {username} and keywords {keywords}",
+                'content': f"Information related to {username} and keywords {filter_spec.keywords}",
                 'content_type': 'database_entry',
                 'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'url': 'https://example.com',
@@ -1324,14 +3056,12 @@ def search_private_databases(username, keywords, start_date, end_date, max_resul
         return []
 
 
-def search_email(email, keywords, start_date, end_date, max_results):
+def search_email(email, filter_spec, max_results):
     """Search for information related to a specific email address.
 
     Args:
         email (str): The email address to search for.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
         max_results (int): Maximum number of results to retrieve.
 
     Returns:
@@ -1344,11 +3074,11 @@ def search_email(email, keywords, start_date, end_date, max_results):
         results = []
         # Example: Search for email in public databases or social media
         # This is a placeholder and should be replaced with actual search logic
-        if keywords:
+        if filter_spec.keywords:
             results.append({
                 'platform': 'Email Search',
                 'username': email,
-                'content': f"Information related to {email} and keywords {keywords}",
+                'content': f"Information related to {email} and keywords {filter_spec.keywords}",
                 'content_type': 'email_entry',
                 'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'url': 'https://example.com',
@@ -1362,14 +3092,12 @@ def search_email(email, keywords, start_date, end_date, max_results):
         return []
 
 
-def search_user_id(user_id, keywords, start_date, end_date, max_results):
+def search_user_id(user_id, filter_spec, max_results):
     """Search for information related to a specific user ID.
 
     Args:
         user_id (str): The user ID to search for.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
         max_results (int): Maximum number of results to retrieve.
 
     Returns:
@@ -1382,11 +3110,11 @@ def search_user_id(user_id, keywords, start_date, end_date, max_results):
         results = []
         # Example: Search for user ID in public databases or social media
         # This is a placeholder and should be replaced with actual search logic
-        if keywords:
+        if filter_spec.keywords:
             results.append({
                 'platform': 'User ID Search',
                 'username': user_id,
-                'content': f"Information related to {user_id} and keywords {keywords}",
+                'content': f"Information related to {user_id} and keywords {filter_spec.keywords}",
                 'content_type': 'user_id_entry',
                 'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'url': 'https://example.com',
@@ -1400,14 +3128,12 @@ def search_user_id(user_id, keywords, start_date, end_date, max_results):
         return []
 
 
-def search_national_id(national_id, keywords, start_date, end_date, max_results):
+def search_national_id(national_id, filter_spec, max_results):
     """Search for information related to a specific national ID.
 
     Args:
         national_id (str): The national ID to search for.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
         max_results (int): Maximum number of results to retrieve.
 
     Returns:
@@ -1420,11 +3146,11 @@ def search_national_id(national_id, keywords, start_date, end_date, max_results)
         results = []
         # Example: Search for national ID in public databases
         # This is a placeholder and should be replaced with actual search logic
-        if keywords:
+        if filter_spec.keywords:
             results.append({
                 'platform': 'National ID Search',
                 'username': national_id,
-                'content': f"Information related to {national_id} and keywords {keywords}",
+                'content': f"Information related to {national_id} and keywords {filter_spec.keywords}",
                 'content_type': 'national_id_entry',
                 'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'url': 'https://example.com',
@@ -1438,14 +3164,12 @@ def search_national_id(national_id, keywords, start_date, end_date, max_results)
         return []
 
 
-def search_passport_number(passport_number, keywords, start_date, end_date, max_results):
+def search_passport_number(passport_number, filter_spec, max_results):
     """Search for information related to a specific passport number.
 
     Args:
         passport_number (str): The passport number to search for.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
         max_results (int): Maximum number of results to retrieve.
 
     Returns:
@@ -1458,11 +3182,11 @@ def search_passport_number(passport_number, keywords, start_date, end_date, max_
         results = []
         # Example: Search for passport number in public databases
         # This is a placeholder and should be replaced with actual search logic
-        if keywords:
+        if filter_spec.keywords:
             results.append({
                 'platform': 'Passport Number Search',
                 'username': passport_number,
-                'content': f"Information related to {passport_number} and keywords {keywords}",
+                'content': f"Information related to {passport_number} and keywords {filter_spec.keywords}",
                 'content_type': 'passport_number_entry',
                 'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'url': 'https://example.com',
@@ -1476,14 +3200,12 @@ def search_passport_number(passport_number, keywords, start_date, end_date, max_
         return []
 
 
-def search_account_number(account_number, keywords, start_date, end_date, max_results):
+def search_account_number(account_number, filter_spec, max_results):
     """Search for information related to a specific account number.
 
     Args:
         account_number (str): The account number to search for.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
         max_results (int): Maximum number of results to retrieve.
 
     Returns:
@@ -1496,11 +3218,11 @@ def search_account_number(account_number, keywords, start_date, end_date, max_re
         results = []
         # Example: Search for account number in public databases
         # This is a placeholder and should be replaced with actual search logic
-        if keywords:
+        if filter_spec.keywords:
             results.append({
                 'platform': 'Account Number Search',
                 'username': account_number,
-                'content': f"Information related to {account_number} and keywords {keywords}",
+                'content': f"Information related to {account_number} and keywords {filter_spec.keywords}",
                 'content_type': 'account_number_entry',
                 'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'url': 'https://example.com',
@@ -1514,141 +3236,1175 @@ def search_account_number(account_number, keywords, start_date, end_date, max_re
         return []
 
 
-def search_image(image_path, keywords, start_date, end_date, max_results):
+def search_image(image_path, filter_spec, max_results):
     """Search for information related to a specific image.
 
     Args:
-        image_path (str): The path to the image file to search for.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
-        max_results (int): Maximum number of results to retrieve.
+        image_path (str): The path to the image file to search for.
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
+        max_results (int): Maximum number of results to retrieve.
+
+    Returns:
+        list: A list of dictionaries containing image entry details.
+
+    Raises:
+        Exception: If searching for image fails.
+    """
+    try:
+        results = []
+        # Example: Search for image in public databases or reverse image search
+        # This is a placeholder and should be replaced with actual search logic
+        if filter_spec.keywords:
+            results.append({
+                'platform': 'Image Search',
+                'username': image_path,
+                'content': f"Information related to image {image_path} and keywords {filter_spec.keywords}",
+                'content_type': 'image_entry',
+                'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'url': 'https://example.com',
+                'interaction_user': image_path
+            })
+
+        logging.info(f"Extracted {len(results)} results for image {image_path}.")
+        return results
+    except Exception as e:
+        logging.error(f"Error searching for image {image_path}: {e}")
+        return []
+
+
+def search_audio(audio_path, filter_spec, max_results):
+    """Search for information related to a specific audio file.
+
+    Args:
+        audio_path (str): The path to the audio file to search for.
+        filter_spec (FilterSpec): The compiled keyword and date filters for the results.
+        max_results (int): Maximum number of results to retrieve.
+
+    Returns:
+        list: A list of dictionaries containing audio entry details.
+
+    Raises:
+        Exception: If searching for audio fails.
+    """
+    try:
+        results = []
+        # Example: Search for audio in public databases or audio recognition
+        # This is a placeholder and should be replaced with actual search logic
+        if filter_spec.keywords:
+            results.append({
+                'platform': 'Audio Search',
+                'username': audio_path,
+                'content': f"Information related to audio {audio_path} and keywords {filter_spec.keywords}",
+                'content_type': 'audio_entry',
+                'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'url': 'https://example.com',
+                'interaction_user': audio_path
+            })
+
+        logging.info(f"Extracted {len(results)} results for audio {audio_path}.")
+        return results
+    except Exception as e:
+        logging.error(f"Error searching for audio {audio_path}: {e}")
+        return []
+
+
+# Platform searches that need a pooled WebDriver
+BROWSER_SEARCHES = {
+    'Twitter': search_twitter,
+    'Instagram': search_instagram,
+    'Facebook': search_facebook,
+    'LinkedIn': search_linkedin,
+    'Reddit': search_reddit,
+    'Google': search_google,
+    'Google Scholar': search_google_scholar
+}
+
+# Platform searches that run without a browser
+DATABASE_SEARCHES = {
+    'Public Databases': search_public_databases,
+    'Private Databases': search_private_databases
+}
+
+
+# Identifier searches by identifier type, as (platform, search function) pairs
+IDENTIFIER_SEARCHES = {
+    'email': ('Email Search', search_email),
+    'user_id': ('User ID Search', search_user_id),
+    'national_id': ('National ID Search', search_national_id),
+    'passport_number': ('Passport Number Search', search_passport_number),
+    'account_number': ('Account Number Search', search_account_number)
+}
+
+
+def pooled_search(driver_pool, search_func, platform):
+    """Wrap a browser search function so it runs on a driver leased from a pool.
+
+    Platforms that do not require JavaScript receive the pool itself, so a driver is only
+    leased if their HTTP fast path comes back empty.
+
+    Args:
+        driver_pool (DriverPool): The pool to lease drivers from.
+        search_func (callable): A search function taking the driver as its first argument.
+        platform (str): The platform name used to look up PLATFORM_CAPABILITIES.
+
+    Returns:
+        callable: A function with the same signature as search_func minus the driver argument.
+    """
+    def run(*args):
+        if not platform_requires_js(platform):
+            return search_func(driver_pool, *args)
+        with driver_pool.lease() as driver:
+            return search_func(driver, *args)
+
+    return run
+
+
+def parse_platform_limits(limits_input):
+    """Parse per-platform worker caps from the command line.
+
+    Args:
+        limits_input (str): Comma-separated ``Platform=N`` pairs, e.g. ``Twitter=2,Google=1``.
+
+    Returns:
+        dict: The default PLATFORM_WORKER_LIMITS updated with the parsed caps.
+    """
+    limits = dict(PLATFORM_WORKER_LIMITS)
+    if not limits_input:
+        return limits
+    for pair in limits_input.split(','):
+        try:
+            platform, limit = pair.split('=')
+            limits[platform.strip()] = max(1, int(limit))
+        except ValueError:
+            logging.warning(f"Ignoring invalid platform worker limit: {pair}")
+    return limits
+
+
+def run_searches_concurrently(tasks, max_workers=MAX_WORKERS, platform_limits=None, max_pending=SEARCH_MAX_PENDING):
+    """Run search tasks in parallel and yield their results as they complete.
+
+    The number of running tasks never exceeds max_workers, and the number of running tasks
+    for a single platform never exceeds its entry in platform_limits. Tasks waiting on a
+    platform cap do not occupy a worker thread. Tasks are pulled from the iterable only as
+    room frees up, so at most max_pending of them are held at once and a generator of
+    tasks (e.g. one per identifier of a large file) is never materialised.
+
+    Args:
+        tasks (iterable): ``(platform, search_func, args)`` tuples.
+        max_workers (int): Global cap on concurrently running tasks (default is MAX_WORKERS).
+        platform_limits (dict): Per-platform caps on concurrently running tasks (default is PLATFORM_WORKER_LIMITS).
+        max_pending (int): The maximum number of tasks read ahead of the running ones (default is SEARCH_MAX_PENDING).
+
+    Yields:
+        tuple: A ``(platform, results)`` pair for every task, in completion order.
+               Tasks that raise yield an empty result list.
+    """
+    platform_limits = PLATFORM_WORKER_LIMITS if platform_limits is None else platform_limits
+    max_workers = max(1, max_workers)
+    tasks = iter(tasks)
+    pending = []
+    running = {}
+    active = defaultdict(int)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='search') as executor:
+        while True:
+            pending.extend(itertools.islice(tasks, max(1, max_pending) - len(pending)))
+            if not pending and not running:
+                return
+            for task in list(pending):
+                if len(running) >= max_workers:
+                    break
+                platform, search_func, args = task
+                limit = platform_limits.get(platform)
+                if limit and active[platform] >= limit:
+                    continue
+                pending.remove(task)
+                running[executor.submit(search_func, *args)] = platform
+                active[platform] += 1
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                platform = running.pop(future)
+                active[platform] -= 1
+                try:
+                    results = future.result()
+                except Exception as e:
+                    logging.error(f"Error running {platform} search: {e}")
+                    results = []
+                logging.info(f"{platform} search finished with {len(results)} result(s).")
+                yield platform, results
+
+
+def extract_metadata(file_path):
+    """Extract metadata from a file.
+
+    Args:
+        file_path (str): The path to the file to extract metadata from.
+
+    Returns:
+        dict: A dictionary containing metadata.
+
+    Raises:
+        Exception: If extracting metadata fails.
+    """
+    try:
+        if file_path.endswith('.jpg') or file_path.endswith('.jpeg') or file_path.endswith('.png'):
+            with open(file_path, 'rb') as f:
+                tags = exifread.process_file(f)
+                return tags
+        elif file_path.endswith('.mp3') or file_path.endswith('.wav'):
+            audio = pydub.AudioSegment.from_file(file_path)
+            return {
+                'duration': len(audio),
+                'channels': audio.channels,
+                'frame_rate': audio.frame_rate,
+                'sample_width': audio.sample_width
+            }
+        else:
+            logging.error(f"Unsupported file format for metadata extraction: {file_path}")
+            return None
+    except Exception as e:
+        logging.error(f"Error extracting metadata from file {file_path}: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_record_date(value):
+    """Parse the date of a scraped record into a naive UTC datetime.
+
+    Handles both the '%Y-%m-%d %H:%M:%S' format used by most platforms and the ISO 8601
+    timestamps returned by Twitter. Results are cached because many records share a date.
+
+    Args:
+        value (str): The date string.
+
+    Returns:
+        datetime: The parsed date.
+
+    Raises:
+        ValueError: If the date cannot be parsed.
+    """
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        parsed = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def compute_fingerprint(platform, url, content):
+    """Compute the natural key of a scraped record.
+
+    Args:
+        platform (str): The platform the record was scraped from.
+        url (str): The URL of the record.
+        content (str): The content of the record.
+
+    Returns:
+        str: A hex SHA-256 digest of the platform, URL and content.
+    """
+    return hashlib.sha256(f"{platform or ''}\x1f{url or ''}\x1f{content or ''}".encode()).hexdigest()
+
+
+def bulk_insert_scraped_data(connection, data, batch_size=DB_BATCH_SIZE):
+    """Upsert scraped records with chunked executemany calls.
+
+    Records are keyed by their fingerprint, so re-scraping a record updates its row
+    instead of appending a duplicate. A date that cannot be parsed is stored as NULL
+    rather than failing its whole batch.
+
+    Args:
+        connection (sqlalchemy.engine.Connection): The connection to insert with, inside a transaction.
+        data (iterable): Dictionaries containing the records to insert.
+        batch_size (int): The number of rows per executemany call (default is DB_BATCH_SIZE).
+
+    Returns:
+        int: The number of records written (inserted or updated).
+    """
+    statement = sqlite_insert(ScrapedData.__table__)
+    statement = statement.on_conflict_do_update(
+        index_elements=['fingerprint'],
+        set_={
+            **{column: statement.excluded[column]
+               for column in ('username', 'content_type', 'date', 'interaction_user')},
+            # A re-scrape without sentiment analysis keeps the previously stored score.
+            'sentiment': func.coalesce(statement.excluded.sentiment, ScrapedData.__table__.c.sentiment)
+        }
+    )
+    records = iter(data)
+    inserted = 0
+    while True:
+        rows = [{
+            'fingerprint': compute_fingerprint(item['platform'], item['url'], item['content']),
+            'platform': item['platform'],
+            'username': item['username'],
+            'content': item['content'],
+            'content_type': item['content_type'],
+            'date': parse_record_date_or_none(item.get('date')),
+            'url': item['url'],
+            'interaction_user': item.get('interaction_user', ''),
+            'sentiment': item.get('sentiment')
+        } for item in itertools.islice(records, batch_size)]
+        if not rows:
+            return inserted
+        connection.execute(statement, rows)
+        inserted += len(rows)
+
+
+class DatabaseWriter:
+    """Serialises scraped-data writes through a single writer thread.
+
+    SQLite allows one writer at a time, so instead of letting every producer thread compete
+    for the write lock, producers queue their records and one thread writes them. Jobs that
+    are already waiting when the writer becomes free are committed in the same transaction;
+    if that transaction fails, each job is retried in its own transaction so only the bad
+    job fails. The queue is bounded, so producers block instead of buffering without limit.
+
+    Args:
+        sqlite_engine (sqlalchemy.engine.Engine): The engine to write with (default is engine).
+        max_queue_size (int): The maximum number of queued write jobs (default is DB_WRITE_QUEUE_SIZE).
+    """
+
+    def __init__(self, sqlite_engine=None, max_queue_size=DB_WRITE_QUEUE_SIZE):
+        self.engine = sqlite_engine or engine
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name='database-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, data, username):
+        """Queue records for writing.
+
+        Args:
+            data (list): A list of dictionaries containing data to save.
+            username (str): The username associated with the data.
+
+        Returns:
+            Future: Resolves to the number of rows written, or to the write error.
+        """
+        future = Future()
+        self._queue.put((list(data), username, future))
+        return future
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            jobs = [job]
+            while True:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._write(jobs)
+                    return
+                jobs.append(job)
+            self._write(jobs)
+
+    def _write(self, jobs):
+        try:
+            with self.engine.begin() as connection:
+                counts = [bulk_insert_scraped_data(connection, data) for data, _, _ in jobs]
+        except Exception as e:
+            if len(jobs) == 1:
+                jobs[0][2].set_exception(e)
+                return
+            # One job broke the shared transaction; retry them separately to isolate it.
+            logging.warning(f"Batched database write failed, retrying {len(jobs)} jobs separately: {e}")
+            for job in jobs:
+                self._write([job])
+            return
+        for (_, username, future), inserted in zip(jobs, counts):
+            logging.info(f"Data saved to database for user {username} ({inserted} rows).")
+            future.set_result(inserted)
+
+    def close(self):
+        """Write everything still queued and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+
+database_writer = None
+DATABASE_WRITER_LOCK = threading.Lock()
+
+
+def get_database_writer():
+    """Return the shared DatabaseWriter, starting it on first use.
+
+    Returns:
+        DatabaseWriter: The shared writer.
+    """
+    global database_writer
+    with DATABASE_WRITER_LOCK:
+        if database_writer is None:
+            database_writer = DatabaseWriter()
+        return database_writer
+
+
+def close_database_writer():
+    """Flush and stop the shared DatabaseWriter if it was started."""
+    global database_writer
+    with DATABASE_WRITER_LOCK:
+        if database_writer is not None:
+            database_writer.close()
+            database_writer = None
+
+
+def save_to_database(data, username):
+    """Save data to the SQLite database.
+
+    The records are written by the shared DatabaseWriter; this call blocks until they are
+    committed, so it is safe to call from any number of threads.
+
+    Args:
+        data (list): A list of dictionaries containing data to save.
+        username (str): The username associated with the data.
+
+    Raises:
+        Exception: If saving data to the database fails.
+    """
+    try:
+        get_database_writer().submit(data, username).result()
+    except Exception as e:
+        logging.error(f"Error saving data to database for user {username}: {e}")
+        raise
+
+
+def compact_database(sqlite_engine=None):
+    """Remove duplicate scraped records and fill in missing fingerprints.
+
+    Rows written before fingerprints existed have none, so re-runs appended copies of them.
+    This keeps the oldest row of every platform/URL/content combination, fingerprints the
+    survivors and reclaims the freed space. It only needs to run once per existing database.
+
+    Args:
+        sqlite_engine (sqlalchemy.engine.Engine): The engine of the database to compact (default is engine).
+
+    Returns:
+        int: The number of duplicate rows removed.
+    """
+    sqlite_engine = sqlite_engine or engine
+    raw_connection = sqlite_engine.raw_connection()
+    try:
+        dbapi_connection = raw_connection.driver_connection
+        dbapi_connection.create_function('scraper_fingerprint', 3, compute_fingerprint, deterministic=True)
+        cursor = dbapi_connection.cursor()
+        cursor.execute("DROP TABLE IF EXISTS temp.scraped_fingerprints")
+        cursor.execute("CREATE TEMP TABLE scraped_fingerprints AS SELECT id, "
+                       "COALESCE(fingerprint, scraper_fingerprint(platform, url, content)) AS fingerprint "
+                       "FROM scraped_data")
+        cursor.execute("CREATE INDEX temp.ix_scraped_fingerprints_id ON scraped_fingerprints (id)")
+        cursor.execute("DELETE FROM scraped_data WHERE id NOT IN "
+                       "(SELECT MIN(id) FROM scraped_fingerprints GROUP BY fingerprint)")
+        removed = cursor.rowcount
+        cursor.execute("UPDATE scraped_data SET fingerprint = "
+                       "(SELECT fingerprint FROM scraped_fingerprints WHERE scraped_fingerprints.id = scraped_data.id) "
+                       "WHERE fingerprint IS NULL")
+        cursor.execute("DROP TABLE temp.scraped_fingerprints")
+        dbapi_connection.commit()
+        cursor.execute("VACUUM")
+        cursor.close()
+    except Exception as e:
+        logging.error(f"Error compacting database: {e}")
+        raw_connection.rollback()
+        raise
+    finally:
+        raw_connection.close()
+    logging.info(f"Database compacted: removed {removed} duplicate rows.")
+    return removed
+
+
+def benchmark_database_writes(row_counts=(100_000, 1_000_000), batch_size=DB_BATCH_SIZE):
+    """Benchmark the bulk write path against a scratch database.
+
+    Each run creates a fresh database file with the same schema, pragmas and indexes as
+    DATABASE_FILE and inserts synthetic records through bulk_insert_scraped_data.
+
+    Args:
+        row_counts (tuple): The numbers of rows to write, one run each (default is 100k and 1M).
+        batch_size (int): The number of rows per executemany call (default is DB_BATCH_SIZE).
+
+    Returns:
+        dict: A dictionary mapping each row count to the measured rows per second.
+    """
+    platforms = ['Telegram', 'Twitter', 'Instagram', 'Facebook', 'LinkedIn', 'Reddit', 'Google']
+    results = {}
+    for row_count in row_counts:
+        with tempfile.TemporaryDirectory() as scratch_dir:
+            scratch_engine = create_engine(f"sqlite:///{os.path.join(scratch_dir, 'benchmark.db')}")
+            apply_sqlite_pragmas(scratch_engine)
+            migrate_schema(scratch_engine)
+            records = ({
+                'platform': platforms[n % len(platforms)],
+                'username': f"user{n % 1000}",
+                'content': f"Benchmark content {n} " * 4,
+                'content_type': 'post',
+                'date': (datetime(2024, 1, 1) + timedelta(minutes=n)).strftime('%Y-%m-%d %H:%M:%S'),
+                'url': f"https://example.com/{n}",
+                'interaction_user': f"user{n % 1000}"
+            } for n in range(row_count))
+            start = time.perf_counter()
+            with scratch_engine.begin() as connection:
+                bulk_insert_scraped_data(connection, records, batch_size)
+            elapsed = time.perf_counter() - start
+            scratch_engine.dispose()
+        results[row_count] = row_count / elapsed
+        logging.info(f"Wrote {row_count} rows in {elapsed:.2f}s ({results[row_count]:,.0f} rows/sec).")
+    return results
+
+
+def parse_record_date_or_none(value):
+    """Parse the date of a scraped record, logging and returning None if it is invalid.
+
+    Args:
+        value (str): The date string.
+
+    Returns:
+        datetime: The parsed date, or None if it cannot be parsed.
+    """
+    try:
+        return parse_record_date(value)
+    except (TypeError, ValueError, AttributeError):
+        logging.warning(f"Unparseable record date: {value!r}")
+        return None
+
+
+def format_record_date(value):
+    """Normalise the date of a scraped record to RECORD_DATE_FORMAT (naive UTC).
+
+    Args:
+        value (str): The date string.
+
+    Returns:
+        str: The formatted date, or an empty string if it cannot be parsed.
+    """
+    date = parse_record_date_or_none(value)
+    return date.strftime(RECORD_DATE_FORMAT) if date else ''
+
+
+def build_results_frame(data):
+    """Build the typed DataFrame shared by the exporters and the visualizer.
+
+    Platform and content type become categoricals, dates become real datetimes and the
+    free-text columns use the pandas string dtype, which keeps large result sets far
+    smaller than the default object columns.
+
+    Args:
+        data (list): A list of dictionaries containing scraped records.
+
+    Returns:
+        DataFrame: One row per record with the columns in RECORD_FIELDS. Unparseable dates become NaT.
+    """
+    frame = pd.DataFrame.from_records(data, columns=RECORD_FIELDS)
+    frame['interaction_user'] = frame['interaction_user'].fillna('')
+    frame['date'] = pd.to_datetime(frame['date'].map(parse_record_date_or_none, na_action='ignore'))
+    return frame.astype({
+        'platform': 'category',
+        'content_type': 'category',
+        'username': 'string',
+        'content': 'string',
+        'url': 'string',
+        'interaction_user': 'string',
+        'sentiment': 'float64'
+    })
+
+
+def records_from_frame(frame):
+    """Convert a results frame back into record dictionaries for record-oriented sinks.
+
+    Args:
+        frame (DataFrame): A frame built by build_results_frame().
+
+    Returns:
+        list: A list of dictionaries with dates formatted as RECORD_DATE_FORMAT.
+    """
+    formatted = frame.assign(date=frame['date'].dt.strftime(RECORD_DATE_FORMAT))
+    return formatted.astype(object).where(formatted.notna(), None).to_dict('records')
+
+
+class ResultSink(ABC):
+    """Base class for incremental writers of scraped records.
+
+    A sink is opened once per job, receives records through write() as soon as a platform
+    yields them and finalises its output in close(), so memory stays bounded and records
+    reach the disk while the crawl is still running.
+
+    Args:
+        username (str): The username associated with the data.
+        output_folder (str): The folder holding one sub-folder per user (default is OUTPUT_FOLDER).
+    """
+
+    extension = None
+    description = None
+    consumes_frames = False
+
+    def __init__(self, username, output_folder=OUTPUT_FOLDER):
+        self.username = username
+        self.user_folder = os.path.join(output_folder, username)
+        self.path = os.path.join(self.user_folder, f"{username}.{self.extension}")
+        self.count = 0
+
+    def open(self):
+        """Prepare the output. Called once before the first write.
+
+        Returns:
+            ResultSink: The sink itself.
+        """
+        os.makedirs(self.user_folder, exist_ok=True)
+        return self
+
+    @abstractmethod
+    def write(self, records):
+        """Write a batch of records.
+
+        Args:
+            records (list): A list of dictionaries containing data to save.
+        """
+
+    def write_frame(self, frame):
+        """Write a batch of records already built by build_results_frame().
+
+        write_to_sinks() only calls this on sinks that set consumes_frames; other sinks
+        receive the frame converted back into records.
+
+        Args:
+            frame (DataFrame): The typed results frame.
+        """
+        self.write(records_from_frame(frame))
+
+    def close(self):
+        """Finalise the output. Called once after the last write."""
+        logging.info(f"Data saved to {self.description} for user {self.username} ({self.count} records).")
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class FileSink(ResultSink):
+    """A sink writing to a single text file that is flushed after every batch."""
+
+    def open(self):
+        super().open()
+        self._file = open(self.path, 'w', encoding='utf-8', newline='')
+        self.write_header()
+        return self
+
+    def write(self, records):
+        for item in records:
+            self.write_record(item)
+            self.count += 1
+        self._file.flush()
+
+    def close(self):
+        self.write_footer()
+        self._file.close()
+        super().close()
+
+    def write_header(self):
+        pass
+
+    @abstractmethod
+    def write_record(self, item):
+        """Write a single record to the file.
+
+        Args:
+            item (dict): The record to write.
+        """
+
+    def write_footer(self):
+        pass
+
+
+class TxtSink(FileSink):
+    extension = 'txt'
+    description = 'text file'
+
+    def write_record(self, item):
+        self._file.write(f"Platform: {item['platform']}\n")
+        self._file.write(f"Username: {item['username']}\n")
+        self._file.write(f"Content: {item['content']}\n")
+        self._file.write(f"Type: {item['content_type']}\n")
+        self._file.write(f"Date: {item['date']}\n")
+        self._file.write(f"URL: {item['url']}\n")
+        self._file.write(f"Interaction User: {item.get('interaction_user', 'N/A')}\n")
+        if item.get('sentiment') is not None:
+            self._file.write(f"Sentiment: {item['sentiment']:.4f}\n")
+        self._file.write("=" * 50 + "\n")
+
+
+class CsvSink(FileSink):
+    extension = 'csv'
+    description = 'CSV file'
+    consumes_frames = True
+
+    def write_header(self):
+        self._writer = csv.DictWriter(self._file, fieldnames=RECORD_FIELDS, extrasaction='ignore')
+        self._writer.writeheader()
+
+    def write_record(self, item):
+        # Dates are normalised exactly like write_frame() does, whichever path is used.
+        self._writer.writerow(dict(item, date=format_record_date(item['date'])))
+
+    def write_frame(self, frame):
+        frame.to_csv(self._file, columns=RECORD_FIELDS, header=False, index=False, date_format=RECORD_DATE_FORMAT)
+        self.count += len(frame)
+        self._file.flush()
+
+
+class JsonSink(FileSink):
+    """Streams records into a JSON array, one element at a time."""
+
+    extension = 'json'
+    description = 'JSON file'
+
+    def write_header(self):
+        self._file.write('[')
+
+    def write_record(self, item):
+        element = json.dumps(item, ensure_ascii=False, indent=4).replace('\n', '\n    ')
+        self._file.write(f"{',' if self.count else ''}\n    {element}")
+
+    def write_footer(self):
+        self._file.write('\n]\n')
+
+
+class JsonLinesSink(FileSink):
+    extension = 'jsonl'
+    description = 'JSON Lines file'
+
+    def write_record(self, item):
+        self._file.write(json.dumps(item, ensure_ascii=False) + '\n')
+
+
+HTML_REPORT_STYLE = """<style>
+body { font-family: sans-serif; margin: 2em; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: left; vertical-align: top; }
+td.content { white-space: pre-wrap; word-break: break-word; }
+nav { margin: 1em 0; }
+nav a { margin-right: 1em; }
+</style>"""
+
+HTML_SEARCH_SCRIPT = """<script src="search-index.js"></script>
+<script>
+(function () {
+    var input = document.getElementById('search');
+    var results = document.getElementById('results');
+    input.addEventListener('input', function () {
+        var query = input.value.trim().toLowerCase();
+        results.innerHTML = '';
+        if (query.length < 2) { return; }
+        var shown = 0;
+        for (var i = 0; i < window.SEARCH_INDEX.length && shown < 200; i++) {
+            var entry = window.SEARCH_INDEX[i];
+            if (entry[2].toLowerCase().indexOf(query) === -1 && entry[1].toLowerCase().indexOf(query) === -1) { continue; }
+            var item = document.createElement('li');
+            var link = document.createElement('a');
+            link.href = 'page-' + entry[0] + '.html#r' + i;
+            link.textContent = '[' + entry[1] + '] ' + entry[2];
+            item.appendChild(link);
+            results.appendChild(item);
+            shown++;
+        }
+    });
+})();
+</script>"""
+
+
+def html_link(url):
+    """Render a scraped URL for the HTML report.
+
+    Only http and https URLs become links; anything else (e.g. ``javascript:`` or ``data:``)
+    is shown as escaped text so it cannot run in the report.
+
+    Args:
+        url (str): The URL to render.
+
+    Returns:
+        str: The HTML fragment.
+    """
+    url = str(url or '').strip()
+    if urlparse(url).scheme.lower() in ('http', 'https'):
+        return f'<a href="{html.escape(url)}">Link</a>'
+    return html.escape(url)
+
+
+class HtmlSink(ResultSink):
+    """Streams records into a paginated HTML report.
+
+    Rows are written to ``page-N.html`` files of page_size rows each, with every value
+    escaped. When the sink is closed an ``index.html`` is written with per-platform counts,
+    links to every page and a client-side search over ``search-index.js``. The index is a
+    script rather than a JSON file so the report also works when opened from disk.
+
+    Args:
+        username (str): The username associated with the data.
+        output_folder (str): The folder holding one sub-folder per user (default is OUTPUT_FOLDER).
+        page_size (int): The number of rows per page (default is HTML_PAGE_SIZE).
+
+    Raises:
+        ValueError: If page_size is not positive.
+    """
+
+    extension = 'html'
+    description = 'HTML report'
+
+    def __init__(self, username, output_folder=OUTPUT_FOLDER, page_size=HTML_PAGE_SIZE):
+        super().__init__(username, output_folder)
+        if page_size <= 0:
+            raise ValueError(f"HTML page size must be positive, got {page_size}.")
+        self.page_size = page_size
+        self.report_folder = os.path.join(self.user_folder, f"{username}_html")
+        self.path = os.path.join(self.report_folder, 'index.html')
+
+    def open(self):
+        super().open()
+        os.makedirs(self.report_folder, exist_ok=True)
+        self._platform_counts = Counter()
+        self._page = None
+        self._page_number = 0
+        self._page_rows = 0
+        self._search_index = open(os.path.join(self.report_folder, 'search-index.js'), 'w', encoding='utf-8')
+        self._search_index.write('window.SEARCH_INDEX = [')
+        return self
+
+    def write(self, records):
+        for item in records:
+            if self._page is None or self._page_rows >= self.page_size:
+                self._start_page()
+            row_id = self.count
+            self._page.write(
+                f'<tr id="r{row_id}"><td>{html.escape(str(item["platform"]))}</td>'
+                f'<td>{html.escape(str(item["username"]))}</td>'
+                f'<td class="content">{html.escape(str(item["content"]))}</td>'
+                f'<td>{html.escape(str(item["content_type"]))}</td><td>{html.escape(str(item["date"]))}</td>'
+                f'<td>{html_link(item["url"])}</td>'
+                f'<td>{html.escape(str(item.get("interaction_user", "N/A")))}</td></tr>\n')
+            entry = [self._page_number, item['platform'], str(item['content'])[:HTML_SEARCH_SNIPPET_LENGTH]]
+            # "</" is escaped so the index can never close the script element it is loaded into.
+            entry_json = json.dumps(entry, ensure_ascii=False).replace('</', '<\\/')
+            self._search_index.write(f"{',' if row_id else ''}\n{entry_json}")
+            self._platform_counts[item['platform']] += 1
+            self._page_rows += 1
+            self.count += 1
+        if self._page is not None:
+            self._page.flush()
+        self._search_index.flush()
+
+    def _start_page(self):
+        self._finish_page(has_next=True)
+        self._page_number += 1
+        self._page_rows = 0
+        self._page = open(os.path.join(self.report_folder, f"page-{self._page_number}.html"), 'w', encoding='utf-8')
+        title = html.escape(f"Internet Data for {self.username} - page {self._page_number}")
+        self._page.write(f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{title}</title>\n')
+        self._page.write(f'{HTML_REPORT_STYLE}</head><body>\n<h1>{title}</h1>\n')
+        self._page.write('<table>\n<tr><th>Platform</th><th>Username</th><th>Content</th><th>Type</th><th>Date</th>'
+                         '<th>URL</th><th>Interaction User</th></tr>\n')
+
+    def _finish_page(self, has_next):
+        if self._page is None:
+            return
+        links = ['<a href="index.html">Index</a>']
+        if self._page_number > 1:
+            links.append(f'<a href="page-{self._page_number - 1}.html">Previous</a>')
+        if has_next:
+            links.append(f'<a href="page-{self._page_number + 1}.html">Next</a>')
+        self._page.write(f'</table>\n<nav>{"".join(links)}</nav>\n</body></html>\n')
+        self._page.close()
+        self._page = None
+
+    def close(self):
+        self._finish_page(has_next=False)
+        self._search_index.write('\n];\n')
+        self._search_index.close()
+        title = html.escape(f"Internet Data for {self.username}")
+        with open(self.path, 'w', encoding='utf-8') as index:
+            index.write(f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{title}</title>\n')
+            index.write(f'{HTML_REPORT_STYLE}</head><body>\n<h1>{title}</h1>\n')
+            index.write(f'<p>{self.count} records on {self._page_number} page(s).</p>\n')
+            index.write('<table>\n<tr><th>Platform</th><th>Records</th></tr>\n')
+            for platform, count in self._platform_counts.most_common():
+                index.write(f'<tr><td>{html.escape(str(platform))}</td><td>{count}</td></tr>\n')
+            index.write('</table>\n<nav>')
+            index.write(''.join(f'<a href="page-{number}.html">Page {number}</a>'
+                                for number in range(1, self._page_number + 1)))
+            index.write('</nav>\n<input id="search" type="search" placeholder="Search content..." size="50">\n')
+            index.write(f'<ul id="results"></ul>\n{HTML_SEARCH_SCRIPT}\n</body></html>\n')
+        super().close()
+
+
+class ExcelSink(ResultSink):
+    """Streams records into an Excel workbook using openpyxl's write-only mode.
+
+    Rows are appended as they arrive instead of building the whole workbook in memory.
+    A sheet that reaches Excel's row limit rolls over to a new sheet ("Data (2)", ...).
+
+    Args:
+        username (str): The username associated with the data.
+        output_folder (str): The folder holding one sub-folder per user (default is OUTPUT_FOLDER).
+        per_platform (bool): Write each platform to its own sheet (default is False).
+        max_rows (int): The maximum number of rows per sheet, header included (default is EXCEL_MAX_ROWS).
+    """
+
+    extension = 'xlsx'
+    description = 'Excel file'
+    consumes_frames = True
+
+    def __init__(self, username, output_folder=OUTPUT_FOLDER, per_platform=False, max_rows=EXCEL_MAX_ROWS):
+        super().__init__(username, output_folder)
+        self.per_platform = per_platform
+        self.max_rows = max_rows
+
+    def open(self):
+        super().open()
+        self._workbook = openpyxl.Workbook(write_only=True)
+        self._sheets = {}
+        self._sheet_names = set()
+        return self
+
+    def write(self, records):
+        for item in records:
+            self._append(item['platform'], (
+                item['platform'], item['username'], item['content'], item['content_type'],
+                parse_record_date_or_none(item.get('date')), item['url'], item.get('interaction_user', ''),
+                item.get('sentiment')
+            ))
+        self.count += len(records)
+
+    def write_frame(self, frame):
+        # openpyxl cannot write NaN, so missing values become empty cells.
+        columns = frame[RECORD_FIELDS]
+        for row in columns.astype(object).where(columns.notna(), None).itertuples(index=False, name=None):
+            self._append(row[0], row)
+        self.count += len(frame)
+
+    def _append(self, platform, row):
+        group = platform if self.per_platform else 'Data'
+        state = self._sheets.get(group)
+        if state is None or state[1] >= self.max_rows:
+            state = self._sheets[group] = [self._create_sheet(group), 1]
+        state[0].append(row)
+        state[1] += 1
+
+    def _create_sheet(self, group):
+        # Sheet names are limited to 31 characters and may not contain []:*?/\
+        base = re.sub(r'[\[\]:*?/\\]', '_', str(group))[:31]
+        title, number = base, 1
+        while title in self._sheet_names:
+            number += 1
+            suffix = f" ({number})"
+            title = base[:31 - len(suffix)] + suffix
+        self._sheet_names.add(title)
+        sheet = self._workbook.create_sheet(title=title)
+        sheet.append(RECORD_FIELDS)
+        return sheet
+
+    def close(self):
+        if not self._sheet_names:
+            self._create_sheet('Data')
+        self._workbook.save(self.path)
+        self._workbook.close()
+        super().close()
+
+
+class DatabaseSink(ResultSink):
+    """Queues records for the database writer in batches of DB_BATCH_SIZE.
+
+    Batches are written by the shared DatabaseWriter while scraping continues; close()
+    waits until every batch is committed.
+    """
+
+    description = 'database'
+
+    def open(self):
+        self._pending = []
+        self._writes = []
+        return self
+
+    def write(self, records):
+        self._pending.extend(records)
+        self.count += len(records)
+        if len(self._pending) >= DB_BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Queue the buffered records for the database writer."""
+        if self._pending:
+            self._writes.append(get_database_writer().submit(self._pending, self.username))
+            self._pending = []
+
+    def close(self):
+        self.flush()
+        writes, self._writes = self._writes, []
+        for write in writes:
+            write.result()
+        super().close()
+
+
+def open_sinks(save_formats, username, sink_options=None):
+    """Open one sink per requested save format.
+
+    Args:
+        save_formats (list): The requested formats (keys of SINK_FORMATS). Unknown formats are skipped.
+        username (str): The username associated with the data.
+        sink_options (dict): Extra constructor arguments per format, e.g. {'xlsx': {'per_platform': True}}
+            (default is None).
 
     Returns:
-        list: A list of dictionaries containing image entry details.
-
-    Raises:
-        Exception: If searching for image fails.
+        list: The opened ResultSink instances.
     """
+    sinks = []
     try:
-        results = []
-        # Example: Search for image in public databases or reverse image search
-        # This is a placeholder and should be replaced with actual search logic
-        if keywords:
-            results.append({
-                'platform': 'Image Search',
-                'username': image_path,
-                'content': f"Information related to image {image_path} and keywords {keywords}",
-                'content_type': 'image_entry',
-                'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'url': 'https://example.com',
-                'interaction_user': image_path
-            })
+        for save_format in save_formats:
+            sink_class = SINK_FORMATS.get(save_format.strip())
+            if sink_class is None:
+                logging.warning(f"Unsupported save format: {save_format}")
+                continue
+            options = (sink_options or {}).get(save_format.strip(), {})
+            sinks.append(sink_class(username, **options).open())
+    except Exception:
+        close_sinks(sinks)
+        raise
+    return sinks
 
-        logging.info(f"Extracted {len(results)} results for image {image_path}.")
-        return results
-    except Exception as e:
-        logging.error(f"Error searching for image {image_path}: {e}")
-        return []
 
+def close_sinks(sinks):
+    """Close every sink, logging failures instead of stopping at the first one.
 
-def search_audio(audio_path, keywords, start_date, end_date, max_results):
-    """Search for information related to a specific audio file.
+    Args:
+        sinks (list): The ResultSink instances to close.
+    """
+    for sink in sinks:
+        try:
+            sink.close()
+        except Exception as e:
+            logging.error(f"Error closing {sink.description} for user {sink.username}: {e}")
+
+
+def write_to_sinks(sinks, data, frame=None):
+    """Write one batch of records to every sink.
+
+    The typed results frame is built at most once per batch and shared by every sink that
+    consumes frames; record-oriented sinks receive the dictionaries directly.
 
     Args:
-        audio_path (str): The path to the audio file to search for.
-        keywords (list): List of keywords to filter results.
-        start_date (str): Start date for filtering results (format: YYYY-MM-DD).
-        end_date (str): End date for filtering results (format: YYYY-MM-DD).
-        max_results (int): Maximum number of results to retrieve.
+        sinks (list): The opened ResultSink instances.
+        data (list or DataFrame): The records, as dictionaries or as a frame from build_results_frame().
+        frame (DataFrame): The already built frame for data, if any (default is None).
 
     Returns:
-        list: A list of dictionaries containing audio entry details.
-
-    Raises:
-        Exception: If searching for audio fails.
+        DataFrame: The results frame if one was built or given, otherwise None.
     """
-    try:
-        results = []
-        # Example: Search for audio in public databases or audio recognition
-        # This is a placeholder and should be replaced with actual search logic
-        if keywords:
-            results.append({
-                'platform': 'Audio Search',
-                'username': audio_path,
-                'content': f"Information related to audio {audio_path} and keywords {keywords}",
-                'content_type': 'audio_entry',
-                'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'url': 'https://example.com',
-                'interaction_user': audio_path
-            })
+    records = None
+    if isinstance(data, pd.DataFrame):
+        frame = data
+    else:
+        records = data
+    for sink in sinks:
+        if sink.consumes_frames:
+            if frame is None:
+                frame = build_results_frame(records)
+            sink.write_frame(frame)
+        else:
+            if records is None:
+                records = records_from_frame(frame)
+            sink.write(records)
+    return frame
 
-        logging.info(f"Extracted {len(results)} results for audio {audio_path}.")
-        return results
-    except Exception as e:
-        logging.error(f"Error searching for audio {audio_path}: {e}")
-        return []
 
+class ResultPipeline:
+    """Validates, enriches and writes result batches on a background thread.
 
-def extract_metadata(file_path):
-    """Extract metadata from a file.
+    The scraping loop only queues validations and hands each batch over, so the remaining
+    searches keep running while earlier batches are validated, scored and written. Once a
+    validation reports an expired subscription, the batch and every later one is dropped.
 
     Args:
-        file_path (str): The path to the file to extract metadata from.
+        sinks (list): The opened ResultSink instances.
+        validator (ScriptValidationClient): The client validating every record.
+        username (str): The username associated with the data.
+        sentiment_stage (SentimentStage): The stage scoring every record, or None (default is None).
+        max_pending (int): The maximum number of queued batches (default is RESULT_QUEUE_SIZE).
+    """
 
-    Returns:
-        dict: A dictionary containing metadata.
+    def __init__(self, sinks, validator, username, sentiment_stage=None, max_pending=RESULT_QUEUE_SIZE):
+        self.sinks = sinks
+        self.validator = validator
+        self.username = username
+        self.sentiment_stage = sentiment_stage
+        self.platform_counts = Counter()
+        self.expired = threading.Event()
+        self.error = None
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name='result-pipeline', daemon=True)
+        self._thread.start()
+
+    def put(self, results):
+        """Queue a batch of records; validation requests are sent right away.
+
+        Args:
+            results (list): A list of dictionaries containing scraped records.
+        """
+        validations = [self.validator.submit(item['content']) for item in results]
+        self.validator.flush()
+        self._queue.put((results, validations))
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            if self.expired.is_set() or self.error is not None:
+                continue
+            results, validations = job
+            try:
+                for validation in validations:
+                    is_valid, message = validation.result()
+                    if not is_valid:
+                        logging.warning(f"Script validation failed for {self.username}: {message}")
+                        if "expired" in message.lower():
+                            self.expired.set()
+                            break
+                if self.expired.is_set():
+                    continue
+                if self.sentiment_stage:
+                    self.sentiment_stage.enrich(results)
+                write_to_sinks(self.sinks, results)
+                self.platform_counts.update(item['platform'] for item in results)
+            except Exception as e:
+                logging.error(f"Error writing results for user {self.username}: {e}")
+                self.error = e
 
-    Raises:
-        Exception: If extracting metadata fails.
-    """
-    try:
-        if file_path.endswith('.jpg') or file_path.endswith('.jpeg') or file_path.endswith('.png'):
-            with open(file_path, 'rb') as f:
-                tags = exifread.process_file(f)
-                return tags
-        elif file_path.endswith('.mp3') or file_path.endswith('.wav'):
-            audio = AudioSegment.from_file(file_path)
-            return {
-                'duration': len(audio),
-                'channels': audio.channels,
-                'frame_rate': audio.frame_rate,
-                'sample_width': audio.sample_width
-            }
-        else:
-            logging.error(f"Unsupported file format for metadata extraction: {file_path}")
-            return None
-    except Exception as e:
-        logging.error(f"Error extracting metadata from file {file_path}: {e}")
-        return None
+    def close(self):
+        """Process every queued batch and stop the background thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
 
 
-def save_to_database(data, username):
-    """Save data to the SQLite database.
+def save_with_sink(sink_class, data, username, **options):
+    """Write a complete result set through a single sink.
 
     Args:
-        data (list): A list of dictionaries containing data to save.
+        sink_class (type): The ResultSink subclass to use.
+        data (list or DataFrame): The records, as dictionaries or as a frame from build_results_frame().
         username (str): The username associated with the data.
+        **options: Extra arguments passed to the sink constructor.
 
     Raises:
-        Exception: If saving data to the database fails.
+        Exception: If saving the data fails.
     """
     try:
-        for item in data:
-            scraped_data = ScrapedData(
-                platform=item['platform'],
-                username=item['username'],
-                content=item['content'],
-                content_type=item['content_type'],
-                date=datetime.strptime(item['date'], '%Y-%m-%d %H:%M:%S'),
-                url=item['url'],
-                interaction_user=item.get('interaction_user', '')
-            )
-            session.add(scraped_data)
-        session.commit()
-        logging.info(f"Data saved to database for user {username}.")
+        with sink_class(username, **options) as sink:
+            write_to_sinks([sink], data)
     except Exception as e:
-        logging.error(f"Error saving data to database for user {username}: {e}")
+        logging.error(f"Error saving data to {sink_class.description} for user {username}: {e}")
         raise
 
 
@@ -1662,44 +4418,20 @@ def save_to_txt(data, username):
     Raises:
         Exception: If saving data to text file fails.
     """
-    try:
-        user_folder = os.path.join(OUTPUT_FOLDER, username)
-        os.makedirs(user_folder, exist_ok=True)
-        with open(os.path.join(user_folder, f"{username}.txt"), 'w', encoding='utf-8') as f:
-            for item in data:
-                f.write(f"Platform: {item['platform']}\n")
-                f.write(f"Username: {item['username']}\n")
-                f.write(f"Content: {item['content']}\n")
-                f.write(f"Type: {item['content_type']}\n")
-                f.write(f"Date: {item['date']}\n")
-                f.write(f"URL: {item['url']}\n")
-                f.write(f"Interaction User: {item.get('interaction_user', 'N/A')}\n")
-                f.write("=" * 50 + "\n")
-        logging.info(f"Data saved to text file for user {username}.")
-    except Exception as e:
-        logging.error(f"Error saving data to text file for user {username}: {e}")
-        raise
+    save_with_sink(TxtSink, data, username)
 
 
 def save_to_csv(data, username):
     """Save data to a CSV file.
 
     Args:
-        data (list): A list of dictionaries containing data to save.
+        data (list or DataFrame): The records, as dictionaries or as a frame from build_results_frame().
         username (str): The username associated with the data.
 
     Raises:
         Exception: If saving data to CSV file fails.
     """
-    try:
-        user_folder = os.path.join(OUTPUT_FOLDER, username)
-        os.makedirs(user_folder, exist_ok=True)
-        df = pd.DataFrame(data)
-        df.to_csv(os.path.join(user_folder, f"{username}.csv"), index=False)
-        logging.info(f"Data saved to CSV file for user {username}.")
-    except Exception as e:
-        logging.error(f"Error saving data to CSV file for user {username}: {e}")
-        raise
+    save_with_sink(CsvSink, data, username)
 
 
 def save_to_json(data, username):
@@ -1712,92 +4444,375 @@ def save_to_json(data, username):
     Raises:
         Exception: If saving data to JSON file fails.
     """
-    try:
-        user_folder = os.path.join(OUTPUT_FOLDER, username)
-        os.makedirs(user_folder, exist_ok=True)
-        with open(os.path.join(user_folder, f"{username}.json"), 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        logging.info(f"Data saved to JSON file for user {username}.")
-    except Exception as e:
-        logging.error(f"Error saving data to JSON file for user {username}: {e}")
-        raise
+    save_with_sink(JsonSink, data, username)
+
+
+def save_to_jsonl(data, username):
+    """Save data to a JSON Lines file.
+
+    Args:
+        data (list): A list of dictionaries containing data to save.
+        username (str): The username associated with the data.
+
+    Raises:
+        Exception: If saving data to JSON Lines file fails.
+    """
+    save_with_sink(JsonLinesSink, data, username)
 
 
-def save_to_html(data, username):
-    """Save data to an HTML file.
+def save_to_html(data, username, page_size=HTML_PAGE_SIZE):
+    """Save data to a paginated HTML report.
 
     Args:
         data (list): A list of dictionaries containing data to save.
         username (str): The username associated with the data.
+        page_size (int): The number of rows per page (default is HTML_PAGE_SIZE).
 
     Raises:
         Exception: If saving data to HTML file fails.
     """
-    try:
-        user_folder = os.path.join(OUTPUT_FOLDER, username)
-        os.makedirs(user_folder, exist_ok=True)
-        with open(os.path.join(user_folder, f"{username}.html"), 'w', encoding='utf-8') as f:
-            f.write('<html><body>\n')
-            f.write(f'<h1>Internet Data for {username}</h1>\n')
-            f.write('<table border="1">\n')
-            f.write(
-                '<tr><th>Platform</th><th>Username</th><th>Content</th><th>Type</th><th>Date</th><th>URL</th><th>Interaction User</th></tr>\n')
-            for item in data:
-                f.write(
-                    f'<tr><td>{item["platform"]}</td><td>{item["username"]}</td><td>{item["content"]}</td><td>{item["content_type"]}</td><td>{item["date"]}</td><td><a href="{item["url"]}">Link</a></td><td>{item.get("interaction_user", "N/A")}</td></tr>\n')
-            f.write('</table>\n')
-            f.write('</body></html>\n')
-        logging.info(f"Data saved to HTML file for user {username}.")
-    except Exception as e:
-        logging.error(f"Error saving data to HTML file for user {username}: {e}")
-        raise
+    save_with_sink(HtmlSink, data, username, page_size=page_size)
 
 
-def save_to_excel(data, username):
+def save_to_excel(data, username, per_platform=False):
     """Save data to an Excel file.
 
     Args:
-        data (list): A list of dictionaries containing data to save.
+        data (list or DataFrame): The records, as dictionaries or as a frame from build_results_frame().
         username (str): The username associated with the data.
+        per_platform (bool): Write each platform to its own sheet (default is False).
 
     Raises:
         Exception: If saving data to Excel file fails.
     """
-    try:
-        user_folder = os.path.join(OUTPUT_FOLDER, username)
-        os.makedirs(user_folder, exist_ok=True)
-        df = pd.DataFrame(data)
-        df.to_excel(os.path.join(user_folder, f"{username}.xlsx"), index=False)
-        logging.info(f"Data saved to Excel file for user {username}.")
-    except Exception as e:
-        logging.error(f"Error saving data to Excel file for user {username}: {e}")
-        raise
+    save_with_sink(ExcelSink, data, username, per_platform=per_platform)
 
 
-def visualize_data(data, username):
-    """Visualize data using Matplotlib and Seaborn.
+class ParquetSink(ResultSink):
+    """Streams records into compressed, partitioned Parquet files.
+
+    Records are buffered per partition and written as a row group whenever a partition
+    holds row_group_size records. When all partitions together hold max_buffered_rows
+    records, the largest ones are written early, so the full result set is never materialised.
+    Files are laid out Hive-style (e.g. ``platform=Twitter/day=2024-01-31/part-0.parquet``)
+    under ``<username>_parquet``; partition columns are encoded in the path instead of the
+    files. Records whose date cannot be parsed get a null date and go to the ``day=unknown``
+    partition. Low-cardinality columns are stored dictionary-encoded.
+
+    Args:
+        username (str): The username associated with the data.
+        output_folder (str): The folder holding one sub-folder per user (default is OUTPUT_FOLDER).
+        partition_by (list): Partition keys, any of 'platform' and 'day' (default is PARQUET_PARTITION_BY).
+        compression (str): The Parquet compression codec (default is PARQUET_COMPRESSION).
+        row_group_size (int): The number of records per row group (default is PARQUET_ROW_GROUP_SIZE).
+        max_buffered_rows (int): The maximum number of records buffered across all partitions
+            (default is PARQUET_MAX_BUFFERED_ROWS).
+
+    Raises:
+        ValueError: If a partition key is not one of PARQUET_PARTITION_KEYS.
+    """
+
+    extension = 'parquet'
+    description = 'Parquet dataset'
+
+    def __init__(self, username, output_folder=OUTPUT_FOLDER, partition_by=None, compression=PARQUET_COMPRESSION,
+                 row_group_size=PARQUET_ROW_GROUP_SIZE, max_buffered_rows=PARQUET_MAX_BUFFERED_ROWS):
+        super().__init__(username, output_folder)
+        self.partition_by = list(PARQUET_PARTITION_BY if partition_by is None else partition_by)
+        unknown = [key for key in self.partition_by if key not in PARQUET_PARTITION_KEYS]
+        if unknown:
+            raise ValueError(f"Unsupported Parquet partition keys {unknown}; use any of {list(PARQUET_PARTITION_KEYS)}.")
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.max_buffered_rows = max(row_group_size, max_buffered_rows)
+        if self.partition_by:
+            self.path = os.path.join(self.user_folder, f"{username}_parquet")
+
+    def open(self):
+        super().open()
+        fields = [
+            ('platform', pa.dictionary(pa.int32(), pa.string())),
+            ('username', pa.string()),
+            ('content', pa.string()),
+            ('content_type', pa.dictionary(pa.int32(), pa.string())),
+            ('date', pa.timestamp('us')),
+            ('url', pa.string()),
+            ('interaction_user', pa.string()),
+            ('sentiment', pa.float64())
+        ]
+        self._schema = pa.schema([(name, type_) for name, type_ in fields if name not in self.partition_by])
+        self._buffers = defaultdict(list)
+        self._buffered = 0
+        self._writers = OrderedDict()
+        self._parts = defaultdict(int)
+        return self
+
+    def write(self, records):
+        for item in records:
+            date = parse_record_date_or_none(item.get('date'))
+            row = {
+                'platform': item['platform'],
+                'username': item['username'],
+                'content': item['content'],
+                'content_type': item['content_type'],
+                'date': date,
+                'url': item['url'],
+                'interaction_user': item.get('interaction_user', ''),
+                'sentiment': item.get('sentiment')
+            }
+            partition = tuple((key, row['platform'] if key == 'platform' else
+                               date.strftime('%Y-%m-%d') if date else PARQUET_UNKNOWN_DAY)
+                              for key in self.partition_by)
+            buffer = self._buffers[partition]
+            buffer.append(row)
+            self._buffered += 1
+            self.count += 1
+            if len(buffer) >= self.row_group_size:
+                self._write_row_group(partition)
+            elif self._buffered >= self.max_buffered_rows:
+                # Write the largest partitions until half of the buffer budget is free again.
+                for largest in sorted(self._buffers, key=lambda key: len(self._buffers[key]), reverse=True):
+                    self._write_row_group(largest)
+                    if self._buffered <= self.max_buffered_rows // 2:
+                        break
+
+    def _write_row_group(self, partition):
+        rows = self._buffers.pop(partition, None)
+        if not rows:
+            return
+        self._buffered -= len(rows)
+        writer = self._writers.get(partition)
+        if writer is None:
+            writer = self._open_writer(partition)
+        else:
+            self._writers.move_to_end(partition)
+        writer.write_table(pa.Table.from_pylist(rows, schema=self._schema))
+
+    def _open_writer(self, partition):
+        # Keep the number of open files bounded; a partition seen again gets a new part file.
+        if len(self._writers) >= PARQUET_MAX_OPEN_WRITERS:
+            _, oldest = self._writers.popitem(last=False)
+            oldest.close()
+        if partition:
+            folder = os.path.join(self.path, *(f"{key}={quote(value, safe='')}" for key, value in partition))
+            os.makedirs(folder, exist_ok=True)
+            file_path = os.path.join(folder, f"part-{self._parts[partition]}.parquet")
+            self._parts[partition] += 1
+        else:
+            file_path = self.path
+        writer = pq.ParquetWriter(file_path, self._schema, compression=self.compression)
+        self._writers[partition] = writer
+        return writer
+
+    def close(self):
+        for partition in list(self._buffers):
+            self._write_row_group(partition)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+        super().close()
+
+
+def save_to_parquet(data, username):
+    """Save data to a partitioned Parquet dataset.
+
+    Args:
+        data (list): A list of dictionaries containing data to save.
+        username (str): The username associated with the data.
+
+    Raises:
+        Exception: If saving data to Parquet fails.
+    """
+    save_with_sink(ParquetSink, data, username)
+
+
+SINK_FORMATS = {
+    'txt': TxtSink,
+    'csv': CsvSink,
+    'json': JsonSink,
+    'jsonl': JsonLinesSink,
+    'html': HtmlSink,
+    'xlsx': ExcelSink,
+    'parquet': ParquetSink,
+    'db': DatabaseSink
+}
+
+
+def visualize_platform_counts(platform_counts, username):
+    """Plot how many records were scraped from each platform.
 
     Args:
-        data (list): A list of dictionaries containing data to visualize.
+        platform_counts (dict): A dictionary mapping platform names to record counts.
         username (str): The username associated with the data.
 
     Raises:
         Exception: If visualizing data fails.
     """
     try:
-        df = pd.DataFrame(data)
+        user_folder = os.path.join(OUTPUT_FOLDER, username)
+        os.makedirs(user_folder, exist_ok=True)
         plt.figure(figsize=(10, 6))
-        sns.countplot(x='platform', data=df)
+        sns.barplot(x=list(platform_counts.keys()), y=list(platform_counts.values()))
         plt.title(f"Data Distribution for {username}")
         plt.xlabel('Platform')
         plt.ylabel('Count')
-        plt.savefig(os.path.join(OUTPUT_FOLDER, username, f"{username}_data_distribution.png"))
+        plt.savefig(os.path.join(user_folder, f"{username}_data_distribution.png"))
         plt.close()
         logging.info(f"Data visualization saved for user {username}.")
     except Exception as e:
         logging.error(f"Error visualizing data for user {username}: {e}")
 
 
+def visualize_data(data, username):
+    """Visualize data using Matplotlib and Seaborn.
+
+    Args:
+        data (list or DataFrame): The records, as dictionaries or as a frame from build_results_frame().
+        username (str): The username associated with the data.
+
+    Raises:
+        Exception: If visualizing data fails.
+    """
+    if isinstance(data, pd.DataFrame):
+        counts = data['platform'].value_counts(sort=False)
+        platform_counts = {str(platform): int(count) for platform, count in counts.items() if count}
+    else:
+        platform_counts = Counter(item['platform'] for item in data)
+    visualize_platform_counts(platform_counts, username)
+
+
+_SENTIMENT_ANALYZER = None
+_SENTIMENT_ANALYZER_LOCK = threading.Lock()
+
+
+def get_sentiment_analyzer():
+    """Return the VADER analyzer of the current process, creating it on first use.
+
+    Creating the analyzer loads the VADER lexicon (downloading it if needed), so each process
+    does it only once, under a lock so concurrent callers do not race on the download.
+
+    Returns:
+        SentimentIntensityAnalyzer: The cached analyzer.
+    """
+    global _SENTIMENT_ANALYZER
+    with _SENTIMENT_ANALYZER_LOCK:
+        if _SENTIMENT_ANALYZER is None:
+            try:
+                _SENTIMENT_ANALYZER = nltk_sentiment.SentimentIntensityAnalyzer()
+            except LookupError:
+                nltk.download('vader_lexicon', quiet=True)
+                _SENTIMENT_ANALYZER = nltk_sentiment.SentimentIntensityAnalyzer()
+        return _SENTIMENT_ANALYZER
+
+
+def init_sentiment_worker():
+    """Load the VADER analyzer once when a sentiment worker process starts."""
+    get_sentiment_analyzer()
+
+
+def score_sentiment_batch(texts):
+    """Compute the VADER compound score of every text in a batch.
+
+    Runs inside the sentiment worker processes, so it must stay a module-level function.
+
+    Args:
+        texts (list): The texts to score.
+
+    Returns:
+        list: The compound scores, between -1 (negative) and 1 (positive).
+    """
+    analyzer = get_sentiment_analyzer()
+    return [analyzer.polarity_scores(source)['compound'] for source in texts]
+
+
+class SentimentStage:
+    """Enriches scraped records with a sentiment score.
+
+    Texts are scored in batches across a process pool, and scores are cached in memory by
+    content hash so repeated content (retweets, reposts, re-scrapes) is scored only once.
+    The lexicon is downloaded once in the parent before the pool starts. Workers are started
+    with the 'spawn' method, since forking the multithreaded scraper is unsafe, and each one
+    loads VADER once in its initializer. A single batch is scored in-process.
+
+    Args:
+        workers (int): The number of worker processes; 1 scores in-process (default is SENTIMENT_WORKERS).
+        batch_size (int): The number of texts sent to a worker at once (default is SENTIMENT_BATCH_SIZE).
+        cache_max_entries (int): The maximum number of cached scores (default is SENTIMENT_CACHE_MAX_ENTRIES).
+    """
+
+    def __init__(self, workers=SENTIMENT_WORKERS, batch_size=SENTIMENT_BATCH_SIZE,
+                 cache_max_entries=SENTIMENT_CACHE_MAX_ENTRIES):
+        self.workers = max(1, workers)
+        self.batch_size = batch_size
+        self.cache_max_entries = cache_max_entries
+        self._cache = OrderedDict()
+        self._executor = None
+        # Download the lexicon here, so the workers only ever load it from disk.
+        get_sentiment_analyzer()
+
+    @staticmethod
+    def make_key(content):
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def _score_batches(self, batches):
+        if self.workers == 1 or len(batches) == 1:
+            return [score_sentiment_batch(batch) for batch in batches]
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 mp_context=multiprocessing.get_context('spawn'),
+                                                 initializer=init_sentiment_worker)
+        return list(self._executor.map(score_sentiment_batch, batches))
+
+    def score_texts(self, texts):
+        """Score a list of texts, using the cache and the process pool.
+
+        Args:
+            texts (list): The texts to score.
+
+        Returns:
+            list: The compound score of every text, in order.
+        """
+        keys = [self.make_key(source) for source in texts]
+        pending = {}
+        for key, source in zip(keys, texts):
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            else:
+                pending.setdefault(key, source)
+
+        scores = {}
+        if pending:
+            pending_keys = list(pending)
+            batches = [[pending[key] for key in pending_keys[i:i + self.batch_size]]
+                       for i in range(0, len(pending_keys), self.batch_size)]
+            scores = dict(zip(pending_keys, itertools.chain.from_iterable(self._score_batches(batches))))
+        for key, score in scores.items():
+            self._cache[key] = score
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+
+        return [scores[key] if key in scores else self._cache[key] for key in keys]
+
+    def enrich(self, records):
+        """Write the sentiment score onto every record.
+
+        Args:
+            records (list): A list of dictionaries containing scraped records.
+
+        Returns:
+            list: The same records, each with a 'sentiment' key.
+        """
+        for item, score in zip(records, self.score_texts([str(item['content']) for item in records])):
+            item['sentiment'] = score
+        return records
+
+    def close(self):
+        """Shut down the worker processes, if they were started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
 def analyze_sentiment(text):
     """Analyze sentiment of the text using NLTK.
 
@@ -1811,8 +4826,7 @@ def analyze_sentiment(text):
         Exception: If analyzing sentiment fails.
     """
     try:
-        sia = SentimentIntensityAnalyzer()
-        sentiment = sia.polarity_scores(text)
+        sentiment = get_sentiment_analyzer().polarity_scores(text)
         return sentiment
     except Exception as e:
         logging.error(f"Error analyzing sentiment: {e}")
@@ -1827,13 +4841,22 @@ def parse_arguments():
     """
     parser = argparse.ArgumentParser(description='Internet Scraper')
     parser.add_argument('--usernames', type=str, help='Comma-separated list of usernames to search')
-    parser.add_argument('--keywords', type=str, help='Comma-separated list of keywords to search')
+    parser.add_argument('--keywords', type=str,
+                        help='Comma-separated list of keywords to search (prefix with - to exclude, '
+                             'wrap in double quotes for a whole-word match)')
+    parser.add_argument('--whole_words', action='store_true', help='Match every keyword as a whole word only')
     parser.add_argument('--start_date', type=str, help='Start date for search (YYYY-MM-DD)')
     parser.add_argument('--end_date', type=str, help='End date for search (YYYY-MM-DD)')
     parser.add_argument('--max_results', type=int, help='Maximum number of results to retrieve')
     parser.add_argument('--save_formats', type=str,
-                        help='Comma-separated list of formats to save data (txt, csv, json, html, xlsx, db)')
+                        help='Comma-separated list of formats to save data (txt, csv, json, jsonl, html, xlsx, parquet, db)')
+    parser.add_argument('--excel_per_platform', action='store_true',
+                        help='Write each platform to its own sheet in the Excel export')
+    parser.add_argument('--html_page_size', type=int, default=HTML_PAGE_SIZE,
+                        help='Number of rows per page in the HTML report')
     parser.add_argument('--proxy', type=str, help='Proxy to use for scraping')
+    parser.add_argument('--sentiment', action='store_true',
+                        help='Score the sentiment of every scraped item and store it with the results')
     parser.add_argument('--ocr_lang', type=str, default='eng', help='Language for OCR (e.g., eng, fas, ara, chi_sim)')
     parser.add_argument('--translate', action='store_true', help='Enable translation of extracted text')
     parser.add_argument('--dest_lang', type=str, default='en',
@@ -1845,7 +4868,38 @@ def parse_arguments():
     parser.add_argument('--account_number', type=str, help='Account number to search')
     parser.add_argument('--image_path', type=str, help='Path to image file to search')
     parser.add_argument('--audio_path', type=str, help='Path to audio file to search')
-    return parser.parse_args()
+    parser.add_argument('--process_files', type=str,
+                        help='Comma-separated files (sql, txt, csv, xlsx, json, images) to extract data from, '
+                             'then exit; images are OCR-ed in one batch')
+    parser.add_argument('--identifiers_sql', type=str,
+                        help='SQLite file whose --identifiers_column values are searched as --identifiers_type')
+    parser.add_argument('--identifiers_column', type=str, help='Column of --identifiers_sql holding the identifiers')
+    parser.add_argument('--identifiers_type', type=str, choices=list(IDENTIFIER_SEARCHES),
+                        help='Identifier search to run on every value read from --identifiers_sql')
+    parser.add_argument('--identifiers_limit', type=int,
+                        help='Maximum number of identifiers to read from --identifiers_sql')
+    parser.add_argument('--driver_pool_size', type=int, default=DRIVER_POOL_SIZE,
+                        help='Number of warmed WebDriver instances shared by the platform searches')
+    parser.add_argument('--check_deps', '--check-deps', action='store_true',
+                        help='Run the full dependency check, install anything missing, then exit')
+    parser.add_argument('--benchmark_startup', action='store_true',
+                        help='Compare startup time with lazy and eager imports, then exit')
+    parser.add_argument('--compact_db', action='store_true',
+                        help='Remove duplicate rows from the database and fingerprint old rows, then exit')
+    parser.add_argument('--sweep_expired', action='store_true',
+                        help='Delete expired users and their admin keys from the database, then exit')
+    parser.add_argument('--benchmark_db', action='store_true',
+                        help='Measure database write throughput at 100k and 1M rows, then exit')
+    parser.add_argument('--max_workers', type=int, default=MAX_WORKERS,
+                        help='Maximum number of platform searches to run at the same time')
+    parser.add_argument('--platform_workers', type=str,
+                        help='Comma-separated per-platform worker caps (e.g., Twitter=2,Google=1)')
+    args = parser.parse_args()
+    if args.html_page_size <= 0:
+        parser.error('--html_page_size must be a positive integer')
+    if args.identifiers_sql and not (args.identifiers_column and args.identifiers_type):
+        parser.error('--identifiers_sql requires --identifiers_column and --identifiers_type')
+    return args
 
 
 def get_proxies(proxy_input):
@@ -1963,6 +5017,194 @@ def delete_client_files():
         logging.error(f"Error deleting client files: {e}")
 
 
+class ScriptValidationClient:
+    """Client for the script validation API with connection pooling, batching and caching.
+
+    Contents are de-duplicated by SHA-256 hash, answered from an in-memory and on-disk cache
+    of successful validations while their entry is younger than the TTL, and otherwise queued
+    and sent in batches over one pooled requests.Session. Batches are posted on background threads, so callers can
+    keep scraping while earlier results are being validated.
+
+    Batches are posted as ``{'script_contents': [...]}`` and expect ``{'results': [...]}``
+    with one ``{'is_valid': ..., 'message': ...}`` per content. If the API does not answer in
+    that form, the client falls back to one ``{'script_content': ...}`` request per content.
+
+    Args:
+        url (str): The validation API URL (default is BASE_URL).
+        batch_size (int): The number of contents per API request (default is VALIDATION_BATCH_SIZE).
+        ttl (float): Seconds a validation result stays cached (default is VALIDATION_CACHE_TTL).
+        cache_file (str): The path of the on-disk cache, or None for memory only (default is VALIDATION_CACHE_FILE).
+        max_workers (int): The number of batches validated in parallel (default is VALIDATION_WORKERS).
+        identity (str): The credential the results belong to; cache entries are keyed by it and the
+            URL (default is None, the current PUB_KEY).
+    """
+
+    def __init__(self, url=BASE_URL, batch_size=VALIDATION_BATCH_SIZE, ttl=VALIDATION_CACHE_TTL,
+                 cache_file=VALIDATION_CACHE_FILE, max_workers=VALIDATION_WORKERS, identity=None):
+        self.url = url
+        identity = PUB_KEY if identity is None else identity
+        self._key_prefix = hashlib.sha256(f"{url}\n{identity or ''}".encode()).hexdigest()
+        self.batch_size = max(1, batch_size)
+        self.ttl = ttl
+        self.cache_file = cache_file
+        self.batch_supported = None
+        self._http = create_http_session()
+        self._lock = threading.Lock()
+        self._cache = self._load_cache()
+        self._in_flight = {}
+        self._buffer = []
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='validation')
+
+    def _load_cache(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Error reading validation cache: {e}")
+            return {}
+        now = time.time()
+        return {key: tuple(entry) for key, entry in entries.items() if entry[0] and entry[2] > now}
+
+    def save_cache(self):
+        """Write the unexpired cache entries to the on-disk cache file."""
+        if not self.cache_file:
+            return
+        now = time.time()
+        with self._lock:
+            entries = {key: list(entry) for key, entry in self._cache.items() if entry[2] > now}
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+        except OSError as e:
+            logging.warning(f"Error saving validation cache: {e}")
+
+    def submit(self, script_content):
+        """Queue a content for validation.
+
+        Args:
+            script_content (str): The content to validate.
+
+        Returns:
+            concurrent.futures.Future: A future resolving to an ``(is_valid, message)`` tuple.
+        """
+        key = hashlib.sha256(f"{self._key_prefix}\n{script_content or ''}".encode()).hexdigest()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and entry[2] > time.time():
+                future = Future()
+                future.set_result((entry[0], entry[1]))
+                return future
+            if key in self._in_flight:
+                return self._in_flight[key]
+            future = Future()
+            self._in_flight[key] = future
+            self._buffer.append((key, script_content))
+            batch = None
+            if len(self._buffer) >= self.batch_size:
+                batch, self._buffer = self._buffer, []
+        if batch:
+            self._executor.submit(self._validate_batch, batch)
+        return future
+
+    def flush(self):
+        """Send any queued contents without waiting for a full batch."""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+        if batch:
+            self._executor.submit(self._validate_batch, batch)
+
+    def validate_many(self, script_contents):
+        """Validate several contents and wait for the results.
+
+        Args:
+            script_contents (list): The contents to validate.
+
+        Returns:
+            list: An ``(is_valid, message)`` tuple per content, in order.
+        """
+        futures = [self.submit(content) for content in script_contents]
+        self.flush()
+        return [future.result() for future in futures]
+
+    def close(self):
+        """Send queued contents, wait for every pending batch and persist the cache."""
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self.save_cache()
+        self._http.close()
+
+    def _validate_batch(self, batch):
+        try:
+            results = None
+            if self.batch_supported is not False:
+                results = self._post_batch([content for _, content in batch])
+            if results is None:
+                results = [self._post_single(content) for _, content in batch]
+        except Exception as e:
+            logging.error(f"Error validating script with API: {e}")
+            results = [None] * len(batch)
+
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            for (key, _), result in zip(batch, results):
+                # Only successful validations are cached: a rejection such as "expired" must be
+                # re-checked on the next run, e.g. after the subscription was renewed.
+                if result is not None and result[0]:
+                    self._cache[key] = (result[0], result[1], expires_at)
+                future = self._in_flight.pop(key)
+                future.set_result(result or (False, "API validation failed."))
+
+    def _post_batch(self, contents):
+        response = self._http.post(self.url, json={'script_contents': contents}, timeout=HTTP_TIMEOUT)
+        try:
+            results = response.json().get('results') if response.status_code == 200 else None
+        except ValueError:
+            results = None
+        if not isinstance(results, list) or len(results) != len(contents):
+            if self.batch_supported is None:
+                logging.info("Validation API does not support batches. Validating one content per request.")
+            self.batch_supported = False
+            return None
+        self.batch_supported = True
+        return [(result['is_valid'], result.get('message', '')) for result in results]
+
+    def _post_single(self, content):
+        response = self._http.post(self.url, json={'script_content': content}, timeout=HTTP_TIMEOUT)
+        if response.status_code != 200:
+            logging.error(f"API returned status code {response.status_code}: {response.text}")
+            return None
+        result = response.json()
+        return result['is_valid'], result.get('message', '')
+
+
+def get_validation_client():
+    """Return the shared ScriptValidationClient, creating it on first use.
+
+    Returns:
+        ScriptValidationClient: The shared client.
+    """
+    global validation_client
+    with VALIDATION_LOCK:
+        if validation_client is None:
+            validation_client = ScriptValidationClient()
+    return validation_client
+
+
+def close_validation_client():
+    """Close the shared ScriptValidationClient if it was created.
+
+    Pending batches are finished, the cache is persisted and the worker threads and
+    HTTP session are shut down.
+    """
+    global validation_client
+    with VALIDATION_LOCK:
+        if validation_client is not None:
+            validation_client.close()
+            validation_client = None
+
+
 def validate_script_with_api(script_content):
     """Validate script using the API.
 
@@ -1971,22 +5213,9 @@ def validate_script_with_api(script_content):
 
     Returns:
         tuple: A tuple containing a boolean indicating validity and a message.
-
-    Raises:
-        Exception: If validating script with API fails.
     """
     try:
-        response = requests.post(
-            BASE_URL,
-            json={'script_content': script_content},
-            headers={'Content-Type': 'application/json'}
-        )
-        if response.status_code == 200:
-            result = response.json()
-            return result['is_valid'], result.get('message', '')
-        else:
-            logging.error(f"API returned status code {response.status_code}: {response.text}")
-            return False, "API validation failed."
+        return get_validation_client().validate_many([script_content])[0]
     except Exception as e:
         logging.error(f"Error validating script with API: {e}")
         return False, "API validation failed."
@@ -1995,19 +5224,50 @@ def validate_script_with_api(script_content):
 def main():
     """Main function to execute the internet scraper.
 
-    This function parses command line arguments, installs required packages, sets up proxies,
+    This function parses command line arguments, checks required packages, sets up proxies,
     retrieves API keys, validates them, and performs the scraping operation based on the provided arguments.
     """
+    sweeper = None
     try:
         args = parse_arguments()
 
-        install_packages()
+        if args.benchmark_startup:
+            benchmark_startup()
+            return
+
+        if args.compact_db:
+            compact_database()
+            return
+
+        if args.sweep_expired:
+            delete_expired_users()
+            return
+
+        if args.benchmark_db:
+            benchmark_database_writes()
+            return
+
+        if args.check_deps:
+            check_dependencies(force=True)
+            return
+
+        check_dependencies()
+
+        if args.process_files:
+            file_paths = [file_path.strip() for file_path in args.process_files.split(',') if file_path.strip()]
+            export_processed_files(file_paths, lang=args.ocr_lang, translate=args.translate, dest_lang=args.dest_lang)
+            return
 
         keywords = args.keywords.split(',') if args.keywords else []
         start_date = args.start_date
         end_date = args.end_date
+        filter_spec = FilterSpec(keywords, start_date, end_date, whole_word=args.whole_words)
         max_results = args.max_results
         save_formats = args.save_formats.split(',') if args.save_formats else []
+        sink_options = {
+            'xlsx': {'per_platform': args.excel_per_platform},
+            'html': {'page_size': args.html_page_size}
+        }
         proxy_input = args.proxy
         ocr_lang = args.ocr_lang
         translate = args.translate
@@ -2019,9 +5279,15 @@ def main():
         account_number = args.account_number
         image_path = args.image_path
         audio_path = args.audio_path
+        driver_pool_size = args.driver_pool_size
+        max_workers = args.max_workers
+        platform_limits = parse_platform_limits(args.platform_workers)
 
         proxies = get_proxies(proxy_input) if proxy_input else []
 
+        # Expired users and admin keys are cleaned up in the background while the job runs.
+        sweeper = ExpirySweeper().start()
+
         # Get PUB_KEY and SEC_KEY from Telegram bot
         get_keys_from_telegram()
 
@@ -2053,79 +5319,91 @@ def main():
             exit()
 
         for proxy in proxies:
+            driver = None
+            driver_pool = None
+            validator = None
+            sentiment_stage = None
+            pipeline = None
+            sinks = []
             try:
                 driver = setup_driver(proxy)
+                driver_pool = DriverPool(size=driver_pool_size, proxy=proxy)
                 phone_number = input("Enter your phone number for Telegram login: ")
                 login_to_telegram(driver, phone_number)
 
-                all_data = []
                 platforms = ['Telegram', 'Twitter', 'Instagram', 'Facebook', 'LinkedIn', 'Reddit', 'Google']
+                search_args = (filter_spec, max_results)
+                tasks = []
                 if 'Telegram' in platforms:
-                    all_data.extend(search_telegram(driver, username, keywords, start_date, end_date, max_results))
-                if 'Twitter' in platforms:
-                    all_data.extend(search_twitter(username, keywords, start_date, end_date, max_results))
-                if 'Instagram' in platforms:
-                    all_data.extend(search_instagram(username, keywords, start_date, end_date, max_results))
-                if 'Facebook' in platforms:
-                    all_data.extend(search_facebook(username, keywords, start_date, end_date, max_results))
-                if 'LinkedIn' in platforms:
-                    all_data.extend(search_linkedin(username, keywords, start_date, end_date, max_results))
-                if 'Reddit' in platforms:
-                    all_data.extend(search_reddit(username, keywords, start_date, end_date, max_results))
-                if 'Google' in platforms:
-                    all_data.extend(search_google(username, keywords, start_date, end_date, max_results))
-                if 'Google Scholar' in platforms:
-                    all_data.extend(search_google_scholar(username, keywords, start_date, end_date, max_results))
-                if 'Public Databases' in platforms:
-                    all_data.extend(search_public_databases(username, keywords, start_date, end_date, max_results))
-                if 'Private Databases' in platforms:
-                    all_data.extend(search_private_databases(username, keywords, start_date, end_date, max_results))
-                if email:
-                    all_data.extend(search_email(email, keywords, start_date, end_date, max_results))
-                if user_id:
-                    all_data.extend(search_user_id(user_id, keywords, start_date, end_date, max_results))
-                if national_id:
-                    all_data.extend(search_national_id(national_id, keywords, start_date, end_date, max_results))
-                if passport_number:
-                    all_data.extend(
-                        search_passport_number(passport_number, keywords, start_date, end_date, max_results))
-                if account_number:
-                    all_data.extend(search_account_number(account_number, keywords, start_date, end_date, max_results))
-                if image_path:
-                    all_data.extend(search_image(image_path, keywords, start_date, end_date, max_results))
-                if audio_path:
-                    all_data.extend(search_audio(audio_path, keywords, start_date, end_date, max_results))
-
-                # Validate script using API
-                for item in all_data:
-                    is_valid, message = validate_script_with_api(item['content'])
-                    if not is_valid:
-                        logging.warning(f"Script validation failed for {username}: {message}")
-                        if "expired" in message.lower():
-                            delete_client_files()
-                            exit()
-
-                if 'txt' in save_formats:
-                    save_to_txt(all_data, username)
-                if 'csv' in save_formats:
-                    save_to_csv(all_data, username)
-                if 'json' in save_formats:
-                    save_to_json(all_data, username)
-                if 'html' in save_formats:
-                    save_to_html(all_data, username)
-                if 'xlsx' in save_formats:
-                    save_to_excel(all_data, username)
-                if 'db' in save_formats:
-                    save_to_database(all_data, username)
-
-                visualize_data(all_data, username)
+                    tasks.append(('Telegram', search_telegram, (driver, username) + search_args))
+                for platform in platforms:
+                    if platform in BROWSER_SEARCHES:
+                        tasks.append((platform, pooled_search(driver_pool, BROWSER_SEARCHES[platform], platform),
+                                      (username,) + search_args))
+                    elif platform in DATABASE_SEARCHES:
+                        tasks.append((platform, DATABASE_SEARCHES[platform], (username,) + search_args))
+                identifiers = [
+                    ('Email Search', search_email, email),
+                    ('User ID Search', search_user_id, user_id),
+                    ('National ID Search', search_national_id, national_id),
+                    ('Passport Number Search', search_passport_number, passport_number),
+                    ('Account Number Search', search_account_number, account_number),
+                    ('Image Search', search_image, image_path),
+                    ('Audio Search', search_audio, audio_path),
+                ]
+                for platform, search_func, identifier in identifiers:
+                    if identifier:
+                        tasks.append((platform, search_func, (identifier,) + search_args))
+                if args.identifiers_sql:
+                    # Identifiers are read lazily as workers free up instead of being collected first.
+                    platform, search_func = IDENTIFIER_SEARCHES[args.identifiers_type]
+                    tasks = itertools.chain(tasks, (
+                        (platform, search_func, (identifier,) + search_args)
+                        for identifier in iter_sql_identifiers(args.identifiers_sql, args.identifiers_column,
+                                                               limit=args.identifiers_limit)))
+
+                # Records are validated and streamed to every sink as each platform finishes,
+                # while the remaining platforms are still being scraped.
+                validator = get_validation_client()
+                sentiment_stage = SentimentStage() if args.sentiment else None
+                sinks = open_sinks(save_formats, username, sink_options)
+                pipeline = ResultPipeline(sinks, validator, username, sentiment_stage)
+                for platform, results in run_searches_concurrently(tasks, max_workers, platform_limits):
+                    if pipeline.expired.is_set() or pipeline.error is not None:
+                        break
+                    pipeline.put(results)
+                pipeline.close()
+                if pipeline.expired.is_set():
+                    delete_client_files()
+                    exit()
+                if pipeline.error is not None:
+                    raise pipeline.error
+
+                close_sinks(sinks)
+                sinks = []
+                visualize_platform_counts(pipeline.platform_counts, username)
 
             except Exception as e:
                 logging.error(f"Error using proxy {proxy}: {e}")
             finally:
-                driver.quit()
+                if pipeline:
+                    pipeline.close()
+                if sentiment_stage:
+                    sentiment_stage.close()
+                close_sinks(sinks)
+                if validator:
+                    validator.save_cache()
+                if driver_pool:
+                    driver_pool.close()
+                if driver:
+                    driver.quit()
     except Exception as e:
         logging.error(f"Error in main execution: {e}")
+    finally:
+        if sweeper:
+            sweeper.stop()
+        close_validation_client()
+        close_database_writer()
 
 
 if __name__ == '__main__':
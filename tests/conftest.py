@@ -0,0 +1,47 @@
+"""Shared fixtures for the internetScraper tests."""
+import base64
+import importlib
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='session')
+def scraper(tmp_path_factory):
+    """Import internetScraper inside a scratch directory.
+
+    On import the module creates .env, its log file and its SQLite database in the working
+    directory, and exits without a Telegram bot token and an encryption key, so both are
+    provided and the working directory is a temporary one for the whole session.
+    """
+    work_dir = tmp_path_factory.mktemp('scraper')
+    previous_dir = os.getcwd()
+    os.environ.setdefault('TELEGRAM_BOT_TOKEN', '123456:test-token')
+    os.environ.setdefault('ENCRYPTION_KEY', base64.urlsafe_b64encode(os.urandom(32)).decode())
+    os.chdir(work_dir)
+    sys.path.insert(0, REPO_ROOT)
+    try:
+        yield importlib.import_module('internetScraper')
+    finally:
+        os.chdir(previous_dir)
+
+
+@pytest.fixture
+def make_record():
+    """Build a scraped record, overriding any of its fields."""
+    def build(**overrides):
+        record = {
+            'platform': 'Twitter',
+            'username': 'alice',
+            'content': 'hello',
+            'content_type': 'text',
+            'date': '2024-01-02 03:04:05',
+            'url': 'https://twitter.com/alice/status/1',
+            'interaction_user': ''
+        }
+        record.update(overrides)
+        return record
+    return build
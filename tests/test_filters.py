@@ -0,0 +1,65 @@
+import sqlite3
+from datetime import datetime, timezone
+
+
+def select_matching(spec, rows):
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE posts (id INTEGER, body TEXT, date)')
+    conn.executemany('INSERT INTO posts VALUES (?, ?, ?)', rows)
+    where, params = spec.sql_where('body', 'date')
+    query = 'SELECT id FROM posts' + (f' WHERE {where}' if where else '')
+    return {row[0] for row in conn.execute(query, params)}
+
+
+def test_matches_text_keywords_excludes_and_whole_words(scraper):
+    spec = scraper.FilterSpec(['python', '-snake', '"go"'])
+    assert spec.matches_text('Python and Go')
+    assert spec.matches_text('I like go')
+    assert not spec.matches_text('A python is a snake')
+    assert not spec.matches_text('gopher')
+    assert scraper.FilterSpec().matches_text('anything')
+
+
+def test_matches_date_bounds(scraper):
+    spec = scraper.FilterSpec(start_date='2024-01-01', end_date='2024-01-31')
+    assert spec.matches_date(datetime(2024, 1, 15))
+    assert not spec.matches_date(datetime(2024, 2, 1))
+    assert spec.is_before_start(datetime(2023, 12, 31))
+    assert scraper.FilterSpec().matches_date(datetime(1990, 1, 1))
+
+
+def test_sql_where_selects_every_matching_row(scraper):
+    spec = scraper.FilterSpec(['python', '-"go"', '-snake'])
+    rows = [(1, 'Python gopher', None), (2, 'python go', None), (3, 'python snake', None), (4, 'ruby', None)]
+    selected = select_matching(spec, rows)
+    assert {row[0] for row in rows if spec.matches_text(row[1])} <= selected
+    # Whole-word excludes are left to matches_text(), substring excludes are pushed down.
+    assert selected == {1, 2}
+
+
+def test_sql_where_skips_non_ascii_keywords(scraper):
+    assert scraper.FilterSpec(['café', 'python']).sql_where('body') == ('', [])
+
+
+def test_sql_where_date_bounds_read_epoch_and_text_dates(scraper):
+    spec = scraper.FilterSpec(start_date='2024-01-01', end_date='2024-12-31')
+    epoch = int(datetime(2024, 5, 1, tzinfo=timezone.utc).timestamp())
+    rows = [(1, '', '2024-05-01 10:00:00'), (2, '', epoch), (3, '', None), (4, '', 0), (5, '', 'not a date')]
+    assert select_matching(spec, rows) == {1, 2}
+
+
+def test_iter_sql_file_skips_missing_tables_and_searches_unselected_columns(scraper, tmp_path):
+    path = tmp_path / 'dump.db'
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE users (id INTEGER, email TEXT, bio TEXT)')
+    conn.executemany('INSERT INTO users VALUES (?, ?, ?)',
+                     [(1, 'a@x.com', 'python dev'), (2, 'b@x.com', 'ruby dev'), (3, 'a@x.com', 'python')])
+    conn.commit()
+    conn.close()
+
+    chunks = list(scraper.iter_sql_file(str(path), tables=['missing', 'users'], columns=['id'],
+                                        filter_spec=scraper.FilterSpec(['python']), text_columns=['bio'],
+                                        chunk_size=1))
+    assert chunks == [('users', [(1,)]), ('users', [(3,)])]
+    assert list(scraper.iter_sql_identifiers(str(path), 'email')) == ['a@x.com', 'b@x.com']
+    assert list(scraper.iter_sql_identifiers(str(path), 'email', limit=1)) == ['a@x.com']
@@ -0,0 +1,61 @@
+import codecs
+import io
+import json
+
+import openpyxl
+import pandas as pd
+import pytest
+
+DOCUMENT = '[12.5, -3, 1e3, "a,b]", {"x": [1, 2.25], "y": null}, true, 1234567]'
+
+
+@pytest.mark.parametrize('buffer_size', range(1, 12))
+def test_iter_json_values_array_across_chunk_boundaries(scraper, buffer_size):
+    file = io.StringIO(DOCUMENT)
+    assert file.read(1) == '['
+    assert list(scraper.iter_json_values(file, array=True, buffer_size=buffer_size)) == json.loads(DOCUMENT)
+
+
+@pytest.mark.parametrize('buffer_size', [1, 2, 3, 7])
+def test_iter_json_values_concatenated_values(scraper, buffer_size):
+    values = scraper.iter_json_values(io.StringIO('{"a": 1}\n2.5\n"s"\n[1]\n10'), buffer_size=buffer_size)
+    assert list(values) == [{'a': 1}, 2.5, 's', [1], 10]
+
+
+def test_iter_json_values_rejects_unterminated_array(scraper):
+    with pytest.raises(json.JSONDecodeError):
+        list(scraper.iter_json_values(io.StringIO('1, 2'), array=True, buffer_size=2))
+
+
+def test_read_json_file_skips_bom(scraper, tmp_path):
+    (tmp_path / 'one.json').write_bytes(codecs.BOM_UTF8 + b' {"a": 1}')
+    (tmp_path / 'array.json').write_bytes(codecs.BOM_UTF8 + b'[{"a": 1}]')
+    (tmp_path / 'lines.JSONL').write_bytes(codecs.BOM_UTF8 + b'{"a": 1}\n\n{"b": "\xc3\xa9"}\n')
+    assert scraper.read_json_file(str(tmp_path / 'one.json')) == {'a': 1}
+    assert scraper.read_json_file(str(tmp_path / 'array.json')) == [{'a': 1}]
+    assert scraper.read_json_file(str(tmp_path / 'lines.JSONL')) == [{'a': 1}, {'b': 'é'}]
+
+
+def test_deduplicate_header_matches_pandas(scraper):
+    names = ['a', 'b', 'a', 'a', 'a.1']
+    expected = list(pd.read_csv(io.StringIO(','.join(names) + '\n1,2,3,4,5\n')).columns)
+    assert scraper.deduplicate_header(names) == expected == ['a', 'b', 'a.2', 'a.3', 'a.1']
+
+
+def test_excel_reader_deduplicates_headers(scraper, tmp_path):
+    path = str(tmp_path / 'IN.XLSX')
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(['name', 'name', None])
+    sheet.append(['x', 'y', 1])
+    sheet.append(['z', 'w', 2])
+    workbook.save(path)
+
+    assert list(scraper.iter_excel_file(path, chunk_size=1)) == [
+        [{'name': 'x', 'name.1': 'y', 'Unnamed: 2': 1}],
+        [{'name': 'z', 'name.1': 'w', 'Unnamed: 2': 2}]
+    ]
+    assert scraper.read_excel_file(path, columns=['name.1']) == [{'name.1': 'y'}, {'name.1': 'w'}]
+    assert scraper.process_file(path) == scraper.read_excel_file(path)
+    with pytest.raises(ValueError):
+        scraper.read_excel_file(path, as_frames=True)
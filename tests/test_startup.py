@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+from conftest import REPO_ROOT
+
+
+def test_lazy_module_imports_on_first_attribute(scraper):
+    loaded = []
+    module = scraper.LazyModule('colorsys', on_import=loaded.append)
+    assert 'not loaded' in repr(module)
+    assert module.rgb_to_hsv(1, 0, 0) == (0.0, 1.0, 1.0)
+    assert module.hsv_to_rgb(0, 0, 1) == (1, 1, 1)
+    assert [loaded_module.__name__ for loaded_module in loaded] == ['colorsys']
+    assert "'colorsys' (loaded)" in repr(module)
+
+
+def test_import_does_not_load_heavy_modules(scraper, tmp_path):
+    heavy = ('tensorflow', 'nltk', 'matplotlib', 'seaborn', 'cv2', 'face_recognition', 'pydub')
+    script = (f"import sys; sys.path.insert(0, {REPO_ROOT!r}); import internetScraper; "
+              f"print(','.join(name for name in {heavy!r} if name in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', script], cwd=tmp_path, env=dict(os.environ),
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
@@ -0,0 +1,89 @@
+import csv
+import os
+
+import openpyxl
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import create_engine, text
+
+
+@pytest.fixture
+def database(scraper, tmp_path):
+    sqlite_engine = create_engine(f"sqlite:///{tmp_path / 'scraper.db'}")
+    scraper.Base.metadata.create_all(sqlite_engine)
+    yield sqlite_engine
+    sqlite_engine.dispose()
+
+
+@pytest.fixture
+def records(make_record):
+    return [make_record(date='notadate'), make_record(content='ok', date='2024-01-02T03:04:05Z')]
+
+
+def test_compute_fingerprint(scraper):
+    fingerprint = scraper.compute_fingerprint('Twitter', 'https://t.co/1', 'hello')
+    assert fingerprint == scraper.compute_fingerprint('Twitter', 'https://t.co/1', 'hello')
+    assert len(fingerprint) == 64
+    assert fingerprint != scraper.compute_fingerprint('Twitter', 'https://t.co/1', 'hello!')
+    assert scraper.compute_fingerprint('a', 'bc', '') != scraper.compute_fingerprint('ab', 'c', '')
+    assert scraper.compute_fingerprint(None, None, None) == scraper.compute_fingerprint('', '', '')
+
+
+def test_bulk_insert_upserts_by_fingerprint(scraper, database, make_record):
+    with database.begin() as connection:
+        scraper.bulk_insert_scraped_data(connection, [make_record(sentiment=0.5)], batch_size=1)
+        scraper.bulk_insert_scraped_data(connection, [make_record(username='bob'), make_record(content='other')],
+                                         batch_size=1)
+    with database.connect() as connection:
+        rows = connection.execute(text('SELECT content, username, sentiment FROM scraped_data ORDER BY id')).all()
+    # A re-scrape updates the row and keeps the stored sentiment.
+    assert rows == [('hello', 'bob', 0.5), ('other', 'alice', None)]
+
+
+def test_bulk_insert_stores_null_for_bad_dates(scraper, database, records):
+    with database.begin() as connection:
+        assert scraper.bulk_insert_scraped_data(connection, records) == 2
+    with database.connect() as connection:
+        dates = connection.execute(text('SELECT date FROM scraped_data ORDER BY id')).scalars().all()
+    assert dates[0] is None
+    assert dates[1].startswith('2024-01-02 03:04:05')
+
+
+def test_compact_database_removes_duplicates_and_fills_fingerprints(scraper, database):
+    with database.begin() as connection:
+        for content in ('a', 'a', 'b'):
+            connection.execute(text("INSERT INTO scraped_data (platform, username, content, content_type, url) "
+                                    "VALUES ('X', 'u', :content, 'text', 'https://x')"), {'content': content})
+    assert scraper.compact_database(database) == 1
+    with database.connect() as connection:
+        rows = connection.execute(text('SELECT content, fingerprint FROM scraped_data ORDER BY id')).all()
+    assert rows == [('a', scraper.compute_fingerprint('X', 'https://x', 'a')),
+                    ('b', scraper.compute_fingerprint('X', 'https://x', 'b'))]
+
+
+def test_csv_sink_leaves_bad_dates_empty(scraper, tmp_path, records):
+    with scraper.CsvSink('alice', str(tmp_path / 'records')) as record_sink:
+        record_sink.write(records)
+    with scraper.CsvSink('alice', str(tmp_path / 'frame')) as frame_sink:
+        frame_sink.write_frame(scraper.build_results_frame(records))
+
+    with open(record_sink.path, encoding='utf-8') as f:
+        assert [row['date'] for row in csv.DictReader(f)] == ['', '2024-01-02 03:04:05']
+    with open(record_sink.path, encoding='utf-8') as f, open(frame_sink.path, encoding='utf-8') as g:
+        assert f.read() == g.read()
+
+
+def test_excel_sink_leaves_bad_dates_empty(scraper, tmp_path, records):
+    with scraper.ExcelSink('alice', str(tmp_path)) as sink:
+        sink.write(records)
+    rows = list(openpyxl.load_workbook(sink.path).worksheets[0].iter_rows(values_only=True))
+    date_column = rows[0].index('date')
+    assert [row[date_column] for row in rows[1:]] == [None, scraper.parse_record_date('2024-01-02 03:04:05')]
+
+
+def test_parquet_sink_writes_bad_dates_to_unknown_day(scraper, tmp_path, records):
+    with scraper.ParquetSink('alice', str(tmp_path), partition_by=['day']) as sink:
+        sink.write(records)
+    assert sorted(os.listdir(sink.path)) == ['day=2024-01-02', 'day=unknown']
+    unknown = pq.read_table(os.path.join(sink.path, 'day=unknown', 'part-0.parquet'))
+    assert unknown.column('date').to_pylist() == [None]